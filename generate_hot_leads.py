@@ -15,11 +15,17 @@ Usage:
 import argparse
 import csv
 import html
+import json
 import os
 import sqlite3
 import sys
+from bisect import bisect_right
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
+from string import Template
 
 # Default database path
 DEFAULT_DB = "/Users/rome/Documents/projects/scrapers/master/data/jobs.db"
@@ -41,6 +47,10 @@ SENIORITY_RANK = {
 # Signals that qualify a job as a "hot lead"
 HOT_HIRING_SIGNALS = {"growth_hire", "build_team"}
 HOT_TEAM_SIGNALS = {"reports_ceo", "reports_cro", "first_hire", "build_team"}
+HOT_ALL_SIGNALS = frozenset(HOT_HIRING_SIGNALS | HOT_TEAM_SIGNALS)
+
+# Hiring signals shown as a lead's primary hiring signal
+DISPLAY_HIRING_SIGNALS = frozenset({"growth_hire", "turnaround", "immediate"})
 
 # Scoring weights
 SCORE_BASE = 10
@@ -69,6 +79,58 @@ SCORE_SALARY_THRESHOLDS = [
     (150000, 4),
     (100000, 2),
 ]
+# Ascending views of SCORE_SALARY_THRESHOLDS for bisect lookups
+_SALARY_STEPS = [threshold for threshold, _ in reversed(SCORE_SALARY_THRESHOLDS)]
+_SALARY_BONUSES = [bonus for _, bonus in reversed(SCORE_SALARY_THRESHOLDS)]
+SCORE_MULTI_SIGNAL_MIN = 3
+SCORE_MULTI_SIGNAL_BONUS = 5
+SCORE_GROWTH_STAGE_BONUS = 2
+
+
+def _sql_in_list(values) -> str:
+    """Render constant strings as a SQL IN (...) list body."""
+    return ", ".join(f"'{v}'" for v in sorted(values))
+
+
+# SQL mirror of score_lead(), computed per job inside the hot lead query so
+# SQLite scores and orders leads during the scan. Built once from the
+# scoring constants above; keep the two in sync.
+_SALARY_SQL = "COALESCE(NULLIF(j.annual_salary_max, 0), NULLIF(j.annual_salary_min, 0), 0)"
+SCORE_SQL_CTE = "signal_weights(signal_id, bonus) AS (VALUES {})".format(
+    ", ".join(f"('{sid}', {bonus})" for sid, bonus in SCORE_SIGNAL_BONUS.items())
+)
+SCORE_SQL = " + ".join([
+    str(SCORE_BASE),
+    "CASE j.seniority_tier {} ELSE 0 END".format(
+        " ".join(f"WHEN '{tier}' THEN {bonus}" for tier, bonus in SCORE_SENIORITY_BONUS.items())
+    ),
+    # Each unique qualifying signal counts once
+    "(SELECT COALESCE(SUM(w.bonus), 0) FROM signal_weights w"
+    " WHERE EXISTS (SELECT 1 FROM job_signals s"
+    " WHERE s.job_id = j.id AND s.signal_id = w.signal_id))",
+    "CASE WHEN (SELECT COUNT(*) FROM job_signals s WHERE s.job_id = j.id"
+    f" AND s.signal_id IN ({_sql_in_list(HOT_ALL_SIGNALS)}))"
+    f" >= {SCORE_MULTI_SIGNAL_MIN} THEN {SCORE_MULTI_SIGNAL_BONUS} ELSE 0 END",
+    "CASE {} ELSE 0 END".format(
+        " ".join(f"WHEN {_SALARY_SQL} >= {threshold} THEN {bonus}"
+                 for threshold, bonus in SCORE_SALARY_THRESHOLDS)
+    ),
+    "CASE WHEN LOWER(j.company_stage) LIKE '%series%'"
+    f" OR LOWER(j.company_stage) LIKE '%growth%' THEN {SCORE_GROWTH_STAGE_BONUS} ELSE 0 END",
+])
+
+# Indexes backing the hot lead query and its signal/tool enrichment.
+# Created on first run if missing (the scraper owns the schema).
+HOT_LEAD_INDEXES = [
+    ("idx_jobs_hot", "jobs(seniority_tier, has_salary, date_posted DESC)"),
+    ("idx_js_type_id_job", "job_signals(signal_type, signal_id, job_id)"),
+    ("idx_js_job", "job_signals(job_id)"),
+    ("idx_jt_job", "job_tools(job_id)"),
+]
+
+# Plain-text email section rules
+TEXT_RULE = "=" * 60
+TEXT_THIN_RULE = "-" * 60
 
 
 def get_seniority_tiers_at_or_above(min_seniority: str) -> list[str]:
@@ -77,72 +139,147 @@ def get_seniority_tiers_at_or_above(min_seniority: str) -> list[str]:
     return [tier for tier, rank in SENIORITY_RANK.items() if rank >= min_rank]
 
 
-def fetch_hot_leads(db_path: str, days: int, min_seniority: str) -> list[dict]:
-    """Query the database for hot lead jobs."""
-    tiers = get_seniority_tiers_at_or_above(min_seniority)
-    if not tiers:
-        print(f"Warning: Unknown seniority tier '{min_seniority}', defaulting to vp+")
-        tiers = get_seniority_tiers_at_or_above("vp")
+# Tier lists and their SQL placeholders for every known minimum, built once
+TIERS_AT_OR_ABOVE = {
+    tier: tuple(get_seniority_tiers_at_or_above(tier)) for tier in SENIORITY_RANK
+}
+TIER_PLACEHOLDERS = {
+    tier: ",".join("?" for _ in tiers) for tier, tiers in TIERS_AT_OR_ABOVE.items()
+}
 
-    placeholders = ",".join("?" for _ in tiers)
-    cutoff_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
 
+def ensure_indexes(db_path: str, indexes=HOT_LEAD_INDEXES):
+    """Create any missing query indexes, then ANALYZE so the planner uses them.
+
+    Does nothing when all indexes already exist. A read-only or locked
+    database is left untouched with a warning; queries still work, just slower.
+    """
     conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    try:
+        existing = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        missing = [(name, target) for name, target in indexes if name not in existing]
+        if not missing:
+            return
+        for name, target in missing:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+        conn.execute("ANALYZE")
+        conn.commit()
+        print(f"Created {len(missing)} index(es): {', '.join(name for name, _ in missing)}")
+    except sqlite3.OperationalError as e:
+        print(f"Warning: could not create indexes ({e}); continuing without them")
+    finally:
+        conn.close()
+
+
+# Read-side tuning for the analytics queries (per connection, not persisted).
+# No query_only: mode=ro already protects the DB file, and query_only would
+# also block the TEMP tables the Monday brief builds.
+READ_PRAGMAS = [
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -262144",    # 256 MiB page cache
+    "PRAGMA mmap_size = 1073741824",  # map up to 1 GiB of the DB file
+]
+
+
+def open_read_connection(db_path: str) -> sqlite3.Connection:
+    """Open a read-only connection tuned for analytic queries."""
+    conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+    for pragma in READ_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def fetch_hot_leads(db_path: str, days: int, min_seniority: str, limit: int = None,
+                    conn: sqlite3.Connection = None) -> list[dict]:
+    """Query the database for hot lead jobs.
+
+    With a limit, only the top N leads by score are fetched and enriched.
+    Pass an open read connection to reuse it; the caller then owns it and
+    is expected to have run ensure_indexes() already.
+    """
+    if min_seniority not in TIERS_AT_OR_ABOVE:
+        print(f"Warning: Unknown seniority tier '{min_seniority}', defaulting to vp+")
+        min_seniority = "vp"
+    tiers = TIERS_AT_OR_ABOVE[min_seniority]
+    placeholders = TIER_PLACEHOLDERS[min_seniority]
+    cutoff_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+    own_conn = conn is None
+    if own_conn:
+        ensure_indexes(db_path)
+        conn = open_read_connection(db_path)
 
     # Find jobs that match hot lead criteria:
     # VP+ seniority, has salary, posted within date range,
-    # AND has at least one hot hiring signal or hot team structure signal
-    query = f"""
-        SELECT DISTINCT j.id, j.title, j.company_name, j.company_name_normalized,
+    # AND has at least one hot hiring signal or hot team structure signal.
+    # Leads come back scored and sorted (best first, newest first on ties).
+    hot_query = f"""
+        SELECT j.id, j.title, j.company_name, j.company_name_normalized,
                j.location_raw, j.location_metro, j.location_state, j.location_type,
                j.is_remote, j.annual_salary_min, j.annual_salary_max,
                j.seniority_tier, j.function_category, j.source_url,
-               j.date_posted, j.description_snippet, j.company_industry,
-               j.company_num_employees, j.company_stage, j.company_url
+               j.date_posted, j.company_industry,
+               j.company_num_employees, j.company_stage, j.company_url,
+               {SCORE_SQL} AS score
         FROM jobs j
-        JOIN job_signals js ON j.id = js.job_id
         WHERE j.seniority_tier IN ({placeholders})
           AND j.has_salary = 1
           AND j.date_posted >= ?
-          AND (
-              (js.signal_type = 'hiring_signals' AND js.signal_id IN ('growth_hire'))
-              OR (js.signal_type = 'team_structure' AND js.signal_id IN ('build_team', 'reports_ceo', 'reports_cro', 'first_hire'))
+          AND EXISTS (
+              SELECT 1 FROM job_signals js
+              WHERE js.job_id = j.id
+                AND (
+                    (js.signal_type = 'hiring_signals' AND js.signal_id IN ('growth_hire'))
+                    OR (js.signal_type = 'team_structure' AND js.signal_id IN ('build_team', 'reports_ceo', 'reports_cro', 'first_hire'))
+                )
           )
-        ORDER BY j.date_posted DESC
+        ORDER BY score DESC, j.date_posted DESC
     """
+    params = [*tiers, cutoff_date]
+    if limit:
+        hot_query += "LIMIT ?"
+        params.append(limit)
 
-    params = tiers + [cutoff_date]
-    jobs = conn.execute(query, params).fetchall()
+    # Each (possibly limited) hot job comes back with its signals and tools
+    # aggregated as JSON arrays, so the whole export is a single query
+    query = f"""
+        WITH {SCORE_SQL_CTE},
+        hot AS ({hot_query})
+        SELECT hot.*,
+               (SELECT json_group_array(json_object(
+                           'signal_type', s.signal_type,
+                           'signal_id', s.signal_id,
+                           'signal_value', s.signal_value))
+                FROM job_signals s WHERE s.job_id = hot.id) AS signals_json,
+               (SELECT json_group_array(json_object(
+                           'tool_name', t.tool_name,
+                           'tool_category', t.tool_category))
+                FROM job_tools t WHERE t.job_id = hot.id) AS tools_json
+        FROM hot
+        ORDER BY hot.score DESC, hot.date_posted DESC
+    """
 
-    # Now enrich each job with all its signals and tools
+    # Build lead dicts straight from plain tuples (no intermediate Row objects)
+    cur = conn.execute(query, params)
+    columns = [c[0] for c in cur.description]
     leads = []
-    for job in jobs:
-        job_id = job["id"]
-        job_dict = dict(job)
-
-        # Fetch all signals for this job
-        signals = conn.execute(
-            "SELECT signal_type, signal_id, signal_value FROM job_signals WHERE job_id = ?",
-            (job_id,),
-        ).fetchall()
-        job_dict["signals"] = [dict(s) for s in signals]
-
-        # Fetch tools
-        tools = conn.execute(
-            "SELECT tool_name, tool_category FROM job_tools WHERE job_id = ?",
-            (job_id,),
-        ).fetchall()
-        job_dict["tools"] = [dict(t) for t in tools]
-
-        leads.append(job_dict)
-
-    conn.close()
+    for row in cur:
+        lead = dict(zip(columns, row))
+        lead["signals"] = json.loads(lead.pop("signals_json"))
+        lead["tools"] = json.loads(lead.pop("tools_json"))
+        leads.append(lead)
+
+    if own_conn:
+        conn.close()
     return leads
 
 
 def score_lead(lead: dict) -> int:
-    """Score a lead based on signal richness, seniority, and salary."""
+    """Score a lead based on signal richness, seniority, and salary.
+
+    fetch_hot_leads() already returns leads scored by SCORE_SQL; use this to
+    re-score a lead after its fields change (e.g. a seniority correction).
+    """
     score = SCORE_BASE
 
     # Seniority bonus
@@ -158,29 +295,34 @@ def score_lead(lead: dict) -> int:
             seen_signals.add(sig_id)
 
     # Multiple growth signals bonus
-    growth_signals = [s for s in lead.get("signals", [])
-                      if s["signal_id"] in HOT_HIRING_SIGNALS | HOT_TEAM_SIGNALS]
-    if len(growth_signals) >= 3:
-        score += 5  # Multi-signal richness bonus
+    growth_signals = sum(1 for s in lead.get("signals", []) if s["signal_id"] in HOT_ALL_SIGNALS)
+    if growth_signals >= SCORE_MULTI_SIGNAL_MIN:
+        score += SCORE_MULTI_SIGNAL_BONUS  # Multi-signal richness bonus
 
     # Salary bonus
     max_salary = lead.get("annual_salary_max") or lead.get("annual_salary_min") or 0
-    for threshold, bonus in SCORE_SALARY_THRESHOLDS:
-        if max_salary >= threshold:
-            score += bonus
-            break
+    step = bisect_right(_SALARY_STEPS, max_salary)
+    if step:
+        score += _SALARY_BONUSES[step - 1]
 
     # Company info bonuses
     if lead.get("company_stage"):
         stage = lead["company_stage"].lower()
         if "series" in stage or "growth" in stage:
-            score += 2
+            score += SCORE_GROWTH_STAGE_BONUS
 
     return score
 
 
+@lru_cache(maxsize=256)
+def pretty_label(raw_id: str) -> str:
+    """Display label for a signal id or seniority tier (growth_hire -> Growth Hire)."""
+    return raw_id.replace("_", " ").title()
+
+
+@lru_cache(maxsize=4096)
 def format_salary(min_sal, max_sal) -> str:
-    """Format salary range as human-readable string."""
+    """Format salary range as human-readable string; memoized per (min, max) pair."""
     def fmt(val):
         if val is None:
             return None
@@ -226,22 +368,21 @@ def format_location(lead: dict) -> str:
     return ", ".join(parts) if parts else "Location not specified"
 
 
-def extract_hiring_signal(lead: dict) -> str:
-    """Get the primary hiring signal for display."""
-    signal_priority = ["growth_hire", "turnaround", "immediate"]
-    for sig in lead.get("signals", []):
-        if sig["signal_type"] == "hiring_signals" and sig["signal_id"] in signal_priority:
-            return sig["signal_id"].replace("_", " ").title()
+def extract_hiring_signal(lead: dict, signals=None) -> str:
+    """Get the primary hiring signal for display (from ``signals`` if given)."""
+    for sig in lead.get("signals", []) if signals is None else signals:
+        if sig["signal_type"] == "hiring_signals" and sig["signal_id"] in DISPLAY_HIRING_SIGNALS:
+            return pretty_label(sig["signal_id"])
     return ""
 
 
-def extract_team_structure(lead: dict) -> str:
-    """Get team structure signals for display."""
+def extract_team_structure(lead: dict, signals=None) -> str:
+    """Get team structure signals for display (from ``signals`` if given)."""
     team_sigs = []
     seen = set()
-    for sig in lead.get("signals", []):
+    for sig in lead.get("signals", []) if signals is None else signals:
         if sig["signal_type"] == "team_structure" and sig["signal_id"] not in seen:
-            team_sigs.append(sig["signal_id"].replace("_", " ").title())
+            team_sigs.append(pretty_label(sig["signal_id"]))
             seen.add(sig["signal_id"])
     return ", ".join(team_sigs)
 
@@ -266,100 +407,137 @@ def extract_extra_signals(lead: dict) -> dict:
     for sig in lead.get("signals", []):
         st, sid = sig["signal_type"], sig["signal_id"]
         if st == "segment":
-            extras.setdefault("segment", []).append(sid.replace("_", " ").title())
+            extras.setdefault("segment", []).append(pretty_label(sid))
         elif st == "deal_size":
-            extras.setdefault("deal_size", []).append(sid.replace("_", " ").title())
+            extras.setdefault("deal_size", []).append(pretty_label(sid))
         elif st == "comp_signals":
-            extras.setdefault("comp", []).append(sid.replace("_", " ").title())
+            extras.setdefault("comp", []).append(pretty_label(sid))
         elif st == "motion":
-            extras.setdefault("motion", []).append(sid.replace("_", " ").title())
+            extras.setdefault("motion", []).append(pretty_label(sid))
     return extras
 
 
+CSV_FIELDNAMES = [
+    "Score", "Title", "Company", "Location", "Seniority",
+    "Salary Range", "Hiring Signal", "Team Structure", "Segment",
+    "Key Tools", "Source URL", "Date Posted",
+]
+
+
+LeadDisplay = namedtuple("LeadDisplay", [
+    "title", "company", "location", "salary", "seniority", "hiring_signal",
+    "team_structure", "segment", "key_tools", "source_url", "date_posted",
+])
+
+
+def derive_display_fields(lead: dict) -> LeadDisplay:
+    """Compute every display field for a lead in one pass over its signals.
+
+    Same results as format_location/format_salary and the extract_* helpers.
+    """
+    hiring_sig = ""
+    team_sigs = []
+    team_seen = set()
+    segments = []
+    for sig in lead.get("signals", []):
+        st, sid = sig["signal_type"], sig["signal_id"]
+        if st == "hiring_signals":
+            if not hiring_sig and sid in DISPLAY_HIRING_SIGNALS:
+                hiring_sig = pretty_label(sid)
+        elif st == "team_structure":
+            if sid not in team_seen:
+                team_sigs.append(pretty_label(sid))
+                team_seen.add(sid)
+        elif st == "segment":
+            segments.append(pretty_label(sid))
+
+    return LeadDisplay(
+        title=lead.get("title") or "Untitled",
+        company=lead.get("company_name") or "Confidential",
+        location=format_location(lead),
+        salary=format_salary(lead.get("annual_salary_min"), lead.get("annual_salary_max")),
+        seniority=pretty_label(lead.get("seniority_tier") or ""),
+        hiring_signal=hiring_sig,
+        team_structure=", ".join(team_sigs),
+        segment=", ".join(segments),
+        key_tools=extract_key_tools(lead),
+        source_url=lead.get("source_url") or "",
+        date_posted=(lead.get("date_posted") or "")[:10],
+    )
+
+
+def lead_display(lead: dict) -> LeadDisplay:
+    """Display fields for a lead, derived on first use and cached on the lead."""
+    display = lead.get("_display")
+    if display is None:
+        display = lead["_display"] = derive_display_fields(lead)
+    return display
+
+
+def _csv_rows(leads: list[dict]):
+    """Yield one CSV row tuple per lead, in CSV_FIELDNAMES order."""
+    for lead in leads:
+        display = lead_display(lead)
+        yield (
+            lead["score"],
+            lead["title"],
+            display.company,
+            display.location,
+            display.seniority,
+            display.salary,
+            display.hiring_signal,
+            display.team_structure,
+            display.segment,
+            display.key_tools,
+            display.source_url,
+            display.date_posted,
+        )
+
+
 def generate_csv(leads: list[dict], output_path: str):
     """Write leads to CSV file."""
-    fieldnames = [
-        "Score", "Title", "Company", "Location", "Seniority",
-        "Salary Range", "Hiring Signal", "Team Structure", "Segment",
-        "Key Tools", "Source URL", "Date Posted",
-    ]
+    with open(output_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(_csv_rows(leads))
 
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for lead in leads:
-            extras = extract_extra_signals(lead)
-            writer.writerow({
-                "Score": lead["score"],
-                "Title": lead["title"],
-                "Company": lead.get("company_name") or "Confidential",
-                "Location": format_location(lead),
-                "Seniority": (lead.get("seniority_tier") or "").replace("_", " ").title(),
-                "Salary Range": format_salary(
-                    lead.get("annual_salary_min"),
-                    lead.get("annual_salary_max"),
-                ),
-                "Hiring Signal": extract_hiring_signal(lead),
-                "Team Structure": extract_team_structure(lead),
-                "Segment": ", ".join(extras.get("segment", [])),
-                "Key Tools": extract_key_tools(lead),
-                "Source URL": lead.get("source_url") or "",
-                "Date Posted": (lead.get("date_posted") or "")[:10],
-            })
-
-
-def generate_html_email(leads: list[dict], days: int) -> str:
-    """Generate the HTML email body for weekly delivery."""
-    now = datetime.now()
-    date_range = f"{(now - timedelta(days=days)).strftime('%b %d')} - {now.strftime('%b %d, %Y')}"
 
-    # Summary stats
-    total = len(leads)
-    avg_score = sum(l["score"] for l in leads) / total if total else 0
+LeadStats = namedtuple(
+    "LeadStats", ["total", "avg_score", "signal_counts", "seniority_counts", "top_signal"]
+)
 
-    # Count signals
+
+def compute_lead_stats(leads: list[dict]) -> LeadStats:
+    """Summary stats shared by the HTML and text emails, in one pass over leads."""
+    score_sum = 0
     signal_counts = {}
+    seniority_counts = {}
     for lead in leads:
+        score_sum += lead["score"]
+        tier = pretty_label(lead.get("seniority_tier") or "unknown")
+        seniority_counts[tier] = seniority_counts.get(tier, 0) + 1
         for sig in lead.get("signals", []):
             if sig["signal_type"] in ("hiring_signals", "team_structure"):
-                label = sig["signal_id"].replace("_", " ").title()
+                label = pretty_label(sig["signal_id"])
                 signal_counts[label] = signal_counts.get(label, 0) + 1
-    top_signal = max(signal_counts, key=signal_counts.get) if signal_counts else "N/A"
 
-    # Seniority breakdown
-    seniority_counts = {}
-    for lead in leads:
-        tier = (lead.get("seniority_tier") or "unknown").replace("_", " ").title()
-        seniority_counts[tier] = seniority_counts.get(tier, 0) + 1
+    total = len(leads)
+    avg_score = score_sum / total if total else 0
+    top_signal = max(signal_counts, key=signal_counts.get) if signal_counts else "N/A"
+    return LeadStats(total, avg_score, signal_counts, seniority_counts, top_signal)
 
-    top5 = leads[:5]
 
-    # Build top 5 HTML cards
-    top5_html = ""
-    for i, lead in enumerate(top5, 1):
-        title = html.escape(lead.get("title") or "Untitled")
-        company = html.escape(lead.get("company_name") or "Confidential")
-        salary = html.escape(format_salary(lead.get("annual_salary_min"), lead.get("annual_salary_max")))
-        location = html.escape(format_location(lead))
-        hiring_sig = html.escape(extract_hiring_signal(lead))
-        team_sig = html.escape(extract_team_structure(lead))
-        source = lead.get("source_url") or "#"
-        score = lead["score"]
-
-        signal_badges = ""
-        if hiring_sig:
-            signal_badges += f'<span style="display:inline-block;background:#e8f5e9;color:#2e7d32;padding:2px 8px;border-radius:3px;font-size:12px;margin-right:4px;">{hiring_sig}</span>'
-        if team_sig:
-            signal_badges += f'<span style="display:inline-block;background:#e3f2fd;color:#1565c0;padding:2px 8px;border-radius:3px;font-size:12px;margin-right:4px;">{team_sig}</span>'
-
-        top5_html += f"""
+# HTML email templates: one top-lead card (str.format_map) and the page
+# shell (string.Template), parsed once at import
+_HTML_HIRING_BADGE = '<span style="display:inline-block;background:#e8f5e9;color:#2e7d32;padding:2px 8px;border-radius:3px;font-size:12px;margin-right:4px;">{}</span>'
+_HTML_TEAM_BADGE = '<span style="display:inline-block;background:#e3f2fd;color:#1565c0;padding:2px 8px;border-radius:3px;font-size:12px;margin-right:4px;">{}</span>'
+_HTML_CARD_TMPL = """
         <tr>
             <td style="padding:16px 20px;border-bottom:1px solid #eee;">
                 <div style="display:flex;justify-content:space-between;align-items:flex-start;">
                     <div>
                         <div style="font-size:11px;color:#888;margin-bottom:2px;">#{i} &middot; Score: {score}</div>
-                        <a href="{html.escape(source)}" style="color:#1a1a2e;font-size:16px;font-weight:600;text-decoration:none;">{title}</a>
+                        <a href="{source}" style="color:#1a1a2e;font-size:16px;font-weight:600;text-decoration:none;">{title}</a>
                         <div style="color:#555;font-size:14px;margin-top:4px;">{company}</div>
                         <div style="color:#777;font-size:13px;margin-top:2px;">{location} &middot; {salary}</div>
                         <div style="margin-top:8px;">{signal_badges}</div>
@@ -368,12 +546,7 @@ def generate_html_email(leads: list[dict], days: int) -> str:
             </td>
         </tr>"""
 
-    # Seniority breakdown HTML
-    seniority_html = ""
-    for tier, count in sorted(seniority_counts.items(), key=lambda x: -x[1]):
-        seniority_html += f"<li>{tier}: {count}</li>"
-
-    email_html = f"""<!DOCTYPE html>
+HTML_EMAIL_TMPL = Template("""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -389,7 +562,7 @@ def generate_html_email(leads: list[dict], days: int) -> str:
                     <tr>
                         <td style="background:#1a1a2e;padding:32px 24px;text-align:center;">
                             <h1 style="color:#fff;margin:0;font-size:24px;font-weight:700;letter-spacing:-0.5px;">Hot Leads Weekly</h1>
-                            <p style="color:#a0a0c0;margin:8px 0 0;font-size:14px;">{date_range}</p>
+                            <p style="color:#a0a0c0;margin:8px 0 0;font-size:14px;">$date_range</p>
                         </td>
                     </tr>
 
@@ -399,15 +572,15 @@ def generate_html_email(leads: list[dict], days: int) -> str:
                             <table role="presentation" width="100%" cellpadding="0" cellspacing="0">
                                 <tr>
                                     <td width="33%" align="center" style="padding:12px;">
-                                        <div style="font-size:28px;font-weight:700;color:#1a1a2e;">{total}</div>
+                                        <div style="font-size:28px;font-weight:700;color:#1a1a2e;">$total</div>
                                         <div style="font-size:12px;color:#888;text-transform:uppercase;letter-spacing:0.5px;">Hot Leads</div>
                                     </td>
                                     <td width="33%" align="center" style="padding:12px;">
-                                        <div style="font-size:28px;font-weight:700;color:#1a1a2e;">{avg_score:.0f}</div>
+                                        <div style="font-size:28px;font-weight:700;color:#1a1a2e;">$avg_score</div>
                                         <div style="font-size:12px;color:#888;text-transform:uppercase;letter-spacing:0.5px;">Avg Score</div>
                                     </td>
                                     <td width="33%" align="center" style="padding:12px;">
-                                        <div style="font-size:16px;font-weight:700;color:#2e7d32;">{top_signal}</div>
+                                        <div style="font-size:16px;font-weight:700;color:#2e7d32;">$top_signal</div>
                                         <div style="font-size:12px;color:#888;text-transform:uppercase;letter-spacing:0.5px;">Top Signal</div>
                                     </td>
                                 </tr>
@@ -421,7 +594,7 @@ def generate_html_email(leads: list[dict], days: int) -> str:
                             <div style="background:#f8f9fa;border-radius:6px;padding:16px;">
                                 <div style="font-size:13px;font-weight:600;color:#555;margin-bottom:8px;text-transform:uppercase;letter-spacing:0.5px;">Seniority Breakdown</div>
                                 <ul style="margin:0;padding-left:20px;color:#555;font-size:14px;line-height:1.6;">
-                                    {seniority_html}
+                                    $seniority_html
                                 </ul>
                             </div>
                         </td>
@@ -438,7 +611,7 @@ def generate_html_email(leads: list[dict], days: int) -> str:
                     <tr>
                         <td style="padding:0 4px;">
                             <table role="presentation" width="100%" cellpadding="0" cellspacing="0">
-                                {top5_html}
+                                $top5_html
                             </table>
                         </td>
                     </tr>
@@ -448,7 +621,7 @@ def generate_html_email(leads: list[dict], days: int) -> str:
                         <td style="padding:24px;text-align:center;">
                             <div style="background:#f0f7ff;border-radius:6px;padding:16px;">
                                 <p style="margin:0;color:#1565c0;font-size:14px;font-weight:500;">
-                                    Full list of {total} leads attached as CSV
+                                    Full list of $total leads attached as CSV
                                 </p>
                                 <p style="margin:4px 0 0;color:#777;font-size:13px;">
                                     Sortable by score, salary, seniority, and signals
@@ -472,7 +645,7 @@ def generate_html_email(leads: list[dict], days: int) -> str:
                         <td style="background:#f8f9fa;padding:20px 24px;border-top:1px solid #eee;">
                             <p style="margin:0;color:#999;font-size:12px;text-align:center;">
                                 Hot Leads Weekly by Pariter Media Inc.<br>
-                                Curated from {total} qualifying VP+ executive postings.<br>
+                                Curated from $total qualifying VP+ executive postings.<br>
                                 <a href="mailto:rome@paritermedia.com" style="color:#999;">Unsubscribe</a>
                             </p>
                         </td>
@@ -482,92 +655,128 @@ def generate_html_email(leads: list[dict], days: int) -> str:
         </tr>
     </table>
 </body>
-</html>"""
+</html>""")
+
+
+def _html_card_fields(i: int, lead: dict) -> dict:
+    """Escaped values for one top-lead card in the HTML email."""
+    display = lead_display(lead)
+    hiring_sig = html.escape(display.hiring_signal)
+    team_sig = html.escape(display.team_structure)
+    signal_badges = ""
+    if hiring_sig:
+        signal_badges += _HTML_HIRING_BADGE.format(hiring_sig)
+    if team_sig:
+        signal_badges += _HTML_TEAM_BADGE.format(team_sig)
+
+    return {
+        "i": i,
+        "score": lead["score"],
+        "title": html.escape(display.title),
+        "company": html.escape(display.company),
+        "salary": html.escape(display.salary),
+        "location": html.escape(display.location),
+        "source": html.escape(display.source_url or "#"),
+        "signal_badges": signal_badges,
+    }
+
+
+def generate_html_email(leads: list[dict], days: int, stats: LeadStats = None) -> str:
+    """Generate the HTML email body for weekly delivery."""
+    now = datetime.now()
+    date_range = f"{(now - timedelta(days=days)).strftime('%b %d')} - {now.strftime('%b %d, %Y')}"
 
-    return email_html
+    if stats is None:
+        stats = compute_lead_stats(leads)
+    total, avg_score, signal_counts, seniority_counts, top_signal = stats
+
+    top5_html = "".join(
+        _HTML_CARD_TMPL.format_map(_html_card_fields(i, lead))
+        for i, lead in enumerate(leads[:5], 1)
+    )
+    seniority_html = "".join(
+        f"<li>{tier}: {count}</li>"
+        for tier, count in sorted(seniority_counts.items(), key=lambda x: -x[1])
+    )
+
+    return HTML_EMAIL_TMPL.substitute(
+        date_range=date_range,
+        total=total,
+        avg_score=f"{avg_score:.0f}",
+        top_signal=top_signal,
+        seniority_html=seniority_html,
+        top5_html=top5_html,
+    )
 
 
-def generate_text_email(leads: list[dict], days: int) -> str:
+def generate_text_email(leads: list[dict], days: int, stats: LeadStats = None) -> str:
     """Generate the plain text email body for weekly delivery."""
     now = datetime.now()
     date_range = f"{(now - timedelta(days=days)).strftime('%b %d')} - {now.strftime('%b %d, %Y')}"
 
-    total = len(leads)
-    avg_score = sum(l["score"] for l in leads) / total if total else 0
-
-    # Count signals
-    signal_counts = {}
-    for lead in leads:
-        for sig in lead.get("signals", []):
-            if sig["signal_type"] in ("hiring_signals", "team_structure"):
-                label = sig["signal_id"].replace("_", " ").title()
-                signal_counts[label] = signal_counts.get(label, 0) + 1
-    top_signal = max(signal_counts, key=signal_counts.get) if signal_counts else "N/A"
-
-    # Seniority breakdown
-    seniority_counts = {}
-    for lead in leads:
-        tier = (lead.get("seniority_tier") or "unknown").replace("_", " ").title()
-        seniority_counts[tier] = seniority_counts.get(tier, 0) + 1
-
-    lines = []
-    lines.append("=" * 60)
-    lines.append("HOT LEADS WEEKLY")
-    lines.append(date_range)
-    lines.append("=" * 60)
-    lines.append("")
-    lines.append(f"  {total} Hot Leads  |  Avg Score: {avg_score:.0f}  |  Top Signal: {top_signal}")
-    lines.append("")
-
-    # Seniority breakdown
-    lines.append("SENIORITY BREAKDOWN:")
-    for tier, count in sorted(seniority_counts.items(), key=lambda x: -x[1]):
-        lines.append(f"  {tier}: {count}")
-    lines.append("")
-
-    lines.append("-" * 60)
-    lines.append("TOP 5 LEADS THIS WEEK")
-    lines.append("-" * 60)
+    if stats is None:
+        stats = compute_lead_stats(leads)
+    total, avg_score, signal_counts, seniority_counts, top_signal = stats
+
+    lines = [
+        TEXT_RULE,
+        "HOT LEADS WEEKLY",
+        date_range,
+        TEXT_RULE,
+        "",
+        f"  {total} Hot Leads  |  Avg Score: {avg_score:.0f}  |  Top Signal: {top_signal}",
+        "",
+        # Seniority breakdown
+        "SENIORITY BREAKDOWN:",
+    ]
+    lines.extend(
+        f"  {tier}: {count}"
+        for tier, count in sorted(seniority_counts.items(), key=lambda x: -x[1])
+    )
+    lines.extend(("", TEXT_THIN_RULE, "TOP 5 LEADS THIS WEEK", TEXT_THIN_RULE))
 
     top5 = leads[:5]
     for i, lead in enumerate(top5, 1):
-        title = lead.get("title") or "Untitled"
-        company = lead.get("company_name") or "Confidential"
-        salary = format_salary(lead.get("annual_salary_min"), lead.get("annual_salary_max"))
-        location = format_location(lead)
-        hiring_sig = extract_hiring_signal(lead)
-        team_sig = extract_team_structure(lead)
-        source = lead.get("source_url") or "N/A"
-        score = lead["score"]
-
-        lines.append("")
-        lines.append(f"  #{i} (Score: {score})")
-        lines.append(f"  {title}")
-        lines.append(f"  {company}")
-        lines.append(f"  {location}  |  {salary}")
-        signals_str = "  |  ".join(filter(None, [hiring_sig, team_sig]))
+        display = lead_display(lead)
+        signals_str = "  |  ".join(filter(None, [display.hiring_signal, display.team_structure]))
+
+        lines.extend((
+            "",
+            f"  #{i} (Score: {lead['score']})",
+            f"  {display.title}",
+            f"  {display.company}",
+            f"  {display.location}  |  {display.salary}",
+        ))
         if signals_str:
             lines.append(f"  Signals: {signals_str}")
-        lines.append(f"  {source}")
-        lines.append("")
-
-    lines.append("-" * 60)
-    lines.append("")
-    lines.append(f"Full list of {total} leads attached as CSV.")
-    lines.append("Sortable by score, salary, seniority, and signals.")
-    lines.append("")
-    lines.append("How useful were this week's leads?")
-    lines.append("Reply to this email with feedback.")
-    lines.append("")
-    lines.append("-" * 60)
-    lines.append("Hot Leads Weekly by Pariter Media Inc.")
-    lines.append(f"Curated from {total} qualifying VP+ executive postings.")
-    lines.append("Reply with 'unsubscribe' to stop receiving these emails.")
-    lines.append("-" * 60)
+        lines.extend((f"  {display.source_url or 'N/A'}", ""))
+
+    lines.extend((
+        TEXT_THIN_RULE,
+        "",
+        f"Full list of {total} leads attached as CSV.",
+        "Sortable by score, salary, seniority, and signals.",
+        "",
+        "How useful were this week's leads?",
+        "Reply to this email with feedback.",
+        "",
+        TEXT_THIN_RULE,
+        "Hot Leads Weekly by Pariter Media Inc.",
+        f"Curated from {total} qualifying VP+ executive postings.",
+        "Reply with 'unsubscribe' to stop receiving these emails.",
+        TEXT_THIN_RULE,
+    ))
 
     return "\n".join(lines)
 
 
+def _write_email(path: Path, render, leads: list[dict], days: int, stats: LeadStats):
+    """Render an email body and write it to path."""
+    content = render(leads, days, stats)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate Hot Leads Weekly — curated executive job leads for recruiters"
@@ -614,58 +823,51 @@ def main():
     print(f"Parameters: last {args.days} days, min seniority: {args.min_seniority}")
     print()
 
-    # Fetch and score leads
-    leads = fetch_hot_leads(args.db, args.days, args.min_seniority)
-    print(f"Found {len(leads)} qualifying leads")
+    # Fetch leads (scored, sorted and top-N limited by the query)
+    leads = fetch_hot_leads(args.db, args.days, args.min_seniority, limit=args.top)
+    if args.top:
+        print(f"Found {len(leads)} qualifying leads (top {args.top} by score)")
+    else:
+        print(f"Found {len(leads)} qualifying leads")
 
     if not leads:
         print("No hot leads found for the given criteria.")
         print("Try increasing --days or lowering --min-seniority.")
         sys.exit(0)
 
-    # Score and sort
-    for lead in leads:
-        lead["score"] = score_lead(lead)
-    leads.sort(key=lambda x: x["score"], reverse=True)
-
-    # Apply top-N filter if specified
-    if args.top:
-        leads = leads[: args.top]
-        print(f"Filtered to top {args.top} leads")
-
-    # Print summary
-    scores = [l["score"] for l in leads]
-    print(f"Score range: {min(scores)} - {max(scores)} (avg: {sum(scores)/len(scores):.1f})")
+    # Print summary (leads are sorted by score, best first)
+    stats = compute_lead_stats(leads)
+    print(f"Score range: {leads[-1]['score']} - {leads[0]['score']} (avg: {stats.avg_score:.1f})")
     print()
 
+    # Derive display fields once up front; every output reads them from the lead
+    for lead in leads:
+        lead_display(lead)
+
     # Show top 5 in terminal
     print("Top 5 leads:")
     print("-" * 70)
     for i, lead in enumerate(leads[:5], 1):
-        title = lead.get("title", "Untitled")
-        company = lead.get("company_name") or "Confidential"
-        salary = format_salary(lead.get("annual_salary_min"), lead.get("annual_salary_max"))
-        score = lead["score"]
-        print(f"  {i}. [{score}] {title}")
-        print(f"     {company} | {salary}")
-        print(f"     {extract_hiring_signal(lead)} | {extract_team_structure(lead)}")
+        display = lead_display(lead)
+        print(f"  {i}. [{lead['score']}] {display.title}")
+        print(f"     {display.company} | {display.salary}")
+        print(f"     {display.hiring_signal} | {display.team_structure}")
         print()
 
-    # Generate outputs
+    # Generate outputs (independent files, written concurrently)
     csv_path = output_dir / "hot_leads.csv"
-    generate_csv(leads, str(csv_path))
-    print(f"CSV:        {csv_path} ({len(leads)} rows)")
-
     html_path = output_dir / "hot_leads_email.html"
-    html_content = generate_html_email(leads, args.days)
-    with open(html_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
-    print(f"HTML email: {html_path}")
-
     txt_path = output_dir / "hot_leads_email.txt"
-    txt_content = generate_text_email(leads, args.days)
-    with open(txt_path, "w", encoding="utf-8") as f:
-        f.write(txt_content)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        csv_job = pool.submit(generate_csv, leads, str(csv_path))
+        html_job = pool.submit(_write_email, html_path, generate_html_email, leads, args.days, stats)
+        txt_job = pool.submit(_write_email, txt_path, generate_text_email, leads, args.days, stats)
+
+    csv_job.result()
+    print(f"CSV:        {csv_path} ({len(leads)} rows)")
+    html_job.result()
+    print(f"HTML email: {html_path}")
+    txt_job.result()
     print(f"Text email: {txt_path}")
 
     print()
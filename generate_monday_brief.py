@@ -19,17 +19,25 @@ Dependencies:
 """
 
 import argparse
+import hashlib
 import html
 import math
 import os
-import sqlite3
+import pickle
+import re
 import sys
-from collections import Counter
+import tempfile
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from string import Template
 
 import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
 
 # Import scoring + lead fetching from existing pipeline
@@ -43,12 +51,24 @@ from generate_hot_leads import (
     extract_extra_signals,
     extract_key_tools,
     generate_csv,
+    pretty_label,
+    ensure_indexes,
+    open_read_connection,
+    HOT_LEAD_INDEXES,
 )
 
 # ─── Configuration ────────────────────────────────────────────────────────────
 
 DEFAULT_DB = "/Users/rome/Documents/projects/scrapers/master/data/jobs.db"
 VP_TIERS = ("vp", "svp", "evp", "c_level")
+VP_TIER_PLACEHOLDERS = ",".join("?" for _ in VP_TIERS)
+
+# Indexes on jobs backing the analytics pass: the vp_jobs materialization
+# (active + VP tier) and the latest-date lookup (active + date_posted)
+ANALYTICS_INDEXES = [
+    ("idx_jobs_vp", "jobs(is_active, seniority_tier, date_posted)"),
+    ("idx_jobs_active_date", "jobs(is_active, date_posted)"),
+]
 
 # ─── Display Name Mappings ────────────────────────────────────────────────────
 
@@ -108,6 +128,45 @@ STAGE_MAP = {
     "startup": "Early Stage",
 }
 
+STAGE_ORDER = ["Enterprise / Public", "Late Stage", "Growth", "Early Stage", "Unknown"]
+
+# Substring fallbacks for stages not in STAGE_MAP, checked in order
+STAGE_PARTIAL_MATCHES = [
+    ("Enterprise / Public", ("enterprise", "public")),
+    ("Late Stage", ("late", "series c", "series d")),
+    ("Growth", ("growth", "series a", "series b")),
+    ("Early Stage", ("early", "seed", "startup")),
+]
+
+
+def _sql_literal(text):
+    """Quote text as an SQLite string literal."""
+    return "'" + text.replace("'", "''") + "'"
+
+
+def _build_stage_bucket_sql():
+    """SQL CASE mirroring the STAGE_MAP lookup + partial-match chain on `stage`.
+
+    `stage` is the lower-cased, whitespace-trimmed company_stage; NULL and
+    empty stages fall through to Unknown.
+    """
+    exact = {}
+    for raw, bucket in STAGE_MAP.items():
+        exact.setdefault(bucket, []).append(raw)
+    whens = [
+        f"WHEN stage IN ({', '.join(map(_sql_literal, raws))}) THEN {_sql_literal(bucket)}"
+        for bucket, raws in exact.items()
+    ]
+    whens += [
+        f"WHEN {' OR '.join(f'instr(stage, {_sql_literal(needle)}) > 0' for needle in needles)} "
+        f"THEN {_sql_literal(bucket)}"
+        for bucket, needles in STAGE_PARTIAL_MATCHES
+    ]
+    return "CASE " + " ".join(whens) + " ELSE 'Unknown' END"
+
+
+STAGE_BUCKET_SQL = _build_stage_bucket_sql()
+
 SENIORITY_DISPLAY = {
     "c_level": "C-Level",
     "evp": "EVP",
@@ -115,6 +174,11 @@ SENIORITY_DISPLAY = {
     "vp": "VP",
 }
 
+SEGMENT_DISPLAY = {
+    "enterprise": "Enterprise", "smb": "SMB", "mid_market": "Mid-Market",
+    "fortune_500": "Fortune 500", "startup": "Startup",
+}
+
 # Roles where "Reports CRO" signal makes sense
 SALES_FUNCTIONS = {"sales", "business_development", "revenue", "partnerships"}
 SALES_TITLE_KEYWORDS = {"sales", "revenue", "business development", "account",
@@ -144,52 +208,100 @@ COMPANY_NAME_OVERRIDES = {
 }
 
 # Companies to exclude from Top Hiring Companies (venture studios, job boards, etc.)
-COMPANY_BLOCKLIST = {
+COMPANY_BLOCKLIST = frozenset({
     "futuresight",  # Venture studio posting co-founder roles, not an employer
-}
+})
+
+
+# Title-cased forms of suffixes/abbreviations that should stay upper-case
+_COMPANY_ACRONYMS = frozenset({"Llc", "Inc", "Llp", "Lp", "Pc", "Pllc", "Dds", "Md",
+                               "Nyc", "Usa", "Us", "Ai"})
 
 
+@lru_cache(maxsize=4096)
 def format_company_name(name):
     """Title-case a company name, handling special cases."""
     if not name:
         return "Confidential"
     # Check overrides first
-    lower = name.lower().strip()
-    if lower in COMPANY_NAME_OVERRIDES:
-        return COMPANY_NAME_OVERRIDES[lower]
+    override = COMPANY_NAME_OVERRIDES.get(name.lower().strip())
+    if override:
+        return override
     # Already looks properly cased (has mixed case, not ALL CAPS)
-    has_upper = any(c.isupper() for c in name[1:])
-    has_lower = any(c.islower() for c in name[1:])
-    if has_upper and has_lower:
+    rest = name[1:]
+    if rest != rest.lower() and rest != rest.upper():
         return name
     # Title-case with common acronym handling
-    words = name.title().split()
-    acronyms = {"Llc", "Inc", "Llp", "Lp", "Pc", "Pllc", "Dds", "Md",
-                "Nyc", "Usa", "Us", "Ai"}
-    result = []
-    for w in words:
-        if w.rstrip(".,") in acronyms:
-            result.append(w.upper())
-        else:
-            result.append(w)
-    return " ".join(result)
+    return " ".join(w.upper() if w.rstrip(".,") in _COMPANY_ACRONYMS else w
+                    for w in name.title().split())
 
 
-def filter_signals_for_role(lead):
-    """Filter out 'reports_cro' signal for non-sales roles."""
+def lead_signal_ids(lead):
+    """Signal ids on a lead, collected on first use and cached on the lead."""
+    ids = lead.get("_signal_ids")
+    if ids is None:
+        ids = lead["_signal_ids"] = frozenset(s["signal_id"] for s in lead.get("signals", ()))
+    return ids
+
+
+def _is_sales_role(lead):
     title_lower = (lead.get("title") or "").lower()
     func = (lead.get("function_category") or "").lower()
-    is_sales_role = (func in SALES_FUNCTIONS or
-                     any(kw in title_lower for kw in SALES_TITLE_KEYWORDS))
-    if is_sales_role:
+    return (func in SALES_FUNCTIONS or
+            any(kw in title_lower for kw in SALES_TITLE_KEYWORDS))
+
+
+def _hides_reports_cro(lead):
+    """True when a non-sales role carries reports_cro, which display drops."""
+    return "reports_cro" in lead_signal_ids(lead) and not _is_sales_role(lead)
+
+
+def filter_signals_for_role(lead):
+    """Filter out 'reports_cro' signal for non-sales roles."""
+    if not _hides_reports_cro(lead):
         return lead.get("signals", [])
     return [s for s in lead.get("signals", []) if s["signal_id"] != "reports_cro"]
 
 
+LeadSignalText = namedtuple("LeadSignalText", ["hiring", "team", "summary", "note"])
+
+
+def lead_signal_text(lead):
+    """Role-filtered signal labels, sheet summary and note, cached on the lead.
+
+    hiring/team are the extract_* labels, summary is the Top Leads
+    "Signals" cell (hiring, team, then segment/comp/motion extras), and
+    note is generate_signal_note(). Shared by the sheet and both emails.
+    """
+    text = lead.get("_signal_text")
+    if text is None:
+        signals = lead.get("signals", [])
+        signal_ids = lead_signal_ids(lead)
+        if _hides_reports_cro(lead):
+            signals = filter_signals_for_role(lead)
+            signal_ids = signal_ids - {"reports_cro"}
+        hiring = extract_hiring_signal(lead, signals)
+        team = extract_team_structure(lead, signals)
+        parts = [hiring] if hiring else []
+        if team:
+            parts.extend(team.split(", "))
+        extras = extract_extra_signals(lead)
+        for key in ("segment", "comp", "motion"):
+            if key in extras:
+                parts.extend(extras[key])
+        text = lead["_signal_text"] = LeadSignalText(
+            hiring, team, ", ".join(parts), generate_signal_note(lead, signal_ids))
+    return text
+
+
 def estimate_placement_fee(lead, pct=0.25):
     """Estimate recruiter placement fee (25% of salary midpoint)."""
-    sal_min = lead.get("annual_salary_min") or 0
-    sal_max = lead.get("annual_salary_max") or 0
+    return _placement_fee(lead.get("annual_salary_min") or 0, lead.get("annual_salary_max") or 0, pct)
+
+
+@lru_cache(maxsize=2048)
+def _placement_fee(sal_min, sal_max, pct):
+    """estimate_placement_fee() on the salary range; memoized per range."""
     if sal_max > 0:
         midpoint = (sal_min + sal_max) / 2 if sal_min > 0 else sal_max
     elif sal_min > 0:
@@ -203,7 +315,7 @@ def estimate_placement_fee(lead, pct=0.25):
 
 
 # Known executive search / staffing firms — their postings are retained searches
-SEARCH_FIRMS = {
+SEARCH_FIRMS = frozenset({
     "korn ferry", "heidrick & struggles", "heidrick and struggles",
     "spencer stuart", "russell reynolds", "egon zehnder",
     "boyden", "odgers berndtson", "stanton chase", "dhr international",
@@ -211,7 +323,29 @@ SEARCH_FIRMS = {
     "caldwell partners", "isaacson miller",
     "robert half", "randstad", "adecco", "manpower", "manpowergroup",
     "kelly services", "hays", "page executive", "michael page",
-}
+})
+
+# Lowercased names never shown in Top Hiring Companies
+TOP_COMPANIES_EXCLUDED = SEARCH_FIRMS | COMPANY_BLOCKLIST
+_TOP_COMPANIES_EXCLUDED_PARAMS = tuple(sorted(TOP_COMPANIES_EXCLUDED))
+
+# Count UNIQUE titles per company (not total posts) to avoid multi-location inflation,
+# flagging in the same scan whether the company posted in the prior 7-day window.
+# Search firms and blocklisted companies are excluded before ranking. Built once so
+# the statement text is constant and sqlite3's statement cache can reuse it.
+TOP_COMPANIES_SQL = f"""
+    SELECT company_name_normalized,
+           COUNT(DISTINCT CASE WHEN date_posted >= ? THEN title END) as unique_roles,
+           MAX(date_posted >= ? AND date_posted < ?) as in_prior
+    FROM vp_jobs
+    WHERE company_name_normalized IS NOT NULL
+      AND LOWER(TRIM(company_name_normalized)) NOT IN ({",".join("?" for _ in _TOP_COMPANIES_EXCLUDED_PARAMS)})
+      AND date_posted >= ?
+    GROUP BY company_name_normalized
+    HAVING unique_roles >= 3
+    ORDER BY unique_roles DESC
+    LIMIT 10
+"""
 
 
 def is_search_firm(lead):
@@ -220,26 +354,31 @@ def is_search_firm(lead):
     return name in SEARCH_FIRMS
 
 
+_LOC_CLEAN_RE = re.compile(r"(?:Remote, )?(.*?)(?:, US)?", re.S)
+_LOC_EMPTY = frozenset({"Remote", "US"})
+
+
 def clean_location(lead):
     """Clean up messy location formatting from the scraper.
 
     Fixes: 'Remote, US' → 'Remote', 'Elgin, IL, US' → 'Elgin, IL',
     'Boston, (Remote)' → 'Boston (Remote)', removes redundant 'Remote'.
     """
-    metro = lead.get("location_metro")
-    raw = lead.get("location_raw") or ""
-    is_remote = lead.get("is_remote")
-    loc_type = (lead.get("location_type") or "").lower()
-
-    # Clean the raw location: strip trailing ", US"
-    if raw.endswith(", US"):
-        raw = raw[:-4]
-    # Strip leading "Remote, " if we'll add (Remote) anyway
-    if raw.startswith("Remote, "):
-        raw = raw[8:]
-    if raw == "Remote":
-        raw = ""
-    if raw == "US":
+    return _clean_location(
+        lead.get("location_metro"),
+        lead.get("location_raw") or "",
+        bool(lead.get("is_remote")),
+        (lead.get("location_type") or "").lower(),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _clean_location(metro, raw, is_remote, loc_type):
+    """clean_location() on the four location fields; memoized per combination."""
+    # Clean the raw location: strip trailing ", US" and a leading "Remote, "
+    # (we'll add (Remote) anyway) in one regex pass
+    raw = _LOC_CLEAN_RE.fullmatch(raw).group(1)
+    if raw in _LOC_EMPTY:
         raw = ""
 
     # Build clean location
@@ -260,74 +399,80 @@ def clean_location(lead):
     return " ".join(parts) if parts else "Location not specified"
 
 
+# correct_seniority() title patterns, compiled once. Confirmations are title
+# prefixes (or "president and/&" anywhere); downgrades match at the start of
+# the title or after a space within its first 30 characters.
+_CLEVEL_CONFIRM_RE = re.compile(
+    r"^(?:chief |ceo|cfo|coo|cto|cio|cmo|cro|cso|cpo|president|executive director"
+    r"|general counsel|managing director)|president (?:and|&)"
+)
+_CLEVEL_DOWNGRADE_RE = re.compile(
+    r"(?:^| )(?:director[, ]|sr\. director|senior director|manager[, ]|sr\. manager"
+    r"|senior manager|coordinator|analyst|specialist|associate|advisor|intern|assistant)"
+)
+
+
 def correct_seniority(lead):
     """Override seniority_tier when the scraper misclassifies based on C-suite keyword proximity.
 
     The scraper tags 'Senior Director, CEO Initiatives' as c_level because it mentions CEO.
     This function checks if the title itself is actually a C-level role.
+    Returns True if the tier was changed.
     """
     if lead.get("seniority_tier") != "c_level":
-        return  # Only fix c_level misclassifications
+        return False  # Only fix c_level misclassifications
     title = (lead.get("title") or "").lower().strip()
     # Patterns that confirm actual C-level role
-    if title.startswith("chief "):
-        return
-    if title.startswith("ceo") or title.startswith("cfo") or title.startswith("coo"):
-        return
-    if title.startswith("cto") or title.startswith("cio") or title.startswith("cmo"):
-        return
-    if title.startswith("cro") or title.startswith("cso") or title.startswith("cpo"):
-        return
-    if title.startswith("president") or "president and" in title or "president &" in title:
-        return
-    if title.startswith("executive director"):
-        return
-    if title.startswith("general counsel") or title.startswith("managing director"):
-        return
+    if _CLEVEL_CONFIRM_RE.search(title):
+        return False
     if "founding" in title and ("president" in title or "ceo" in title or "chief" in title):
-        return
+        return False
     # Titles that mention C-suite but aren't C-level roles
-    downgrade_patterns = [
-        "director,", "director ", "sr. director", "senior director",
-        "manager,", "manager ", "sr. manager", "senior manager",
-        "coordinator", "analyst", "specialist", "associate",
-        "advisor", "intern", "assistant",
-    ]
-    for pattern in downgrade_patterns:
-        if title.startswith(pattern) or f" {pattern}" in title[:30]:
-            lead["seniority_tier"] = "vp"
-            return
+    if _CLEVEL_DOWNGRADE_RE.search(title[:30]):
+        lead["seniority_tier"] = "vp"
+        return True
     # If title doesn't start with a C-suite keyword and doesn't match
     # any known pattern, keep the scraper's classification
+    return False
+
+
+# is_false_positive() markers, matched against the lowercased title: training
+# programs masquerading as exec roles, internships and trainee roles
+_FALSE_POSITIVE_RE = re.compile(
+    r"^intern[ -]|certification program|future leaders program|internship|in-training"
+)
 
 
 def is_false_positive(lead):
     """Filter out leads that aren't real job openings (training programs, internships, etc.)."""
-    title = (lead.get("title") or "").lower()
-    # Certification/training programs masquerading as exec roles
-    if "certification program" in title:
-        return True
-    if "future leaders program" in title:
-        return True
-    # Internships and trainee roles
-    if "internship" in title:
-        return True
-    if title.startswith("intern ") or title.startswith("intern-"):
-        return True
-    if "in-training" in title or "-in-training" in title:
-        return True
-    return False
+    return _FALSE_POSITIVE_RE.search((lead.get("title") or "").lower()) is not None
 
 
-def apply_freshness_bonus(lead, ref_date):
-    """Add freshness bonus to score. 0-2 days = +10, 3-4 days = +5, 5-7 = +2."""
-    date_posted = lead.get("date_posted")
-    if not date_posted:
-        return
+@lru_cache(maxsize=1024)
+def _parse_posted_day(day):
+    """Parse a YYYY-MM-DD prefix once per distinct day; None if malformed."""
     try:
-        posted_dt = datetime.strptime(str(date_posted)[:10], "%Y-%m-%d")
-        days_ago = (ref_date - posted_dt).days
+        if len(day) == 10 and day[4] == day[7] == "-":
+            return datetime.fromisoformat(day)
+        return datetime.strptime(day, "%Y-%m-%d")
     except ValueError:
+        return None
+
+
+def days_since_posted(date_posted, ref_date):
+    """Whole days between a lead's date_posted and ref_date, or None."""
+    if not date_posted:
+        return None
+    posted_dt = _parse_posted_day(str(date_posted)[:10])
+    if posted_dt is None:
+        return None
+    return (ref_date - posted_dt).days
+
+
+def apply_freshness_bonus(lead, ref_date):
+    """Add freshness bonus to score. 0-2 days = +10, 3-4 days = +5, 5-7 = +2."""
+    days_ago = days_since_posted(lead.get("date_posted"), ref_date)
+    if days_ago is None:
         return
     if days_ago <= 2:
         lead["score"] += 10
@@ -362,6 +507,32 @@ XL_BODY_BOLD = Font(name="Plus Jakarta Sans", color=DARK_TEXT, size=10, bold=Tru
 XL_LINK_FONT = Font(name="Plus Jakarta Sans", color="1155CC", size=10, underline="single")
 XL_SECTION_FONT = Font(name="DM Serif Display", bold=True, color=AMBER, size=13)
 
+# Top Leads per-row variants: score band, days-posted, seniority, fee, flags
+XL_SCORE_FONT_GOLD = Font(name="Plus Jakarta Sans", bold=True, color=DARK_TEXT, size=11)
+XL_SCORE_FONT_BLUE = Font(name="Plus Jakarta Sans", bold=True, color=WHITE, size=11)
+XL_SCORE_FONT_GRAY = Font(name="Plus Jakarta Sans", color="555555", size=11)
+XL_DAYS_FONT_RED = Font(name="Plus Jakarta Sans", bold=True, color=RED_FONT, size=10)
+XL_DAYS_FONT_AMBER = Font(name="Plus Jakarta Sans", bold=True, color=AMBER_FONT, size=10)
+XL_DAYS_FONT_GRAY = Font(name="Plus Jakarta Sans", color=GRAY_FONT, size=10)
+XL_SEN_FONT_CLEVEL = Font(name="Plus Jakarta Sans", bold=True, color=AMBER, size=10)
+XL_SEN_FONT_SVP_EVP = Font(name="Plus Jakarta Sans", bold=True, color=BLUE, size=10)
+XL_FEE_FONT = Font(name="Plus Jakarta Sans", bold=True, color="2E7D32", size=10)
+XL_REPOST_FONT_RETAINED = Font(name="Plus Jakarta Sans", bold=True, color="7C3AED", size=10)
+XL_REPOST_FONT_REPOST = Font(name="Plus Jakarta Sans", bold=True, color="856404", size=10)
+
+# Market Intel sheet: title bar, section headers, figures, trends, footer notes
+XL_INTEL_TITLE_FONT = Font(name="DM Serif Display", bold=True, color=AMBER, size=14)
+XL_INTEL_SECTION_FONT = Font(name="Plus Jakarta Sans", bold=True, color=AMBER, size=12)
+XL_INTEL_FIGURE_FONT = Font(name="Plus Jakarta Sans", bold=True, color=DARK_TEXT, size=11)
+XL_INTEL_NOTE_FONT = Font(name="Plus Jakarta Sans", italic=True, color=GRAY_FONT, size=9)
+XL_INTEL_WARNING_FONT = Font(name="Plus Jakarta Sans", italic=True, color=RED_FONT, size=9)
+XL_TREND_FONT_UP = Font(name="Plus Jakarta Sans", bold=True, color=GREEN_FONT, size=10)
+XL_TREND_FONT_DOWN = Font(name="Plus Jakarta Sans", bold=True, color=RED_FONT, size=10)
+XL_WOW_FONT_UP = Font(name="Plus Jakarta Sans", color=GREEN_FONT, size=10)
+XL_WOW_FONT_DOWN = Font(name="Plus Jakarta Sans", color=RED_FONT, size=10)
+XL_WOW_FONT_FLAT = Font(name="Plus Jakarta Sans", color=GRAY_FONT, size=10)
+
+
 XL_HEADER_FILL = PatternFill(start_color=NAVY, end_color=NAVY, fill_type="solid")
 XL_SCORE_GOLD = PatternFill(start_color=AMBER, end_color=AMBER, fill_type="solid")
 XL_SCORE_BLUE = PatternFill(start_color=BLUE, end_color=BLUE, fill_type="solid")
@@ -400,65 +571,92 @@ def _percentile(values, pct):
     return values[f] * (c - k) + values[c] * (k - f)
 
 
-def compute_salary_benchmarks(conn, days=14):
+def _quartiles(values):
+    """Return (P25, median, P75) of a sorted list in one call.
+
+    Same linear interpolation as _percentile, with the quartile positions
+    split into index + exact quarter fraction by integer divmod.
+    """
+    if not values:
+        return 0, 0, 0
+    last = len(values) - 1
+    result = []
+    for quarter in (1, 2, 3):
+        f, rem = divmod(last * quarter, 4)
+        if rem:
+            frac = rem / 4
+            result.append(values[f] * (1 - frac) + values[f + 1] * frac)
+        else:
+            result.append(values[f])
+    return tuple(result)
+
+
+def _ensure_vp_jobs(conn):
+    """Materialize active VP+ jobs into a narrow TEMP table once per connection.
+
+    Every analytics query filters jobs on is_active and VP_TIERS; they read
+    this in-memory table instead of re-applying the filter to the full table.
+    """
+    if conn.execute(
+        "SELECT 1 FROM sqlite_temp_master WHERE type = 'table' AND name = 'vp_jobs'"
+    ).fetchone():
+        return
+    conn.execute(f"""
+        CREATE TEMP TABLE vp_jobs AS
+        SELECT id, title, company_name_normalized, company_industry, company_stage,
+               function_category, location_metro, location_type, is_remote,
+               annual_salary_max, date_posted, date_scraped
+        FROM jobs
+        WHERE is_active = 1
+          AND seniority_tier IN ({VP_TIER_PLACEHOLDERS})
+    """, VP_TIERS)
+    conn.execute("CREATE INDEX temp.idx_vp_jobs_date ON vp_jobs(date_posted)")
+    conn.execute("CREATE INDEX temp.idx_vp_jobs_func ON vp_jobs(function_category, annual_salary_max)")
+
+
+def compute_salary_benchmarks(conn, days=14, ref_date=None):
     """Compute P25/Median/P75 salary benchmarks by role function.
 
     Uses ALL active jobs for current percentiles (broader sample),
     then compares recent vs prior 30-day windows for trend.
     """
-    tier_placeholders = ",".join("?" for _ in VP_TIERS)
+    _ensure_vp_jobs(conn)
     # For trend: compare last 30 days vs 30-60 days ago (relative to latest data)
-    ref_date = _get_data_reference_date(conn)
+    ref_date = ref_date or _get_data_reference_date(conn)
     trend_cutoff = (ref_date - timedelta(days=30)).strftime("%Y-%m-%d")
     trend_prior = (ref_date - timedelta(days=60)).strftime("%Y-%m-%d")
 
-    benchmarks = []
-    for func, role_name in FUNCTION_TO_ROLE.items():
-        if role_name not in ROLE_ORDER:
-            continue
+    funcs = [f for f, role_name in FUNCTION_TO_ROLE.items() if role_name in ROLE_ORDER]
+    func_placeholders = ",".join("?" for _ in funcs)
+
+    # One scan for every function: all-time salaries (no date filter for
+    # stable percentiles) plus date_posted for splitting the trend windows.
+    # Rows arrive sorted by salary within each function, so each window's
+    # list stays sorted as it is partitioned. The ORDER BY costs no sort:
+    # idx_vp_jobs_func walks (function_category, annual_salary_max) in order.
+    by_func = {f: ([], [], []) for f in funcs}
+    for func, salary, posted in conn.execute(f"""
+        SELECT function_category, annual_salary_max, date_posted FROM vp_jobs
+        WHERE function_category IN ({func_placeholders})
+          AND annual_salary_max > 0
+        ORDER BY function_category, annual_salary_max
+    """, funcs):
+        all_salaries, recent, prior = by_func[func]
+        all_salaries.append(salary)
+        posted = posted or ""
+        if posted >= trend_cutoff:
+            recent.append(salary)
+        elif posted >= trend_prior:
+            prior.append(salary)
 
-        # Current: all active jobs with salary (no date filter for stable percentiles)
-        rows = conn.execute(f"""
-            SELECT annual_salary_max FROM jobs
-            WHERE is_active = 1
-              AND seniority_tier IN ({tier_placeholders})
-              AND function_category = ?
-              AND annual_salary_max > 0
-            ORDER BY annual_salary_max
-        """, (*VP_TIERS, func)).fetchall()
-
-        salaries = [r[0] for r in rows]
+    benchmarks = []
+    for func in funcs:
+        role_name = FUNCTION_TO_ROLE[func]
+        salaries, recent_salaries, prior_salaries = by_func[func]
         if len(salaries) < 3:
             continue
 
-        p25 = _percentile(salaries, 25)
-        median = _percentile(salaries, 50)
-        p75 = _percentile(salaries, 75)
-
-        # Recent window for trend numerator
-        recent_rows = conn.execute(f"""
-            SELECT annual_salary_max FROM jobs
-            WHERE is_active = 1
-              AND seniority_tier IN ({tier_placeholders})
-              AND function_category = ?
-              AND annual_salary_max > 0
-              AND date_posted >= ?
-            ORDER BY annual_salary_max
-        """, (*VP_TIERS, func, trend_cutoff)).fetchall()
-
-        # Prior window for trend denominator
-        prior_rows = conn.execute(f"""
-            SELECT annual_salary_max FROM jobs
-            WHERE is_active = 1
-              AND seniority_tier IN ({tier_placeholders})
-              AND function_category = ?
-              AND annual_salary_max > 0
-              AND date_posted >= ? AND date_posted < ?
-            ORDER BY annual_salary_max
-        """, (*VP_TIERS, func, trend_prior, trend_cutoff)).fetchall()
-
-        recent_salaries = [r[0] for r in recent_rows]
-        prior_salaries = [r[0] for r in prior_rows]
+        p25, median, p75 = _quartiles(salaries)
 
         if len(recent_salaries) >= 3 and len(prior_salaries) >= 3:
             recent_median = _percentile(recent_salaries, 50)
@@ -496,62 +694,47 @@ def _get_data_reference_date(conn):
     return datetime.now()
 
 
-def compute_industry_velocity(conn, days=30):
+@lru_cache(maxsize=8)
+def _wow_windows(ref_date):
+    """Return (last-7-day start, prior-7-day start, ref date) as date strings."""
+    return (
+        (ref_date - timedelta(days=7)).strftime("%Y-%m-%d"),
+        (ref_date - timedelta(days=14)).strftime("%Y-%m-%d"),
+        ref_date.strftime("%Y-%m-%d"),
+    )
+
+
+def compute_industry_velocity(conn, days=30, ref_date=None):
     """Compute VP+ hiring velocity by industry with WoW change.
 
     Uses the full `days` window for total counts, but always compares
     last 7 days vs prior 7 days for a true week-over-week percentage.
     """
-    tier_placeholders = ",".join("?" for _ in VP_TIERS)
-    ref_date = _get_data_reference_date(conn)
+    _ensure_vp_jobs(conn)
+    ref_date = ref_date or _get_data_reference_date(conn)
     cutoff = (ref_date - timedelta(days=days)).strftime("%Y-%m-%d")
 
     # WoW: always 7-day windows regardless of `days`
-    wow_current_start = (ref_date - timedelta(days=7)).strftime("%Y-%m-%d")
-    wow_prior_start = (ref_date - timedelta(days=14)).strftime("%Y-%m-%d")
-    ref_str = ref_date.strftime("%Y-%m-%d")
-
-    # Total counts for the full window
-    current = conn.execute(f"""
-        SELECT company_industry, COUNT(*) as cnt FROM jobs
-        WHERE is_active = 1
-          AND seniority_tier IN ({tier_placeholders})
-          AND company_industry IS NOT NULL
+    wow_current_start, wow_prior_start, ref_str = _wow_windows(ref_date)
+
+    # Full-window total plus both WoW windows in one grouped scan
+    rows = conn.execute("""
+        SELECT company_industry,
+               SUM(date_posted >= ?) as cnt,
+               SUM(date_posted >= ? AND date_posted <= ?) as wow_curr,
+               SUM(date_posted >= ? AND date_posted < ?) as wow_prev
+        FROM vp_jobs
+        WHERE company_industry IS NOT NULL
           AND date_posted >= ?
         GROUP BY company_industry
+        HAVING cnt > 0
         ORDER BY cnt DESC
-    """, (*VP_TIERS, cutoff)).fetchall()
-
-    # Last 7 days (for WoW numerator)
-    wow_curr = conn.execute(f"""
-        SELECT company_industry, COUNT(*) as cnt FROM jobs
-        WHERE is_active = 1
-          AND seniority_tier IN ({tier_placeholders})
-          AND company_industry IS NOT NULL
-          AND date_posted >= ? AND date_posted <= ?
-        GROUP BY company_industry
-    """, (*VP_TIERS, wow_current_start, ref_str)).fetchall()
-
-    # Prior 7 days (for WoW denominator)
-    wow_prev = conn.execute(f"""
-        SELECT company_industry, COUNT(*) as cnt FROM jobs
-        WHERE is_active = 1
-          AND seniority_tier IN ({tier_placeholders})
-          AND company_industry IS NOT NULL
-          AND date_posted >= ? AND date_posted < ?
-        GROUP BY company_industry
-    """, (*VP_TIERS, wow_prior_start, wow_current_start)).fetchall()
-
-    wow_curr_map = {r[0]: r[1] for r in wow_curr}
-    wow_prev_map = {r[0]: r[1] for r in wow_prev}
+    """, (cutoff, wow_current_start, ref_str, wow_prior_start, wow_current_start,
+          min(cutoff, wow_prior_start))).fetchall()
 
     velocity = []
-    for row in current:
-        raw_name = row[0]
+    for raw_name, count, wc, wp in rows:
         display_name = INDUSTRY_MAP.get(raw_name, raw_name)
-        count = row[1]
-        wc = wow_curr_map.get(raw_name, 0)
-        wp = wow_prev_map.get(raw_name, 0)
         wow = round((wc - wp) / wp * 100) if wp > 0 else 0
 
         velocity.append({
@@ -564,151 +747,75 @@ def compute_industry_velocity(conn, days=30):
     return velocity[:8]
 
 
-def compute_top_companies(conn, days=30):
+def compute_top_companies(conn, days=30, ref_date=None):
     """Compute top hiring companies with 'new this week' flags.
 
     Total counts use the full `days` window.
     'New' flag compares last 7 days vs prior 7 days.
     """
-    tier_placeholders = ",".join("?" for _ in VP_TIERS)
-    ref_date = _get_data_reference_date(conn)
+    _ensure_vp_jobs(conn)
+    ref_date = ref_date or _get_data_reference_date(conn)
     cutoff = (ref_date - timedelta(days=days)).strftime("%Y-%m-%d")
 
     # "New" detection: last 7 vs prior 7
-    wow_current_start = (ref_date - timedelta(days=7)).strftime("%Y-%m-%d")
-    wow_prior_start = (ref_date - timedelta(days=14)).strftime("%Y-%m-%d")
-    ref_str = ref_date.strftime("%Y-%m-%d")
-
-    # Count UNIQUE titles per company (not total posts) to avoid multi-location inflation
-    current = conn.execute(f"""
-        SELECT company_name_normalized,
-               COUNT(DISTINCT title) as unique_roles
-        FROM jobs
-        WHERE is_active = 1
-          AND seniority_tier IN ({tier_placeholders})
-          AND company_name_normalized IS NOT NULL
-          AND date_posted >= ?
-        GROUP BY company_name_normalized
-        HAVING unique_roles >= 3
-        ORDER BY unique_roles DESC
-        LIMIT 30
-    """, (*VP_TIERS, cutoff)).fetchall()
-
-    # Companies present in prior 7-day window
-    prior = conn.execute(f"""
-        SELECT DISTINCT company_name_normalized FROM jobs
-        WHERE is_active = 1
-          AND seniority_tier IN ({tier_placeholders})
-          AND company_name_normalized IS NOT NULL
-          AND date_posted >= ? AND date_posted < ?
-    """, (*VP_TIERS, wow_prior_start, wow_current_start)).fetchall()
-
-    prior_set = {r[0] for r in prior}
-
-    companies = []
-    for row in current:
-        name = row[0]
-        count = row[1]
-        # Filter search firms from top companies list
-        if name.lower().strip() in SEARCH_FIRMS:
-            continue
-        if name.lower().strip() in COMPANY_BLOCKLIST:
-            continue
-        is_new = name not in prior_set
-        companies.append({
-            "company": name,
-            "count": count,
-            "is_new": is_new,
-        })
+    wow_current_start, wow_prior_start, _ = _wow_windows(ref_date)
+
+    current = conn.execute(TOP_COMPANIES_SQL, (
+        cutoff, wow_prior_start, wow_current_start,
+        *_TOP_COMPANIES_EXCLUDED_PARAMS, min(cutoff, wow_prior_start),
+    )).fetchall()
 
-    return companies[:10]
+    return [
+        {"company": name, "count": count, "is_new": not in_prior}
+        for name, count, in_prior in current
+    ]
 
 
-def compute_geo_breakdown(conn, days=30):
+def compute_geo_breakdown(conn, days=30, ref_date=None):
     """Compute VP+ leads by metro area with WoW change.
 
     Total counts use the full `days` window.
     WoW compares last 7 days vs prior 7 days.
     """
-    tier_placeholders = ",".join("?" for _ in VP_TIERS)
-    ref_date = _get_data_reference_date(conn)
+    _ensure_vp_jobs(conn)
+    ref_date = ref_date or _get_data_reference_date(conn)
     cutoff = (ref_date - timedelta(days=days)).strftime("%Y-%m-%d")
 
     # WoW: always 7-day windows
-    wow_current_start = (ref_date - timedelta(days=7)).strftime("%Y-%m-%d")
-    wow_prior_start = (ref_date - timedelta(days=14)).strftime("%Y-%m-%d")
-    ref_str = ref_date.strftime("%Y-%m-%d")
-
-    # Total counts for full window — metro
-    current_metro = conn.execute(f"""
-        SELECT location_metro, COUNT(*) as cnt FROM jobs
-        WHERE is_active = 1
-          AND seniority_tier IN ({tier_placeholders})
-          AND location_metro IS NOT NULL
-          AND (is_remote = 0 OR is_remote IS NULL)
-          AND date_posted >= ?
+    wow_current_start, wow_prior_start, ref_str = _wow_windows(ref_date)
+
+    # One grouped scan for metro and remote counts across all three windows.
+    # Metro counts exclude remote jobs; the Remote bucket is summed across groups.
+    rows = conn.execute("""
+        SELECT location_metro,
+               SUM(is_metro AND date_posted >= ?) as cnt,
+               SUM(is_metro AND date_posted >= ? AND date_posted <= ?) as wow_curr,
+               SUM(is_metro AND date_posted >= ? AND date_posted < ?) as wow_prev,
+               SUM(is_remote_job AND date_posted >= ?) as remote_cnt,
+               SUM(is_remote_job AND date_posted >= ? AND date_posted <= ?) as remote_curr,
+               SUM(is_remote_job AND date_posted >= ? AND date_posted < ?) as remote_prev
+        FROM (
+            SELECT location_metro, date_posted,
+                   (location_metro IS NOT NULL AND (is_remote = 0 OR is_remote IS NULL)) as is_metro,
+                   (is_remote = 1 OR location_type LIKE '%remote%') as is_remote_job
+            FROM vp_jobs
+            WHERE date_posted >= ?
+        )
         GROUP BY location_metro
         ORDER BY cnt DESC
-        LIMIT 10
-    """, (*VP_TIERS, cutoff)).fetchall()
-
-    # Total remote count
-    remote_count = conn.execute(f"""
-        SELECT COUNT(*) FROM jobs
-        WHERE is_active = 1
-          AND seniority_tier IN ({tier_placeholders})
-          AND (is_remote = 1 OR location_type LIKE '%remote%')
-          AND date_posted >= ?
-    """, (*VP_TIERS, cutoff)).fetchone()[0]
-
-    # WoW current 7 days — metro
-    wow_curr_metro = conn.execute(f"""
-        SELECT location_metro, COUNT(*) as cnt FROM jobs
-        WHERE is_active = 1
-          AND seniority_tier IN ({tier_placeholders})
-          AND location_metro IS NOT NULL
-          AND (is_remote = 0 OR is_remote IS NULL)
-          AND date_posted >= ? AND date_posted <= ?
-        GROUP BY location_metro
-    """, (*VP_TIERS, wow_current_start, ref_str)).fetchall()
-
-    # WoW prior 7 days — metro
-    wow_prev_metro = conn.execute(f"""
-        SELECT location_metro, COUNT(*) as cnt FROM jobs
-        WHERE is_active = 1
-          AND seniority_tier IN ({tier_placeholders})
-          AND location_metro IS NOT NULL
-          AND (is_remote = 0 OR is_remote IS NULL)
-          AND date_posted >= ? AND date_posted < ?
-        GROUP BY location_metro
-    """, (*VP_TIERS, wow_prior_start, wow_current_start)).fetchall()
-
-    # WoW remote
-    wow_curr_remote = conn.execute(f"""
-        SELECT COUNT(*) FROM jobs
-        WHERE is_active = 1
-          AND seniority_tier IN ({tier_placeholders})
-          AND (is_remote = 1 OR location_type LIKE '%remote%')
-          AND date_posted >= ? AND date_posted <= ?
-    """, (*VP_TIERS, wow_current_start, ref_str)).fetchone()[0]
+    """, (cutoff, wow_current_start, ref_str, wow_prior_start, wow_current_start,
+          cutoff, wow_current_start, ref_str, wow_prior_start, wow_current_start,
+          min(cutoff, wow_prior_start))).fetchall()
 
-    wow_prev_remote = conn.execute(f"""
-        SELECT COUNT(*) FROM jobs
-        WHERE is_active = 1
-          AND seniority_tier IN ({tier_placeholders})
-          AND (is_remote = 1 OR location_type LIKE '%remote%')
-          AND date_posted >= ? AND date_posted < ?
-    """, (*VP_TIERS, wow_prior_start, wow_current_start)).fetchone()[0]
+    remote_count = sum(r[4] or 0 for r in rows)
+    wow_curr_remote = sum(r[5] or 0 for r in rows)
+    wow_prev_remote = sum(r[6] or 0 for r in rows)
 
-    wow_curr_map = {r[0]: r[1] for r in wow_curr_metro}
-    wow_prev_map = {r[0]: r[1] for r in wow_prev_metro}
+    # Top 10 metros by full-window count
+    current_metro = [r for r in rows if r[0] is not None and r[1] > 0][:10]
 
     geo = []
-    for row in current_metro:
-        metro = row[0]
-        count = row[1]
-        wc = wow_curr_map.get(metro, 0)
-        wp = wow_prev_map.get(metro, 0)
+    for metro, count, wc, wp, *_ in current_metro:
         wow = round((wc - wp) / wp * 100) if wp > 0 else 0
         geo.append({
             "metro": metro,
@@ -731,89 +838,63 @@ def compute_geo_breakdown(conn, days=30):
     return geo[:8]
 
 
-def compute_company_stage(conn, days=7):
+def compute_company_stage(conn, days=7, ref_date=None):
     """Compute company stage distribution for VP+ roles."""
-    tier_placeholders = ",".join("?" for _ in VP_TIERS)
-    ref_date = _get_data_reference_date(conn)
+    _ensure_vp_jobs(conn)
+    ref_date = ref_date or _get_data_reference_date(conn)
     cutoff = (ref_date - timedelta(days=days)).strftime("%Y-%m-%d")
 
-    rows = conn.execute(f"""
-        SELECT company_stage, COUNT(*) as cnt FROM jobs
-        WHERE is_active = 1
-          AND seniority_tier IN ({tier_placeholders})
-          AND date_posted >= ?
-        GROUP BY company_stage
-    """, (*VP_TIERS, cutoff)).fetchall()
-
-    buckets = {
-        "Enterprise / Public": 0,
-        "Late Stage": 0,
-        "Growth": 0,
-        "Early Stage": 0,
-        "Unknown": 0,
-    }
-
-    total = 0
-    for row in rows:
-        stage_raw = (row[0] or "").lower().strip()
-        count = row[1]
-        total += count
-
-        mapped = STAGE_MAP.get(stage_raw)
-        if mapped:
-            buckets[mapped] += count
-        elif stage_raw:
-            # Try partial matching
-            if "enterprise" in stage_raw or "public" in stage_raw:
-                buckets["Enterprise / Public"] += count
-            elif "late" in stage_raw or "series c" in stage_raw or "series d" in stage_raw:
-                buckets["Late Stage"] += count
-            elif "growth" in stage_raw or "series a" in stage_raw or "series b" in stage_raw:
-                buckets["Growth"] += count
-            elif "early" in stage_raw or "seed" in stage_raw or "startup" in stage_raw:
-                buckets["Early Stage"] += count
-            else:
-                buckets["Unknown"] += count
-        else:
-            buckets["Unknown"] += count
+    # Stages are bucketed inside SQLite. Normalisation is ASCII-only: TRIM
+    # strips space and \t-\r, LOWER folds A-Z. Unlike str.strip().lower(), a
+    # stage padded with \x1c-\x1f, \x85 or Unicode spaces misses the exact
+    # STAGE_MAP match and falls through to the partial matches or Unknown
+    buckets = dict.fromkeys(STAGE_ORDER, 0)
+    buckets.update(conn.execute(f"""
+        SELECT {STAGE_BUCKET_SQL} AS bucket, SUM(cnt)
+        FROM (
+            SELECT LOWER(TRIM(company_stage, ' ' || char(9, 10, 11, 12, 13))) AS stage,
+                   COUNT(*) AS cnt
+            FROM vp_jobs
+            WHERE date_posted >= ?
+            GROUP BY company_stage
+        )
+        GROUP BY bucket
+    """, (cutoff,)))
+    total = sum(buckets.values())
 
     # Convert to percentages
     stages = []
-    for name in ["Enterprise / Public", "Late Stage", "Growth", "Early Stage", "Unknown"]:
+    for name in STAGE_ORDER:
         pct = round(buckets[name] / total * 100) if total > 0 else 0
         stages.append({"stage": name, "count": buckets[name], "pct": pct})
 
     return stages
 
 
-def compute_stack_trends(conn, days=7):
+def compute_stack_trends(conn, days=7, ref_date=None):
     """Compute top tools/stack mentioned in VP+ roles."""
-    tier_placeholders = ",".join("?" for _ in VP_TIERS)
-    ref_date = _get_data_reference_date(conn)
+    _ensure_vp_jobs(conn)
+    ref_date = ref_date or _get_data_reference_date(conn)
     cutoff = (ref_date - timedelta(days=days)).strftime("%Y-%m-%d")
 
-    rows = conn.execute(f"""
+    rows = conn.execute("""
         SELECT jt.tool_name, COUNT(DISTINCT jt.job_id) as cnt
         FROM job_tools jt
-        JOIN jobs j ON jt.job_id = j.id
-        WHERE j.is_active = 1
-          AND j.seniority_tier IN ({tier_placeholders})
-          AND j.date_posted >= ?
+        JOIN vp_jobs j ON jt.job_id = j.id
+        WHERE j.date_posted >= ?
           AND jt.tool_name IS NOT NULL
           AND jt.tool_name <> ''
           AND LOWER(jt.tool_name) <> '_none'
         GROUP BY jt.tool_name
         ORDER BY cnt DESC
         LIMIT 8
-    """, (*VP_TIERS, cutoff)).fetchall()
+    """, (cutoff,)).fetchall()
 
     # Get total VP+ roles this week for percentages
-    total = conn.execute(f"""
-        SELECT COUNT(*) FROM jobs
-        WHERE is_active = 1
-          AND seniority_tier IN ({tier_placeholders})
-          AND date_posted >= ?
-    """, (*VP_TIERS, cutoff)).fetchone()[0]
+    total = conn.execute("""
+        SELECT COUNT(*) FROM vp_jobs
+        WHERE date_posted >= ?
+    """, (cutoff,)).fetchone()[0]
 
     tools = []
     for row in rows:
@@ -830,50 +911,46 @@ def compute_summary_stats(leads, analytics_geo):
         return {"total": 0, "avg_salary": "$0K", "avg_score": 0, "growth_pct": 0,
                 "seniority": {}, "segment": {}}
 
-    # Average salary
-    salaries = [l.get("annual_salary_max") or l.get("annual_salary_min") or 0 for l in leads]
-    salaries = [s for s in salaries if s > 0]
-    avg_salary = int(sum(salaries) / len(salaries) / 1000) if salaries else 0
-
-    # Average score
-    avg_score = int(sum(l["score"] for l in leads) / total)
-
-    # Growth hire percentage
-    growth_count = 0
+    # One pass over the leads for salary, score, growth, seniority,
+    # segment and C-level tallies. Seniority and segment are tallied by raw
+    # id; display labels are applied afterwards to the few distinct ids.
+    salary_sum = salary_count = score_sum = growth_count = c_level_count = 0
+    tiers = Counter()
+    segment_ids = Counter()
     for lead in leads:
-        for sig in lead.get("signals", []):
-            if sig["signal_id"] == "growth_hire":
-                growth_count += 1
-                break
-    growth_pct = round(growth_count / total * 100)
+        salary = lead.get("annual_salary_max") or lead.get("annual_salary_min") or 0
+        if salary > 0:
+            salary_sum += salary
+            salary_count += 1
+        score_sum += lead["score"]
 
-    # Seniority breakdown
-    seniority = Counter()
-    for lead in leads:
         tier = lead.get("seniority_tier", "unknown")
-        display = SENIORITY_DISPLAY.get(tier, tier.replace("_", " ").title())
-        seniority[display] += 1
-
-    # Segment breakdown
-    segment_display = {
-        "enterprise": "Enterprise", "smb": "SMB", "mid_market": "Mid-Market",
-        "fortune_500": "Fortune 500", "startup": "Startup",
-    }
+        tiers[tier] += 1
+        if tier in ("c_level", "evp"):
+            c_level_count += 1
+
+        if "growth_hire" in lead_signal_ids(lead):
+            growth_count += 1
+        raw = next((sig["signal_id"] for sig in lead.get("signals", ())
+                    if sig["signal_type"] == "segment"), None)
+        if raw is not None:
+            segment_ids[raw] += 1
+
+    # Counters keep first-seen order, so most_common() ties rank as before
+    seniority = Counter()
+    for tier, count in tiers.items():
+        seniority[SENIORITY_DISPLAY.get(tier, pretty_label(tier))] += count
     segment = Counter()
-    for lead in leads:
-        for sig in lead.get("signals", []):
-            if sig["signal_type"] == "segment":
-                raw = sig["signal_id"]
-                display = segment_display.get(raw, raw.replace("_", " ").title())
-                segment[display] += 1
-                break
+    for raw, count in segment_ids.items():
+        segment[SEGMENT_DISPLAY.get(raw, pretty_label(raw))] += count
+
+    avg_salary = int(salary_sum / salary_count / 1000) if salary_count else 0
+    avg_score = int(score_sum / total)
+    growth_pct = round(growth_count / total * 100)
 
     seg_total = sum(segment.values()) or 1
     segment_pct = {k: round(v / seg_total * 100) for k, v in segment.most_common(4)}
 
-    # C-level count
-    c_level_count = sum(1 for l in leads if l.get("seniority_tier") in ("c_level", "evp"))
-
     return {
         "total": total,
         "avg_salary": f"${avg_salary}K",
@@ -888,33 +965,35 @@ def compute_summary_stats(leads, analytics_geo):
 
 def compute_remote_function_counts(conn, days=7):
     """Count remote VP+ roles by function_category for contextual stats."""
-    tier_placeholders = ",".join("?" for _ in VP_TIERS)
-    rows = conn.execute(f"""
+    _ensure_vp_jobs(conn)
+    return dict(conn.execute("""
         SELECT function_category, COUNT(*) as cnt
-        FROM jobs
-        WHERE seniority_tier IN ({tier_placeholders})
-          AND is_active = 1
-          AND (is_remote = 1 OR location_type LIKE '%remote%')
-          AND date(date_scraped) >= date('now', '-{days} days')
+        FROM vp_jobs
+        WHERE (is_remote = 1 OR location_type LIKE '%remote%')
+          AND date(date_scraped) >= date('now', ?)
           AND function_category IS NOT NULL
         GROUP BY function_category
-    """, VP_TIERS).fetchall()
-    return {r[0]: r[1] for r in rows}
+    """, (f"-{days} days",)))
 
 
-def compute_all_analytics(conn, lead_days=30):
+def compute_all_analytics(conn, lead_days=30, ref_date=None):
     """Compute all market analytics in one call.
 
     lead_days controls the lead selection window (passed from --days).
     Velocity/geo/companies always use 7-day windows for WoW comparison.
+    The data reference date is looked up once and shared by every section,
+    and every section aggregates the vp_jobs TEMP table materialized here,
+    so jobs is filtered once per connection rather than once per section.
     """
+    _ensure_vp_jobs(conn)
+    ref_date = ref_date or _get_data_reference_date(conn)
     return {
-        "salary_benchmarks": compute_salary_benchmarks(conn, days=14),
-        "industry_velocity": compute_industry_velocity(conn, days=lead_days),
-        "top_companies": compute_top_companies(conn, days=lead_days),
-        "geo_breakdown": compute_geo_breakdown(conn, days=lead_days),
-        "company_stage": compute_company_stage(conn, days=lead_days),
-        "stack_trends": compute_stack_trends(conn, days=lead_days),
+        "salary_benchmarks": compute_salary_benchmarks(conn, days=14, ref_date=ref_date),
+        "industry_velocity": compute_industry_velocity(conn, days=lead_days, ref_date=ref_date),
+        "top_companies": compute_top_companies(conn, days=lead_days, ref_date=ref_date),
+        "geo_breakdown": compute_geo_breakdown(conn, days=lead_days, ref_date=ref_date),
+        "company_stage": compute_company_stage(conn, days=lead_days, ref_date=ref_date),
+        "stack_trends": compute_stack_trends(conn, days=lead_days, ref_date=ref_date),
         "remote_function_counts": compute_remote_function_counts(conn, days=lead_days),
     }
 
@@ -924,53 +1003,75 @@ def compute_all_analytics(conn, lead_days=30):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-def generate_signal_note(lead):
-    """Generate a contextual signal note from lead data."""
-    signals = {s["signal_id"] for s in lead.get("signals", [])}
-    title = lead.get("title", "")
-    company = format_company_name(lead.get("company_name"))
-    stage = (lead.get("company_stage") or "").lower()
-    seniority = SENIORITY_DISPLAY.get(lead.get("seniority_tier", ""), "VP")
+# Bit per signal id that generate_signal_note() branches on
+SIGNAL_NOTE_BITS = {
+    "first_hire": 1, "reports_ceo": 2, "build_team": 4, "reports_cro": 8,
+    "growth_hire": 16, "immediate": 32, "turnaround": 64,
+}
+_NOTE_GROWTH = SIGNAL_NOTE_BITS["growth_hire"]
+_NOTE_IMMEDIATE = SIGNAL_NOTE_BITS["immediate"]
+_NOTE_TURNAROUND = SIGNAL_NOTE_BITS["turnaround"]
+
+# Lead fragment: first entry whose required bits are all set wins
+SIGNAL_NOTE_PRIMARY = [
+    (SIGNAL_NOTE_BITS["first_hire"], "First {title} hire — building function from scratch"),
+    (SIGNAL_NOTE_BITS["reports_ceo"] | SIGNAL_NOTE_BITS["build_team"], "Reports to CEO with team build mandate"),
+    (SIGNAL_NOTE_BITS["reports_ceo"], "Reports directly to CEO — high-visibility role"),
+    (SIGNAL_NOTE_BITS["reports_cro"] | SIGNAL_NOTE_BITS["build_team"], "Reports to CRO with team build mandate"),
+    (SIGNAL_NOTE_BITS["build_team"], "Team build mandate — scaling org"),
+]
+
+
+def generate_signal_note(lead, signal_ids=None):
+    """Generate a contextual signal note from lead data (and ``signal_ids`` if given)."""
+    mask = 0
+    for signal_id in lead_signal_ids(lead) if signal_ids is None else signal_ids:
+        mask |= SIGNAL_NOTE_BITS.get(signal_id, 0)
 
     fragments = []
 
-    if "first_hire" in signals:
-        fragments.append(f"First {title} hire — building function from scratch")
-    elif "reports_ceo" in signals and "build_team" in signals:
-        fragments.append("Reports to CEO with team build mandate")
-    elif "reports_ceo" in signals:
-        fragments.append("Reports directly to CEO — high-visibility role")
-    elif "reports_cro" in signals and "build_team" in signals:
-        fragments.append("Reports to CRO with team build mandate")
-    elif "build_team" in signals:
-        fragments.append("Team build mandate — scaling org")
-
-    if "growth_hire" in signals and not fragments:
+    for required, template in SIGNAL_NOTE_PRIMARY:
+        if mask & required == required:
+            fragments.append(template.format(title=lead.get("title", "")))
+            break
+
+    if mask & _NOTE_GROWTH and not fragments:
+        stage = (lead.get("company_stage") or "").lower()
         if "series" in stage or "growth" in stage:
             fragments.append(f"Growth hire at {stage.title()} company")
         else:
             fragments.append("Growth hire — expansion role")
 
-    if "immediate" in signals:
+    if mask & _NOTE_IMMEDIATE:
         fragments.append("Urgent fill — likely replacing departed leader")
 
-    if "turnaround" in signals:
+    if mask & _NOTE_TURNAROUND:
         fragments.append("Turnaround/transformation mandate")
 
     if not fragments:
-        if "growth_hire" in signals:
+        if mask & _NOTE_GROWTH:
             fragments.append("Growth hire")
         else:
+            seniority = SENIORITY_DISPLAY.get(lead.get("seniority_tier", ""), "VP")
             fragments.append(f"{seniority} role with strong signals")
 
     return " — ".join(fragments[:2])
 
 
-def get_contextual_stat(lead, geo_data, function_counts=None):
+def index_geo_by_metro(geo_data):
+    """Map metro -> geo_breakdown entry, keeping the first entry per metro."""
+    geo_by_metro = {}
+    for g in geo_data:
+        geo_by_metro.setdefault(g["metro"], g)
+    return geo_by_metro
+
+
+def get_contextual_stat(lead, geo_by_metro, function_counts=None):
     """Generate a contextual stat line for a lead card.
 
     Reframes from abundance ('1 of 375') to curation value
-    ('Top-scored of 375 screened').
+    ('Top-scored of 375 screened'). geo_by_metro comes from
+    index_geo_by_metro(), built once per render.
     """
     metro = lead.get("location_metro")
     is_remote = lead.get("is_remote")
@@ -981,14 +1082,14 @@ def get_contextual_stat(lead, geo_data, function_counts=None):
     if is_remote or (lead.get("location_type") or "").lower() == "remote":
         if function_counts and func in function_counts:
             return f"Top-scored of {function_counts[func]} remote {role_display or 'VP+'} roles screened"
-        for g in geo_data:
-            if g["metro"] == "Remote":
-                return f"Top-scored of {g['count']} remote VP+ roles screened"
+        g = geo_by_metro.get("Remote")
+        if g:
+            return f"Top-scored of {g['count']} remote VP+ roles screened"
 
     if metro:
-        for g in geo_data:
-            if g["metro"] == metro:
-                return f"Top-scored of {g['count']} VP+ roles in {metro}"
+        g = geo_by_metro.get(metro)
+        if g:
+            return f"Top-scored of {g['count']} VP+ roles in {metro}"
 
     return ""
 
@@ -1000,18 +1101,17 @@ def compute_repost_counts(conn):
     Multi-location postings within the SAME scrape are NOT counted as reposts.
     Returns a dict of (normalized_company, title) -> scrape_date_count.
     """
-    tier_placeholders = ",".join("?" for _ in VP_TIERS)
-    rows = conn.execute(f"""
+    _ensure_vp_jobs(conn)
+    # Stream the (company, title) groups straight into the dict
+    cursor = conn.execute("""
         SELECT LOWER(company_name_normalized), LOWER(title),
                COUNT(DISTINCT date(date_scraped)) as scrape_count
-        FROM jobs
-        WHERE seniority_tier IN ({tier_placeholders})
-          AND is_active = 1
-          AND company_name_normalized IS NOT NULL
+        FROM vp_jobs
+        WHERE company_name_normalized IS NOT NULL
         GROUP BY LOWER(company_name_normalized), LOWER(title)
         HAVING scrape_count > 1
-    """, VP_TIERS).fetchall()
-    return {(r[0], r[1]): r[2] for r in rows}
+    """)
+    return {(company, title): count for company, title, count in cursor}
 
 
 def deduplicate_leads(leads):
@@ -1020,18 +1120,16 @@ def deduplicate_leads(leads):
     When the same role is posted in multiple locations (common on Indeed),
     keep the highest-scored instance and track how many locations it appears in.
     """
+    # Sort first (stable, near-free when leads already arrive score-ranked) so
+    # the first instance of each key is its best and setdefault keeps it. The
+    # lowercased key is kept on the lead as _role_key for repost matching
     seen = {}  # (company_normalized, title) -> best lead
-    for lead in leads:
-        key = (
-            (lead.get("company_name_normalized") or "").lower(),
-            (lead.get("title") or "").lower(),
-        )
-        if key not in seen or lead["score"] > seen[key]["score"]:
-            seen[key] = lead
-
-    deduped = list(seen.values())
-    deduped.sort(key=lambda x: x["score"], reverse=True)
-    return deduped
+    for lead in sorted(leads, key=lambda x: x["score"], reverse=True):
+        company = lead.get("company_name_normalized") or ""
+        title = lead.get("title") or ""
+        key = lead["_role_key"] = (company.lower(), title.lower())
+        seen.setdefault(key, lead)
+    return list(seen.values())
 
 
 def get_best_job_url(lead):
@@ -1048,10 +1146,10 @@ def get_best_job_url(lead):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-def _xl_cell(ws, row, col, value, font=None, fill=None, alignment=None,
+def _xl_cell(ws, value, font=None, fill=None, alignment=None,
              border=None, number_format=None, hyperlink=None):
-    """Set cell value and styles."""
-    cell = ws.cell(row=row, column=col, value=value)
+    """Build a styled cell for appending to a write-only worksheet."""
+    cell = WriteOnlyCell(ws, value=value)
     if font:
         cell.font = font
     if fill:
@@ -1069,8 +1167,7 @@ def _xl_cell(ws, row, col, value, font=None, fill=None, alignment=None,
 
 def _build_xl_leads(wb, leads, ref_date=None):
     """Sheet 1: Top Leads — scored, color-coded, filterable."""
-    ws = wb.active
-    ws.title = "Top Leads"
+    ws = wb.create_sheet("Top Leads")
     ws.sheet_properties.tabColor = AMBER
 
     columns = [
@@ -1081,142 +1178,144 @@ def _build_xl_leads(wb, leads, ref_date=None):
         ("Industry", 20), ("Signal Note", 54),
     ]
 
+    # Write-only sheets take layout before the first row is appended
     for i, (_, width) in enumerate(columns, 1):
         ws.column_dimensions[get_column_letter(i)].width = width
+    ws.freeze_panes = "A2"
+    ws.sheet_view.zoomScale = 100
 
-    for i, (header, _) in enumerate(columns, 1):
-        _xl_cell(ws, 1, i, header,
-                 font=XL_HEADER_FONT, fill=XL_HEADER_FILL,
-                 alignment=XL_CENTER, border=XL_THIN_BORDER)
     ws.row_dimensions[1].height = 32
+    ws.append([
+        _xl_cell(ws, header, font=XL_HEADER_FONT, fill=XL_HEADER_FILL,
+                 alignment=XL_CENTER, border=XL_THIN_BORDER)
+        for header, _ in columns
+    ])
 
     now = ref_date or datetime.now()
 
+    # Rows are rendered and appended one at a time, so `leads` may be any
+    # iterable; the filter range is written in the sheet tail on save and
+    # can be set once the row count is known.
+    row = 1
     for idx, lead in enumerate(leads):
         row = idx + 2
         ws.row_dimensions[row].height = 30
+        ws.append(_xl_lead_cells(ws, idx, lead, now))
+    ws.auto_filter.ref = f"A1:Q{row}"
+
+
+@lru_cache(maxsize=None)
+def _xl_seniority_style(tier):
+    """(label, font) for a seniority tier in the Top Leads sheet."""
+    seniority = pretty_label(tier)
+    if "C Level" in seniority or "C-Level" in seniority:
+        return "C-Level", XL_SEN_FONT_CLEVEL
+    if seniority == "Svp":
+        return "SVP", XL_SEN_FONT_SVP_EVP
+    if seniority == "Evp":
+        return "EVP", XL_SEN_FONT_SVP_EVP
+    if seniority == "Vp":
+        return "VP", XL_BODY_FONT
+    return seniority, XL_BODY_FONT
+
+
+def _xl_lead_cells(ws, idx, lead, now):
+    """Render one Top Leads row as a list of write-only cells."""
+    row_fill = XL_ALT_ROW if idx % 2 == 1 else None
+
+    score = lead["score"]
+    if score >= 40:
+        score_fill = XL_SCORE_GOLD
+        score_font = XL_SCORE_FONT_GOLD
+    elif score >= 30:
+        score_fill = XL_SCORE_BLUE
+        score_font = XL_SCORE_FONT_BLUE
+    elif score >= 20:
+        score_fill = XL_SCORE_LIGHT
+        score_font = XL_SCORE_FONT_GOLD
+    else:
+        score_fill = XL_SCORE_GRAY
+        score_font = XL_SCORE_FONT_GRAY
 
-        row_fill = XL_ALT_ROW if idx % 2 == 1 else None
-
-        score = lead["score"]
-        if score >= 40:
-            score_fill = XL_SCORE_GOLD
-            score_font = Font(name="Plus Jakarta Sans", bold=True, color=DARK_TEXT, size=11)
-        elif score >= 30:
-            score_fill = XL_SCORE_BLUE
-            score_font = Font(name="Plus Jakarta Sans", bold=True, color=WHITE, size=11)
-        elif score >= 20:
-            score_fill = XL_SCORE_LIGHT
-            score_font = Font(name="Plus Jakarta Sans", bold=True, color=DARK_TEXT, size=11)
-        else:
-            score_fill = XL_SCORE_GRAY
-            score_font = Font(name="Plus Jakarta Sans", color="555555", size=11)
+    # Days since posted
+    days_ago = days_since_posted(lead.get("date_posted"), now) or 0
 
-        # Days since posted
-        date_posted = lead.get("date_posted")
-        if date_posted:
-            try:
-                posted_dt = datetime.strptime(str(date_posted)[:10], "%Y-%m-%d")
-                days_ago = (now - posted_dt).days
-            except ValueError:
-                days_ago = 0
-        else:
-            days_ago = 0
+    if days_ago <= 2:
+        days_font = XL_DAYS_FONT_RED
+    elif days_ago <= 4:
+        days_font = XL_DAYS_FONT_AMBER
+    else:
+        days_font = XL_DAYS_FONT_GRAY
+
+    seniority, sen_font = _xl_seniority_style(lead.get("seniority_tier") or "")
+
+    # Signals string and note (reports_cro filtered for non-sales)
+    signal_text = lead_signal_text(lead)
+    signals_str = signal_text.summary
+    note = signal_text.note
+    fee = estimate_placement_fee(lead)
+    repost_count = lead.get("repost_count", 0)
+    search_firm = lead.get("is_search_firm")
+    repost_parts = []
+    if repost_count > 1:
+        repost_parts.append(f"REPOSTED {repost_count}x")
+    if search_firm:
+        repost_parts.append("RETAINED SEARCH")
+    repost_text = " | ".join(repost_parts)
+    if not repost_parts:
+        repost_font = XL_BODY_FONT
+    elif search_firm:
+        repost_font = XL_REPOST_FONT_RETAINED
+    else:
+        repost_font = XL_REPOST_FONT_REPOST
+
+    company_url = lead.get("company_url") or ""
+    industry = lead.get("company_industry") or ""
+
+    values = [
+        (idx + 1, XL_CENTER, XL_BODY_FONT, row_fill),
+        (score, XL_CENTER, score_font, score_fill),
+        (lead.get("title") or "Untitled", XL_LEFT, XL_BODY_BOLD, row_fill),
+        (format_company_name(lead.get("company_name")), XL_LEFT, XL_BODY_FONT, row_fill),
+        (clean_location(lead), XL_LEFT, XL_BODY_FONT, row_fill),
+        (lead.get("annual_salary_min"), XL_RIGHT, XL_BODY_FONT, row_fill),
+        (lead.get("annual_salary_max"), XL_RIGHT, XL_BODY_FONT, row_fill),
+        (fee or "", XL_CENTER, XL_FEE_FONT, row_fill),
+        (seniority, XL_CENTER, sen_font, row_fill),
+        (signals_str, XL_LEFT_WRAP, XL_BODY_FONT, row_fill),
+        (days_ago, XL_CENTER, days_font, row_fill),
+        (repost_text, XL_CENTER, repost_font, row_fill),
+        ("Apply", XL_CENTER, XL_LINK_FONT, row_fill),
+        ("Website", XL_CENTER, XL_LINK_FONT, row_fill) if company_url else ("", XL_CENTER, XL_BODY_FONT, row_fill),
+        (lead.get("company_num_employees") or "", XL_RIGHT, XL_BODY_FONT, row_fill),
+        (INDUSTRY_MAP.get(industry, industry), XL_LEFT, XL_BODY_FONT, row_fill),
+        (note, XL_LEFT_WRAP, XL_BODY_FONT, row_fill),
+    ]
 
-        if days_ago <= 2:
-            days_font = Font(name="Plus Jakarta Sans", bold=True, color=RED_FONT, size=10)
-        elif days_ago <= 4:
-            days_font = Font(name="Plus Jakarta Sans", bold=True, color=AMBER_FONT, size=10)
-        else:
-            days_font = Font(name="Plus Jakarta Sans", color=GRAY_FONT, size=10)
-
-        seniority = (lead.get("seniority_tier") or "").replace("_", " ").title()
-        if "C Level" in seniority or "C-Level" in seniority:
-            seniority = "C-Level"
-            sen_font = Font(name="Plus Jakarta Sans", bold=True, color=AMBER, size=10)
-        elif seniority == "Svp":
-            seniority = "SVP"
-            sen_font = Font(name="Plus Jakarta Sans", bold=True, color="5B8DEF", size=10)
-        elif seniority == "Evp":
-            seniority = "EVP"
-            sen_font = Font(name="Plus Jakarta Sans", bold=True, color="5B8DEF", size=10)
-        else:
-            if seniority == "Vp":
-                seniority = "VP"
-            sen_font = XL_BODY_FONT
-
-        # Build signals string (filter reports_cro for non-sales)
-        filtered_lead = {**lead, "signals": filter_signals_for_role(lead)}
-        signal_parts = []
-        hiring_sig = extract_hiring_signal(filtered_lead)
-        team_sig = extract_team_structure(filtered_lead)
-        if hiring_sig:
-            signal_parts.append(hiring_sig)
-        if team_sig:
-            signal_parts.extend(team_sig.split(", "))
-        extras = extract_extra_signals(lead)
-        for key in ("segment", "comp", "motion"):
-            if key in extras:
-                signal_parts.extend(extras[key])
-        signals_str = ", ".join(signal_parts)
+    # Styles assigned inline rather than through _xl_cell: this runs per
+    # cell of every lead row, and font/alignment/border are always set
+    cells = []
+    for col_idx, (val, align, font, fill) in enumerate(values, 1):
+        cell = WriteOnlyCell(ws, value=val)
+        cell.font = font
+        cell.alignment = align
+        cell.border = XL_THIN_BORDER
+        if fill:
+            cell.fill = fill
+        if val and col_idx in (6, 7):
+            cell.number_format = "$#,##0"
+        cells.append(cell)
 
-        note = generate_signal_note(filtered_lead)
-        fee = estimate_placement_fee(lead)
-        repost_count = lead.get("repost_count", 0)
-        repost_parts = []
-        if repost_count > 1:
-            repost_parts.append(f"REPOSTED {repost_count}x")
-        if lead.get("is_search_firm"):
-            repost_parts.append("RETAINED SEARCH")
-        repost_text = " | ".join(repost_parts)
-        repost_font = Font(name="Plus Jakarta Sans", bold=True, color="7C3AED" if lead.get("is_search_firm") else "856404", size=10) if repost_parts else XL_BODY_FONT
-
-        values = [
-            (idx + 1, XL_CENTER, XL_BODY_FONT, row_fill),
-            (score, XL_CENTER, score_font, score_fill),
-            (lead.get("title") or "Untitled", XL_LEFT, XL_BODY_BOLD, row_fill),
-            (format_company_name(lead.get("company_name")), XL_LEFT, XL_BODY_FONT, row_fill),
-            (clean_location(lead), XL_LEFT, XL_BODY_FONT, row_fill),
-            (lead.get("annual_salary_min"), XL_RIGHT, XL_BODY_FONT, row_fill),
-            (lead.get("annual_salary_max"), XL_RIGHT, XL_BODY_FONT, row_fill),
-            (fee or "", XL_CENTER, Font(name="Plus Jakarta Sans", bold=True, color="2E7D32", size=10), row_fill),
-            (seniority, XL_CENTER, sen_font, row_fill),
-            (signals_str, XL_LEFT_WRAP, XL_BODY_FONT, row_fill),
-            (days_ago, XL_CENTER, days_font, row_fill),
-            (repost_text, XL_CENTER, repost_font, row_fill),
-            ("Apply", XL_CENTER, XL_LINK_FONT, row_fill),
-            ("Website", XL_CENTER, XL_LINK_FONT, row_fill) if lead.get("company_url") else ("", XL_CENTER, XL_BODY_FONT, row_fill),
-            (lead.get("company_num_employees") or "", XL_RIGHT, XL_BODY_FONT, row_fill),
-            (INDUSTRY_MAP.get(lead.get("company_industry") or "", lead.get("company_industry") or ""), XL_LEFT, XL_BODY_FONT, row_fill),
-            (note, XL_LEFT_WRAP, XL_BODY_FONT, row_fill),
-        ]
+    # Apply hyperlink (col 13)
+    job_url = get_best_job_url(lead)
+    if job_url and job_url != "#":
+        cells[12].hyperlink = job_url
 
-        for col_idx, (val, align, font, fill) in enumerate(values, 1):
-            cell = _xl_cell(ws, row, col_idx, val,
-                            font=font, fill=fill, alignment=align,
-                            border=XL_THIN_BORDER)
-            if col_idx in (6, 7) and val:
-                cell.number_format = '$#,##0'
-
-        # Apply hyperlink (col 13)
-        job_url = get_best_job_url(lead)
-        if job_url and job_url != "#":
-            apply_cell = ws.cell(row=row, column=13)
-            apply_cell.hyperlink = job_url
-            apply_cell.value = "Apply"
-            apply_cell.font = XL_LINK_FONT
-
-        # Company website hyperlink (col 14)
-        company_url = lead.get("company_url") or ""
-        if company_url:
-            co_cell = ws.cell(row=row, column=14)
-            co_cell.hyperlink = company_url
-            co_cell.value = "Website"
-            co_cell.font = XL_LINK_FONT
+    # Company website hyperlink (col 14)
+    if company_url:
+        cells[13].hyperlink = company_url
 
-    ws.auto_filter.ref = f"A1:Q{len(leads) + 1}"
-    ws.freeze_panes = "A2"
-    ws.sheet_view.zoomScale = 100
+    return cells
 
 
 def _build_xl_intel(wb, analytics, leads, date_str):
@@ -1224,242 +1323,214 @@ def _build_xl_intel(wb, analytics, leads, date_str):
     ws = wb.create_sheet("Market Intel")
     ws.sheet_properties.tabColor = "5B8DEF"
 
-    col_widths = {1: 4, 2: 30, 3: 14, 4: 14, 5: 14, 6: 16, 7: 4, 8: 30, 9: 14, 10: 14}
+    # Write-only sheets take layout before the first row is appended
+    col_widths = {1: 4, 2: 30, 3: 14, 4: 14, 5: 14, 6: 16, 7: 4, 8: 14, 9: 14, 10: 14}
     for col, width in col_widths.items():
         ws.column_dimensions[get_column_letter(col)].width = width
+    ws.freeze_panes = "A2"
+    ws.sheet_view.showGridLines = False
 
     r = 1
     total_leads = len(leads)
 
+    def emit(cells=(), height=None, merge=None):
+        """Append row r (column A left blank), optionally merged and sized."""
+        nonlocal r
+        if merge:
+            ws.merged_cells.add(f"{merge[0]}{r}:{merge[1]}{r}")
+        if height:
+            ws.row_dimensions[r].height = height
+        ws.append([None, *cells])
+        r += 1
+
+    def skip(rows):
+        nonlocal r
+        for _ in range(rows):
+            ws.append([])
+        r += rows
+
+    def section(title, width):
+        """Amber-on-navy section header cells, `width` columns wide."""
+        return [_xl_cell(ws, title,
+                         font=XL_INTEL_SECTION_FONT,
+                         fill=XL_SECTION_FILL,
+                         alignment=Alignment(horizontal="left", vertical="center"))] + [
+            _xl_cell(ws, None, fill=XL_SECTION_FILL) for _ in range(width - 1)
+        ]
+
+    def headers(labels):
+        return [_xl_cell(ws, h, font=XL_HEADER_FONT, fill=XL_HEADER_FILL,
+                         alignment=XL_CENTER, border=XL_THIN_BORDER) for h in labels]
+
     # Title bar
-    ws.merge_cells(f"B{r}:F{r}")
     title_fill = PatternFill(start_color=NAVY, end_color=NAVY, fill_type="solid")
-    _xl_cell(ws, r, 2,
-             f"ExecSignals  \u2014  Market Intelligence Brief  |  Week of {date_str}",
-             font=Font(name="DM Serif Display", bold=True, color=AMBER, size=14),
-             fill=title_fill,
-             alignment=Alignment(horizontal="left", vertical="center"))
-    for c in range(3, 7):
-        _xl_cell(ws, r, c, None, fill=title_fill)
-    ws.row_dimensions[r].height = 42
-    r += 1
+    emit([_xl_cell(ws,
+                   f"ExecSignals  \u2014  Market Intelligence Brief  |  Week of {date_str}",
+                   font=XL_INTEL_TITLE_FONT,
+                   fill=title_fill,
+                   alignment=Alignment(horizontal="left", vertical="center"))]
+         + [_xl_cell(ws, None, fill=title_fill) for _ in range(3, 7)],
+         height=42, merge=("B", "F"))
 
     # Subtitle
-    ws.merge_cells(f"B{r}:F{r}")
-    _xl_cell(ws, r, 2,
-             f"VP+ hiring intelligence  |  {total_leads} new VP+ roles this week",
-             font=Font(name="Plus Jakarta Sans", italic=True, color=GRAY_FONT, size=9),
-             alignment=XL_LEFT)
-    ws.row_dimensions[r].height = 20
-    r += 2
+    emit([_xl_cell(ws,
+                   f"VP+ hiring intelligence  |  {total_leads} new VP+ roles this week",
+                   font=XL_INTEL_NOTE_FONT,
+                   alignment=XL_LEFT)],
+         height=20, merge=("B", "F"))
+    skip(1)
 
     # ── SALARY BENCHMARKS ──
     benchmarks = analytics["salary_benchmarks"]
-    ws.merge_cells(f"B{r}:F{r}")
-    _xl_cell(ws, r, 2, "  SALARY BENCHMARKS \u2014 VP+ ROLES",
-             font=Font(name="Plus Jakarta Sans", bold=True, color=AMBER, size=12),
-             fill=XL_SECTION_FILL,
-             alignment=Alignment(horizontal="left", vertical="center"))
-    for c in range(3, 7):
-        _xl_cell(ws, r, c, None, fill=XL_SECTION_FILL)
-    ws.row_dimensions[r].height = 32
-    r += 1
-
-    for i, h in enumerate(["Role", "P25", "Median", "P75", "4-Week Trend"]):
-        _xl_cell(ws, r, i + 2, h, font=XL_HEADER_FONT, fill=XL_HEADER_FILL,
-                 alignment=XL_CENTER, border=XL_THIN_BORDER)
-    ws.row_dimensions[r].height = 28
-    r += 1
+    emit(section("  SALARY BENCHMARKS \u2014 VP+ ROLES", 5), height=32, merge=("B", "F"))
+    emit(headers(["Role", "P25", "Median", "P75", "4-Week Trend"]), height=28)
 
     for idx, b in enumerate(benchmarks):
         fill = XL_ALT_ROW if idx % 2 == 1 else None
         trend = b["trend_pct"]
         if trend > 0:
-            trend_font = Font(name="Plus Jakarta Sans", bold=True, color=GREEN_FONT, size=10)
+            trend_font = XL_TREND_FONT_UP
             trend_display = f"\u25B2 +{trend}%"
         elif trend < 0:
-            trend_font = Font(name="Plus Jakarta Sans", bold=True, color=RED_FONT, size=10)
+            trend_font = XL_TREND_FONT_DOWN
             trend_display = f"\u25BC {trend}%"
         else:
             trend_font = XL_BODY_FONT
             trend_display = f"\u25AC 0%"
 
-        for ci, (v, al, fnt) in enumerate([
-            (b["role"], XL_LEFT, XL_BODY_BOLD),
-            (b["p25"], XL_RIGHT, XL_BODY_FONT),
-            (b["median"], XL_RIGHT, Font(name="Plus Jakarta Sans", bold=True, color=DARK_TEXT, size=11)),
-            (b["p75"], XL_RIGHT, XL_BODY_FONT),
-            (trend_display, XL_CENTER, trend_font),
-        ]):
-            _xl_cell(ws, r, ci + 2, v, font=fnt, fill=fill, alignment=al, border=XL_THIN_BORDER)
-        ws.row_dimensions[r].height = 26
-        r += 1
+        emit([
+            _xl_cell(ws, v, font=fnt, fill=fill, alignment=al, border=XL_THIN_BORDER)
+            for v, al, fnt in [
+                (b["role"], XL_LEFT, XL_BODY_BOLD),
+                (b["p25"], XL_RIGHT, XL_BODY_FONT),
+                (b["median"], XL_RIGHT, XL_INTEL_FIGURE_FONT),
+                (b["p75"], XL_RIGHT, XL_BODY_FONT),
+                (trend_display, XL_CENTER, trend_font),
+            ]
+        ], height=26)
 
-    r += 2
+    skip(2)
 
     # ── HIRING VELOCITY ──
     velocity = analytics["industry_velocity"]
-    ws.merge_cells(f"B{r}:F{r}")
-    _xl_cell(ws, r, 2, "  HIRING VELOCITY BY INDUSTRY",
-             font=Font(name="Plus Jakarta Sans", bold=True, color=AMBER, size=12),
-             fill=XL_SECTION_FILL,
-             alignment=Alignment(horizontal="left", vertical="center"))
-    for c in range(3, 7):
-        _xl_cell(ws, r, c, None, fill=XL_SECTION_FILL)
-    ws.row_dimensions[r].height = 32
-    r += 1
-
-    for i, h in enumerate(["Industry", "VP+ Openings This Week", "WoW Change", "", ""]):
-        _xl_cell(ws, r, i + 2, h, font=XL_HEADER_FONT, fill=XL_HEADER_FILL,
-                 alignment=XL_CENTER, border=XL_THIN_BORDER)
-    ws.row_dimensions[r].height = 28
-    r += 1
+    emit(section("  HIRING VELOCITY BY INDUSTRY", 5), height=32, merge=("B", "F"))
+    emit(headers(["Industry", "VP+ Openings This Week", "WoW Change", "", ""]), height=28)
 
     for idx, v in enumerate(velocity):
         fill = XL_ALT_ROW if idx % 2 == 1 else None
         wow = v["wow_pct"]
         if wow > 0:
-            wow_font = Font(name="Plus Jakarta Sans", bold=True, color=GREEN_FONT, size=10)
+            wow_font = XL_TREND_FONT_UP
             wow_display = f"\u25B2 +{wow}%"
         elif wow < 0:
-            wow_font = Font(name="Plus Jakarta Sans", bold=True, color=RED_FONT, size=10)
+            wow_font = XL_TREND_FONT_DOWN
             wow_display = f"\u25BC {wow}%"
         else:
             wow_font = XL_BODY_FONT
             wow_display = "0%"
 
-        _xl_cell(ws, r, 2, v["industry"], font=XL_BODY_BOLD, fill=fill,
-                 alignment=XL_LEFT, border=XL_THIN_BORDER)
-        _xl_cell(ws, r, 3, v["count"],
-                 font=Font(name="Plus Jakarta Sans", bold=True, color=DARK_TEXT, size=11),
-                 fill=fill, alignment=XL_CENTER, border=XL_THIN_BORDER)
-        _xl_cell(ws, r, 4, wow_display, font=wow_font, fill=fill,
-                 alignment=XL_CENTER, border=XL_THIN_BORDER)
-        _xl_cell(ws, r, 5, None, fill=fill, border=XL_THIN_BORDER)
-        _xl_cell(ws, r, 6, None, fill=fill, border=XL_THIN_BORDER)
-        ws.row_dimensions[r].height = 26
-        r += 1
+        emit([
+            _xl_cell(ws, v["industry"], font=XL_BODY_BOLD, fill=fill,
+                     alignment=XL_LEFT, border=XL_THIN_BORDER),
+            _xl_cell(ws, v["count"],
+                     font=XL_INTEL_FIGURE_FONT,
+                     fill=fill, alignment=XL_CENTER, border=XL_THIN_BORDER),
+            _xl_cell(ws, wow_display, font=wow_font, fill=fill,
+                     alignment=XL_CENTER, border=XL_THIN_BORDER),
+            _xl_cell(ws, None, fill=fill, border=XL_THIN_BORDER),
+            _xl_cell(ws, None, fill=fill, border=XL_THIN_BORDER),
+        ], height=26)
 
-    r += 2
+    skip(2)
 
     # ── TOP COMPANIES + GEO (side by side) ──
     companies = analytics["top_companies"]
     geo = analytics["geo_breakdown"]
 
-    ws.merge_cells(f"B{r}:D{r}")
-    _xl_cell(ws, r, 2, "  TOP HIRING COMPANIES",
-             font=Font(name="Plus Jakarta Sans", bold=True, color=AMBER, size=12),
-             fill=XL_SECTION_FILL,
-             alignment=Alignment(horizontal="left", vertical="center"))
-    for c in [3, 4]:
-        _xl_cell(ws, r, c, None, fill=XL_SECTION_FILL)
-
-    ws.merge_cells(f"F{r}:H{r}")
-    _xl_cell(ws, r, 6, "  GEO BREAKDOWN",
-             font=Font(name="Plus Jakarta Sans", bold=True, color=AMBER, size=12),
-             fill=XL_SECTION_FILL,
-             alignment=Alignment(horizontal="left", vertical="center"))
-    for c in [7, 8]:
-        _xl_cell(ws, r, c, None, fill=XL_SECTION_FILL)
-    ws.column_dimensions["H"].width = 14
-    ws.row_dimensions[r].height = 32
-    r += 1
-
-    for i, h in enumerate(["Company", "VP+ Roles", ""]):
-        _xl_cell(ws, r, i + 2, h, font=XL_HEADER_FONT, fill=XL_HEADER_FILL,
-                 alignment=XL_CENTER, border=XL_THIN_BORDER)
-    for i, h in enumerate(["Metro Area", "VP+ Roles", "WoW"]):
-        _xl_cell(ws, r, i + 6, h, font=XL_HEADER_FONT, fill=XL_HEADER_FILL,
-                 alignment=XL_CENTER, border=XL_THIN_BORDER)
-    ws.row_dimensions[r].height = 28
-    r += 1
+    ws.merged_cells.add(f"B{r}:D{r}")
+    emit(section("  TOP HIRING COMPANIES", 3) + [None] + section("  GEO BREAKDOWN", 3),
+         height=32, merge=("F", "H"))
+    emit(headers(["Company", "VP+ Roles", ""]) + [None] + headers(["Metro Area", "VP+ Roles", "WoW"]),
+         height=28)
 
     max_rows = max(len(companies), len(geo))
     for idx in range(max_rows):
         fill = XL_ALT_ROW if idx % 2 == 1 else None
-        ws.row_dimensions[r].height = 26
+        cells = [None] * 7  # columns B..H
 
         if idx < len(companies):
             comp = companies[idx]
             name = format_company_name(comp["company"])
             if comp["is_new"]:
                 name += " \u2605"  # star for new
-            _xl_cell(ws, r, 2, name, font=XL_BODY_BOLD, fill=fill,
-                     alignment=XL_LEFT, border=XL_THIN_BORDER)
-            _xl_cell(ws, r, 3, comp["count"],
-                     font=Font(name="Plus Jakarta Sans", bold=True, color=DARK_TEXT, size=11),
-                     fill=fill, alignment=XL_CENTER, border=XL_THIN_BORDER)
-            _xl_cell(ws, r, 4, None, fill=fill, border=XL_THIN_BORDER)
+            cells[0] = _xl_cell(ws, name, font=XL_BODY_BOLD, fill=fill,
+                                alignment=XL_LEFT, border=XL_THIN_BORDER)
+            cells[1] = _xl_cell(ws, comp["count"],
+                                font=XL_INTEL_FIGURE_FONT,
+                                fill=fill, alignment=XL_CENTER, border=XL_THIN_BORDER)
+            cells[2] = _xl_cell(ws, None, fill=fill, border=XL_THIN_BORDER)
 
         if idx < len(geo):
             g = geo[idx]
-            _xl_cell(ws, r, 6, g["metro"], font=XL_BODY_BOLD, fill=fill,
-                     alignment=XL_LEFT, border=XL_THIN_BORDER)
-            _xl_cell(ws, r, 7, g["count"],
-                     font=Font(name="Plus Jakarta Sans", bold=True, color=DARK_TEXT, size=11),
-                     fill=fill, alignment=XL_CENTER, border=XL_THIN_BORDER)
+            cells[4] = _xl_cell(ws, g["metro"], font=XL_BODY_BOLD, fill=fill,
+                                alignment=XL_LEFT, border=XL_THIN_BORDER)
+            cells[5] = _xl_cell(ws, g["count"],
+                                font=XL_INTEL_FIGURE_FONT,
+                                fill=fill, alignment=XL_CENTER, border=XL_THIN_BORDER)
             wow = g["wow_pct"]
             if wow > 0:
-                wow_font = Font(name="Plus Jakarta Sans", color=GREEN_FONT, size=10)
+                wow_font = XL_WOW_FONT_UP
                 wow_d = f"+{wow}%"
             elif wow < 0:
-                wow_font = Font(name="Plus Jakarta Sans", color=RED_FONT, size=10)
+                wow_font = XL_WOW_FONT_DOWN
                 wow_d = f"{wow}%"
             else:
-                wow_font = Font(name="Plus Jakarta Sans", color=GRAY_FONT, size=10)
+                wow_font = XL_WOW_FONT_FLAT
                 wow_d = "0%"
-            _xl_cell(ws, r, 8, wow_d, font=wow_font, fill=fill,
-                     alignment=XL_CENTER, border=XL_THIN_BORDER)
+            cells[6] = _xl_cell(ws, wow_d, font=wow_font, fill=fill,
+                                alignment=XL_CENTER, border=XL_THIN_BORDER)
 
-        r += 1
+        emit(cells, height=26)
 
-    r += 2
+    skip(2)
 
     # ── KEY TAKEAWAYS (auto-generated) ──
-    ws.merge_cells(f"B{r}:H{r}")
-    _xl_cell(ws, r, 2, "  THIS WEEK'S KEY TAKEAWAYS",
-             font=Font(name="Plus Jakarta Sans", bold=True, color=AMBER, size=12),
-             fill=XL_SECTION_FILL,
-             alignment=Alignment(horizontal="left", vertical="center"))
-    for c in range(3, 9):
-        _xl_cell(ws, r, c, None, fill=XL_SECTION_FILL)
-    ws.row_dimensions[r].height = 32
-    r += 1
+    emit(section("  THIS WEEK'S KEY TAKEAWAYS", 7), height=32, merge=("B", "H"))
 
     takeaways = _generate_takeaways(leads, analytics)
     for tk in takeaways:
-        ws.merge_cells(f"B{r}:H{r}")
-        _xl_cell(ws, r, 2, f"\u25CF  {tk}",
-                 font=Font(name="Plus Jakarta Sans", color=DARK_TEXT, size=10),
-                 alignment=Alignment(horizontal="left", vertical="center", wrap_text=True))
-        for c in range(3, 9):
-            _xl_cell(ws, r, c, None)
-        ws.row_dimensions[r].height = 24
-        r += 1
+        emit([_xl_cell(ws, f"\u25CF  {tk}",
+                       font=XL_BODY_FONT,
+                       alignment=Alignment(horizontal="left", vertical="center", wrap_text=True))],
+             height=24, merge=("B", "H"))
 
-    r += 2
+    skip(2)
 
     # Footer
-    ws.merge_cells(f"B{r}:H{r}")
-    _xl_cell(ws, r, 2,
-             f"ExecSignals  |  The Monday Brief  |  execsignals.com  |  {total_leads} VP+ roles scored",
-             font=Font(name="Plus Jakarta Sans", italic=True, color=GRAY_FONT, size=9),
-             alignment=XL_LEFT)
-    r += 1
-    ws.merge_cells(f"B{r}:H{r}")
-    _xl_cell(ws, r, 2,
-             "Confidential \u2014 for subscriber use only. Do not redistribute.",
-             font=Font(name="Plus Jakarta Sans", italic=True, color=RED_FONT, size=9),
-             alignment=XL_LEFT)
-
-    ws.freeze_panes = "A2"
-    ws.sheet_view.showGridLines = False
+    emit([_xl_cell(ws,
+                   f"ExecSignals  |  The Monday Brief  |  execsignals.com  |  {total_leads} VP+ roles scored",
+                   font=XL_INTEL_NOTE_FONT,
+                   alignment=XL_LEFT)],
+         merge=("B", "H"))
+    emit([_xl_cell(ws,
+                   "Confidential \u2014 for subscriber use only. Do not redistribute.",
+                   font=XL_INTEL_WARNING_FONT,
+                   alignment=XL_LEFT)],
+         merge=("B", "H"))
 
 
 def _generate_takeaways(leads, analytics):
     """Auto-generate key takeaways from analytics data."""
     takeaways = []
 
+    # C-level and Build Team tallies in one pass over the leads
+    c_level_count = build_team_count = 0
+    for l in leads:
+        if l.get("seniority_tier") == "c_level":
+            c_level_count += 1
+        if "build_team" in lead_signal_ids(l):
+            build_team_count += 1
+
     # Top velocity industry
     velocity = analytics.get("industry_velocity", [])
     if velocity:
@@ -1479,7 +1550,6 @@ def _generate_takeaways(leads, analytics):
         )
 
     # C-level count
-    c_level_count = sum(1 for l in leads if l.get("seniority_tier") == "c_level")
     if c_level_count >= 2:
         takeaways.append(
             f"{c_level_count} C-Level roles posted this week — "
@@ -1496,10 +1566,6 @@ def _generate_takeaways(leads, analytics):
         )
 
     # Build Team signal prevalence
-    build_team_count = sum(
-        1 for l in leads
-        if any(s["signal_id"] == "build_team" for s in l.get("signals", []))
-    )
     if build_team_count >= 3:
         pct = round(build_team_count / len(leads) * 100)
         takeaways.append(
@@ -1520,7 +1586,7 @@ def _generate_takeaways(leads, analytics):
 
 def generate_excel(leads, analytics, output_path, date_str, ref_date=None):
     """Generate the full Excel workbook."""
-    wb = openpyxl.Workbook()
+    wb = openpyxl.Workbook(write_only=True)
     _build_xl_leads(wb, leads, ref_date=ref_date)
     _build_xl_intel(wb, analytics, leads, date_str)
     wb.save(output_path)
@@ -1532,74 +1598,188 @@ def generate_excel(leads, analytics, output_path, date_str, ref_date=None):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-def generate_market_intel_html(analytics, summary, date_str):
-    """Generate print-ready Market Intel one-pager HTML."""
-
-    # Salary benchmarks rows
-    salary_rows = ""
-    for b in analytics["salary_benchmarks"]:
-        trend = b["trend_pct"]
-        if trend > 0:
-            trend_class = "trend-up"
-            trend_text = f"&#9650; {trend}%"
-        elif trend < 0:
-            trend_class = "trend-down"
-            trend_text = f"&#9660; {trend}%"
-        else:
-            trend_class = "trend-flat"
-            trend_text = "&#9644; 0%"
-        salary_rows += f"""
-            <tr>
-              <td class="role-cell">{html.escape(b['role'])}</td>
-              <td>{b['p25']}</td>
-              <td>{b['median']}</td>
-              <td>{b['p75']}</td>
-              <td class="{trend_class}">{trend_text}</td>
-            </tr>"""
+# Market Intel page skeleton: static head/CSS and footer are plain strings,
+# only the stats and table bodies are interpolated per render
+_PDF_PREFIX = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>ExecSignals Market Intelligence Brief — """
+_PDF_CSS = """  *, *::before, *::after { margin: 0; padding: 0; box-sizing: border-box; }
+  :root {
+    --amber: #D4A054; --amber-light: #F5E6CC; --amber-bg: rgba(212, 160, 84, 0.08);
+    --navy: #0C0F1A; --navy-soft: #1A1E2E; --white: #FFFFFF;
+    --gray-50: #F9FAFB; --gray-100: #F3F4F6; --gray-200: #E5E7EB;
+    --gray-300: #D1D5DB; --gray-400: #9CA3AF; --gray-500: #6B7280;
+    --gray-600: #4B5563; --gray-700: #374151; --gray-800: #1F2937;
+    --green: #16A34A; --green-light: #DCFCE7; --red: #DC2626; --red-light: #FEE2E2;
+    --font-display: 'DM Serif Display', serif;
+    --font-body: 'Plus Jakarta Sans', sans-serif;
+    --font-mono: 'IBM Plex Mono', monospace;
+  }
+  html, body { font-family: var(--font-body); background: #E5E7EB; color: var(--gray-800); -webkit-font-smoothing: antialiased; }
+  .page { width: 8.5in; height: 11in; margin: 0.5in auto; background: var(--white); box-shadow: 0 4px 24px rgba(0,0,0,0.12); display: grid; grid-template-rows: auto auto 1fr auto auto; overflow: hidden; position: relative; }
+  .header { background: var(--navy); padding: 14px 28px; display: flex; align-items: center; justify-content: space-between; gap: 16px; }
+  .header-left { display: flex; align-items: baseline; gap: 16px; }
+  .logo { font-family: var(--font-display); font-size: 20px; color: var(--amber); letter-spacing: 0.02em; }
+  .header-title { font-family: var(--font-body); font-size: 12px; font-weight: 500; color: rgba(255,255,255,0.85); letter-spacing: 0.06em; text-transform: uppercase; }
+  .header-date { font-family: var(--font-mono); font-size: 11px; color: var(--gray-400); white-space: nowrap; }
+  .stats-row { display: grid; grid-template-columns: repeat(4, 1fr); gap: 1px; background: var(--gray-200); border-bottom: 1px solid var(--gray-200); }
+  .stat-box { background: var(--white); padding: 14px 20px; text-align: center; }
+  .stat-value { font-family: var(--font-mono); font-size: 26px; font-weight: 600; color: var(--navy); line-height: 1.1; }
+  .stat-label { font-family: var(--font-body); font-size: 10px; font-weight: 600; color: var(--gray-500); text-transform: uppercase; letter-spacing: 0.08em; margin-top: 4px; }
+  .content { padding: 16px 28px 12px; display: grid; grid-template-rows: auto auto auto; gap: 14px; }
+  .two-col { display: grid; grid-template-columns: 1fr 1fr; gap: 20px; }
+  .section-title { font-family: var(--font-display); font-size: 13px; color: var(--navy); margin-bottom: 8px; padding-bottom: 5px; border-bottom: 2px solid var(--amber); display: flex; align-items: center; gap: 6px; }
+  .section-title::before { content: ''; display: inline-block; width: 3px; height: 13px; background: var(--amber); border-radius: 1px; }
+  table { width: 100%; border-collapse: collapse; font-size: 10px; }
+  table th { font-family: var(--font-mono); font-size: 8.5px; font-weight: 600; color: var(--gray-400); text-transform: uppercase; letter-spacing: 0.1em; text-align: right; padding: 3px 6px 4px; border-bottom: 1px solid var(--gray-200); }
+  table th:first-child { text-align: left; }
+  table td { padding: 4px 6px; border-bottom: 1px solid var(--gray-100); font-family: var(--font-body); font-size: 10px; color: var(--gray-700); }
+  table td:not(:first-child) { text-align: right; font-family: var(--font-mono); font-size: 10px; }
+  table tr:last-child td { border-bottom: none; }
+  .role-cell { font-weight: 600; color: var(--navy); }
+  .trend-up { color: var(--green); font-size: 9px; }
+  .trend-down { color: var(--red); font-size: 9px; }
+  .trend-flat { color: var(--gray-400); font-size: 9px; }
+  .badge-new { font-family: var(--font-mono); font-size: 7.5px; font-weight: 600; color: var(--green); background: var(--green-light); padding: 1px 5px; border-radius: 3px; letter-spacing: 0.04em; text-transform: uppercase; margin-left: 4px; vertical-align: middle; }
+  .change-positive { color: var(--green); }
+  .change-negative { color: var(--red); }
+  .stage-section { padding: 0 28px 10px; }
+  .stage-title { font-family: var(--font-display); font-size: 13px; color: var(--navy); margin-bottom: 8px; padding-bottom: 5px; border-bottom: 2px solid var(--amber); display: flex; align-items: center; gap: 6px; }
+  .stage-title::before { content: ''; display: inline-block; width: 3px; height: 13px; background: var(--amber); border-radius: 1px; }
+  .stage-bar-container { margin-bottom: 6px; }
+  .stage-bar { display: flex; height: 26px; border-radius: 4px; overflow: hidden; gap: 1px; }
+  .stage-segment { display: flex; align-items: center; justify-content: center; font-family: var(--font-mono); font-size: 9px; font-weight: 600; color: var(--white); }
+  .stage-segment.enterprise { background: var(--navy); }
+  .stage-segment.late { background: #374151; }
+  .stage-segment.growth { background: var(--amber); color: var(--navy); }
+  .stage-segment.early { background: #D4A054aa; color: var(--navy); }
+  .stage-segment.unknown { background: var(--gray-300); color: var(--gray-600); }
+  .stage-legend { display: flex; gap: 16px; justify-content: center; }
+  .stage-legend-item { display: flex; align-items: center; gap: 5px; font-family: var(--font-body); font-size: 9px; color: var(--gray-500); }
+  .stage-legend-dot { width: 8px; height: 8px; border-radius: 2px; }
+  .stage-legend-dot.enterprise { background: var(--navy); }
+  .stage-legend-dot.late { background: #374151; }
+  .stage-legend-dot.growth { background: var(--amber); }
+  .stage-legend-dot.early { background: #D4A054aa; }
+  .stage-legend-dot.unknown { background: var(--gray-300); }
+  .footer { background: var(--gray-50); border-top: 1px solid var(--gray-200); padding: 10px 28px; display: flex; justify-content: space-between; align-items: center; }
+  .footer-left { font-family: var(--font-body); font-size: 9px; color: var(--gray-500); }
+  .footer-left strong { color: var(--amber); font-family: var(--font-display); font-weight: normal; font-size: 10px; }
+  .footer-right { font-family: var(--font-mono); font-size: 8px; color: var(--gray-400); text-transform: uppercase; letter-spacing: 0.06em; }
+  @media print {
+    html, body { background: white; margin: 0; padding: 0; }
+    .page { width: 100%; height: 100%; margin: 0; box-shadow: none; -webkit-print-color-adjust: exact; print-color-adjust: exact; }
+    @page { size: letter; margin: 0; }
+  }
+"""
+_PDF_HEADER = """</title>
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link href="https://fonts.googleapis.com/css2?family=DM+Serif+Display&family=IBM+Plex+Mono:wght@400;500;600&family=Plus+Jakarta+Sans:wght@400;500;600;700&display=swap" rel="stylesheet">
+<style>
+""" + _PDF_CSS + """</style>
+</head>
+<body>
+<div class="page">
+  <div class="header">
+    <div class="header-left">
+      <span class="logo">ExecSignals</span>
+      <span class="header-title">Market Intelligence Brief</span>
+    </div>
+    <span class="header-date">"""
+_PDF_SUFFIX = """
+      </div>
+    </div>
+    <div class="stage-legend">
+      <div class="stage-legend-item"><div class="stage-legend-dot enterprise"></div>Enterprise</div>
+      <div class="stage-legend-item"><div class="stage-legend-dot late"></div>Late Stage</div>
+      <div class="stage-legend-item"><div class="stage-legend-dot growth"></div>Growth</div>
+      <div class="stage-legend-item"><div class="stage-legend-dot early"></div>Early Stage</div>
+      <div class="stage-legend-item"><div class="stage-legend-dot unknown"></div>Unknown</div>
+    </div>
+  </div>
+  <div class="footer">
+    <div class="footer-left">
+      <strong>ExecSignals</strong> &mdash; The Monday Brief&ensp;|&ensp;execsignals.com&ensp;|&ensp;Pariter Media Inc.
+    </div>
+    <div class="footer-right">For client use. Updated weekly.</div>
+  </div>
+</div>
+</body>
+</html>"""
+
+
+def generate_market_intel_html(analytics, summary, date_str):
+    """Generate print-ready Market Intel one-pager HTML."""
+
+    # Salary benchmarks rows
+    salary_rows = []
+    for b in analytics["salary_benchmarks"]:
+        trend = b["trend_pct"]
+        if trend > 0:
+            trend_class = "trend-up"
+            trend_text = f"&#9650; {trend}%"
+        elif trend < 0:
+            trend_class = "trend-down"
+            trend_text = f"&#9660; {trend}%"
+        else:
+            trend_class = "trend-flat"
+            trend_text = "&#9644; 0%"
+        salary_rows.append(f"""
+            <tr>
+              <td class="role-cell">{html.escape(b['role'])}</td>
+              <td>{b['p25']}</td>
+              <td>{b['median']}</td>
+              <td>{b['p75']}</td>
+              <td class="{trend_class}">{trend_text}</td>
+            </tr>""")
 
     # Industry velocity rows
-    velocity_rows = ""
+    velocity_rows = []
     for v in analytics["industry_velocity"][:6]:
         wow = v["wow_pct"]
         cls = "change-positive" if wow > 0 else ("change-negative" if wow < 0 else "")
         sign = "+" if wow > 0 else ""
-        velocity_rows += f"""
+        velocity_rows.append(f"""
             <tr>
               <td class="role-cell">{html.escape(v['industry'])}</td>
               <td>{v['count']}</td>
               <td class="{cls}">{sign}{wow}%</td>
-            </tr>"""
+            </tr>""")
 
     # Top companies rows
-    company_rows = ""
+    company_rows = []
     for comp in analytics["top_companies"][:10]:
         badge = '<span class="badge-new">new</span>' if comp["is_new"] else ""
-        company_rows += f"""
+        company_rows.append(f"""
             <tr>
               <td class="role-cell">{html.escape(format_company_name(comp['company']))}{badge}</td>
               <td>{comp['count']}</td>
-            </tr>"""
+            </tr>""")
 
     # Geo rows
-    geo_rows = ""
+    geo_rows = []
     for g in analytics["geo_breakdown"][:8]:
         wow = g["wow_pct"]
         cls = "change-positive" if wow > 0 else ("change-negative" if wow < 0 else "")
         sign = "+" if wow > 0 else ""
-        geo_rows += f"""
+        geo_rows.append(f"""
             <tr>
               <td class="role-cell">{html.escape(g['metro'])}</td>
               <td>{g['count']}</td>
               <td class="{cls}">{sign}{wow}%</td>
-            </tr>"""
+            </tr>""")
 
     # Company stage bar segments
-    stage_segments = ""
+    stage_segments = []
     for s in analytics["company_stage"]:
         if s["pct"] < 3:
             continue
         css_class = s["stage"].lower().split("/")[0].strip().split(" ")[0]
-        stage_segments += f'<div class="stage-segment {css_class}" style="width: {s["pct"]}%;">{s["pct"]}%</div>\n'
+        stage_segments.append(f'<div class="stage-segment {css_class}" style="width: {s["pct"]}%;">{s["pct"]}%</div>\n')
 
     # Unique companies count
     unique_companies = len(set(
@@ -1607,94 +1787,9 @@ def generate_market_intel_html(analytics, summary, date_str):
         for _ in range(1)
     ))
 
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>ExecSignals Market Intelligence Brief — {html.escape(date_str)}</title>
-<link rel="preconnect" href="https://fonts.googleapis.com">
-<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-<link href="https://fonts.googleapis.com/css2?family=DM+Serif+Display&family=IBM+Plex+Mono:wght@400;500;600&family=Plus+Jakarta+Sans:wght@400;500;600;700&display=swap" rel="stylesheet">
-<style>
-  *, *::before, *::after {{ margin: 0; padding: 0; box-sizing: border-box; }}
-  :root {{
-    --amber: #D4A054; --amber-light: #F5E6CC; --amber-bg: rgba(212, 160, 84, 0.08);
-    --navy: #0C0F1A; --navy-soft: #1A1E2E; --white: #FFFFFF;
-    --gray-50: #F9FAFB; --gray-100: #F3F4F6; --gray-200: #E5E7EB;
-    --gray-300: #D1D5DB; --gray-400: #9CA3AF; --gray-500: #6B7280;
-    --gray-600: #4B5563; --gray-700: #374151; --gray-800: #1F2937;
-    --green: #16A34A; --green-light: #DCFCE7; --red: #DC2626; --red-light: #FEE2E2;
-    --font-display: 'DM Serif Display', serif;
-    --font-body: 'Plus Jakarta Sans', sans-serif;
-    --font-mono: 'IBM Plex Mono', monospace;
-  }}
-  html, body {{ font-family: var(--font-body); background: #E5E7EB; color: var(--gray-800); -webkit-font-smoothing: antialiased; }}
-  .page {{ width: 8.5in; height: 11in; margin: 0.5in auto; background: var(--white); box-shadow: 0 4px 24px rgba(0,0,0,0.12); display: grid; grid-template-rows: auto auto 1fr auto auto; overflow: hidden; position: relative; }}
-  .header {{ background: var(--navy); padding: 14px 28px; display: flex; align-items: center; justify-content: space-between; gap: 16px; }}
-  .header-left {{ display: flex; align-items: baseline; gap: 16px; }}
-  .logo {{ font-family: var(--font-display); font-size: 20px; color: var(--amber); letter-spacing: 0.02em; }}
-  .header-title {{ font-family: var(--font-body); font-size: 12px; font-weight: 500; color: rgba(255,255,255,0.85); letter-spacing: 0.06em; text-transform: uppercase; }}
-  .header-date {{ font-family: var(--font-mono); font-size: 11px; color: var(--gray-400); white-space: nowrap; }}
-  .stats-row {{ display: grid; grid-template-columns: repeat(4, 1fr); gap: 1px; background: var(--gray-200); border-bottom: 1px solid var(--gray-200); }}
-  .stat-box {{ background: var(--white); padding: 14px 20px; text-align: center; }}
-  .stat-value {{ font-family: var(--font-mono); font-size: 26px; font-weight: 600; color: var(--navy); line-height: 1.1; }}
-  .stat-label {{ font-family: var(--font-body); font-size: 10px; font-weight: 600; color: var(--gray-500); text-transform: uppercase; letter-spacing: 0.08em; margin-top: 4px; }}
-  .content {{ padding: 16px 28px 12px; display: grid; grid-template-rows: auto auto auto; gap: 14px; }}
-  .two-col {{ display: grid; grid-template-columns: 1fr 1fr; gap: 20px; }}
-  .section-title {{ font-family: var(--font-display); font-size: 13px; color: var(--navy); margin-bottom: 8px; padding-bottom: 5px; border-bottom: 2px solid var(--amber); display: flex; align-items: center; gap: 6px; }}
-  .section-title::before {{ content: ''; display: inline-block; width: 3px; height: 13px; background: var(--amber); border-radius: 1px; }}
-  table {{ width: 100%; border-collapse: collapse; font-size: 10px; }}
-  table th {{ font-family: var(--font-mono); font-size: 8.5px; font-weight: 600; color: var(--gray-400); text-transform: uppercase; letter-spacing: 0.1em; text-align: right; padding: 3px 6px 4px; border-bottom: 1px solid var(--gray-200); }}
-  table th:first-child {{ text-align: left; }}
-  table td {{ padding: 4px 6px; border-bottom: 1px solid var(--gray-100); font-family: var(--font-body); font-size: 10px; color: var(--gray-700); }}
-  table td:not(:first-child) {{ text-align: right; font-family: var(--font-mono); font-size: 10px; }}
-  table tr:last-child td {{ border-bottom: none; }}
-  .role-cell {{ font-weight: 600; color: var(--navy); }}
-  .trend-up {{ color: var(--green); font-size: 9px; }}
-  .trend-down {{ color: var(--red); font-size: 9px; }}
-  .trend-flat {{ color: var(--gray-400); font-size: 9px; }}
-  .badge-new {{ font-family: var(--font-mono); font-size: 7.5px; font-weight: 600; color: var(--green); background: var(--green-light); padding: 1px 5px; border-radius: 3px; letter-spacing: 0.04em; text-transform: uppercase; margin-left: 4px; vertical-align: middle; }}
-  .change-positive {{ color: var(--green); }}
-  .change-negative {{ color: var(--red); }}
-  .stage-section {{ padding: 0 28px 10px; }}
-  .stage-title {{ font-family: var(--font-display); font-size: 13px; color: var(--navy); margin-bottom: 8px; padding-bottom: 5px; border-bottom: 2px solid var(--amber); display: flex; align-items: center; gap: 6px; }}
-  .stage-title::before {{ content: ''; display: inline-block; width: 3px; height: 13px; background: var(--amber); border-radius: 1px; }}
-  .stage-bar-container {{ margin-bottom: 6px; }}
-  .stage-bar {{ display: flex; height: 26px; border-radius: 4px; overflow: hidden; gap: 1px; }}
-  .stage-segment {{ display: flex; align-items: center; justify-content: center; font-family: var(--font-mono); font-size: 9px; font-weight: 600; color: var(--white); }}
-  .stage-segment.enterprise {{ background: var(--navy); }}
-  .stage-segment.late {{ background: #374151; }}
-  .stage-segment.growth {{ background: var(--amber); color: var(--navy); }}
-  .stage-segment.early {{ background: #D4A054aa; color: var(--navy); }}
-  .stage-segment.unknown {{ background: var(--gray-300); color: var(--gray-600); }}
-  .stage-legend {{ display: flex; gap: 16px; justify-content: center; }}
-  .stage-legend-item {{ display: flex; align-items: center; gap: 5px; font-family: var(--font-body); font-size: 9px; color: var(--gray-500); }}
-  .stage-legend-dot {{ width: 8px; height: 8px; border-radius: 2px; }}
-  .stage-legend-dot.enterprise {{ background: var(--navy); }}
-  .stage-legend-dot.late {{ background: #374151; }}
-  .stage-legend-dot.growth {{ background: var(--amber); }}
-  .stage-legend-dot.early {{ background: #D4A054aa; }}
-  .stage-legend-dot.unknown {{ background: var(--gray-300); }}
-  .footer {{ background: var(--gray-50); border-top: 1px solid var(--gray-200); padding: 10px 28px; display: flex; justify-content: space-between; align-items: center; }}
-  .footer-left {{ font-family: var(--font-body); font-size: 9px; color: var(--gray-500); }}
-  .footer-left strong {{ color: var(--amber); font-family: var(--font-display); font-weight: normal; font-size: 10px; }}
-  .footer-right {{ font-family: var(--font-mono); font-size: 8px; color: var(--gray-400); text-transform: uppercase; letter-spacing: 0.06em; }}
-  @media print {{
-    html, body {{ background: white; margin: 0; padding: 0; }}
-    .page {{ width: 100%; height: 100%; margin: 0; box-shadow: none; -webkit-print-color-adjust: exact; print-color-adjust: exact; }}
-    @page {{ size: letter; margin: 0; }}
-  }}
-</style>
-</head>
-<body>
-<div class="page">
-  <div class="header">
-    <div class="header-left">
-      <span class="logo">ExecSignals</span>
-      <span class="header-title">Market Intelligence Brief</span>
-    </div>
-    <span class="header-date">{html.escape(date_str)}</span>
+    return "".join((
+        _PDF_PREFIX, html.escape(date_str), _PDF_HEADER, html.escape(date_str),
+        f"""</span>
   </div>
   <div class="stats-row">
     <div class="stat-box">
@@ -1720,14 +1815,14 @@ def generate_market_intel_html(analytics, summary, date_str):
         <div class="section-title">Salary Benchmarks</div>
         <table>
           <thead><tr><th>Role</th><th>P25</th><th>Median</th><th>P75</th><th>4wk</th></tr></thead>
-          <tbody>{salary_rows}</tbody>
+          <tbody>{"".join(salary_rows)}</tbody>
         </table>
       </div>
       <div>
         <div class="section-title">Hiring Velocity by Industry</div>
         <table>
           <thead><tr><th>Industry</th><th>Leads</th><th>WoW</th></tr></thead>
-          <tbody>{velocity_rows}</tbody>
+          <tbody>{"".join(velocity_rows)}</tbody>
         </table>
       </div>
     </div>
@@ -1736,14 +1831,14 @@ def generate_market_intel_html(analytics, summary, date_str):
         <div class="section-title">Top Hiring Companies</div>
         <table>
           <thead><tr><th>Company</th><th>Open VP+ Roles</th></tr></thead>
-          <tbody>{company_rows}</tbody>
+          <tbody>{"".join(company_rows)}</tbody>
         </table>
       </div>
       <div>
         <div class="section-title">VP+ Leads by Metro</div>
         <table>
           <thead><tr><th>Metro</th><th>Leads</th><th>WoW</th></tr></thead>
-          <tbody>{geo_rows}</tbody>
+          <tbody>{"".join(geo_rows)}</tbody>
         </table>
       </div>
     </div>
@@ -1752,26 +1847,9 @@ def generate_market_intel_html(analytics, summary, date_str):
     <div class="stage-title">Company Stage Distribution</div>
     <div class="stage-bar-container">
       <div class="stage-bar">
-        {stage_segments}
-      </div>
-    </div>
-    <div class="stage-legend">
-      <div class="stage-legend-item"><div class="stage-legend-dot enterprise"></div>Enterprise</div>
-      <div class="stage-legend-item"><div class="stage-legend-dot late"></div>Late Stage</div>
-      <div class="stage-legend-item"><div class="stage-legend-dot growth"></div>Growth</div>
-      <div class="stage-legend-item"><div class="stage-legend-dot early"></div>Early Stage</div>
-      <div class="stage-legend-item"><div class="stage-legend-dot unknown"></div>Unknown</div>
-    </div>
-  </div>
-  <div class="footer">
-    <div class="footer-left">
-      <strong>ExecSignals</strong> &mdash; The Monday Brief&ensp;|&ensp;execsignals.com&ensp;|&ensp;Pariter Media Inc.
-    </div>
-    <div class="footer-right">For client use. Updated weekly.</div>
-  </div>
-</div>
-</body>
-</html>"""
+        {"".join(stage_segments)}""",
+        _PDF_SUFFIX,
+    ))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1779,96 +1857,15 @@ def generate_market_intel_html(analytics, summary, date_str):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-def generate_email_html(leads, analytics, summary, date_str, date_range, ref_date=None, file_date=None):
-    """Generate The Monday Brief email HTML."""
-    now = ref_date or datetime.now()
-    fd = file_date or datetime.now().strftime("%b%d")
-    xlsx_name = f"ExecSignals_{fd}.xlsx"
-    pdf_name = f"MarketIntel_{fd}.html"
-
-    # ── Summary stats bar ──
-    seniority_html = ""
-    for tier, count in summary["seniority"].items():
-        seniority_html += f'{tier}: <strong style="color:#0C0F1A;">{count}</strong> &middot;\n'
-    seniority_html = seniority_html.rstrip(" &middot;\n")
-
-    segment_html = ""
-    for seg, pct in summary["segment"].items():
-        segment_html += f'{seg}: <strong style="color:#0C0F1A;">{pct}%</strong> &middot;\n'
-    segment_html = segment_html.rstrip(" &middot;\n")
-
-    # ── Top 5 full lead cards ──
-    top5_html = ""
-    for i, lead in enumerate(leads[:5], 1):
-        title = html.escape(lead.get("title") or "Untitled")
-        company = html.escape(format_company_name(lead.get("company_name")))
-        salary = html.escape(format_salary(lead.get("annual_salary_min"), lead.get("annual_salary_max")))
-        location = html.escape(clean_location(lead))
-        job_url = html.escape(get_best_job_url(lead))
-        score = lead["score"]
-        seniority = SENIORITY_DISPLAY.get(lead.get("seniority_tier", ""), "VP")
-
-        # Company website link
-        company_url = lead.get("company_url") or ""
-        company_link_html = ""
-        if company_url:
-            safe_co_url = html.escape(company_url)
-            company_link_html = f' &middot; <a href="{safe_co_url}" style="color:#888;font-size:11px;text-decoration:none;">Company &rsaquo;</a>'
-
-        # Days ago
-        date_posted = lead.get("date_posted")
-        if date_posted:
-            try:
-                posted_dt = datetime.strptime(str(date_posted)[:10], "%Y-%m-%d")
-                days_ago = (now - posted_dt).days
-            except ValueError:
-                days_ago = 0
-        else:
-            days_ago = 0
-
-        if days_ago <= 2:
-            days_color = "#EF4444"
-        elif days_ago <= 4:
-            days_color = "#D4A054"
-        else:
-            days_color = "#888"
-        days_text = f"POSTED {days_ago} DAY{'S' if days_ago != 1 else ''} AGO"
-
-        employees = lead.get("company_num_employees") or ""
-        emp_text = f" &middot; ~{employees} emp" if employees else ""
-        industry_raw = lead.get("company_industry") or ""
-        industry = INDUSTRY_MAP.get(industry_raw, industry_raw)
-        ind_text = f" &middot; {html.escape(industry)}" if industry else ""
-
-        # Repost badge
-        repost_count = lead.get("repost_count", 0)
-        repost_badge = ""
-        if repost_count > 1:
-            repost_badge = f'<span style="display:inline-block;background:#FFF3CD;color:#856404;padding:2px 7px;border-radius:3px;font-size:10px;font-weight:700;margin-right:3px;">REPOSTED {repost_count}x</span>'
-
-        # Retained search badge
-        if lead.get("is_search_firm"):
-            repost_badge += '<span style="display:inline-block;background:#F3E8FF;color:#7C3AED;padding:2px 7px;border-radius:3px;font-size:10px;font-weight:700;margin-right:3px;">RETAINED SEARCH</span>'
-
-        # Signal badges (filter reports_cro for non-sales roles)
-        filtered_lead = {**lead, "signals": filter_signals_for_role(lead)}
-        signal_badges = ""
-        hiring_sig = extract_hiring_signal(filtered_lead)
-        team_sig = extract_team_structure(filtered_lead)
-        if hiring_sig:
-            signal_badges += f'<span style="display:inline-block;background:#E8F5E9;color:#2E7D32;padding:2px 7px;border-radius:3px;font-size:10px;font-weight:700;margin-right:3px;">{html.escape(hiring_sig.upper())}</span>'
-        if team_sig:
-            for ts in team_sig.split(", "):
-                signal_badges += f'<span style="display:inline-block;background:#E3F2FD;color:#1565C0;padding:2px 7px;border-radius:3px;font-size:10px;font-weight:700;margin-right:3px;">{html.escape(ts.upper())}</span>'
-
-        # Placement fee estimate
-        fee = estimate_placement_fee(lead)
-        fee_html = f' &middot; <span style="color:#06D6A0;font-weight:600;">~{html.escape(fee)} fee</span>' if fee else ""
-
-        note = html.escape(generate_signal_note(filtered_lead))
-        ctx_stat = html.escape(get_contextual_stat(lead, analytics["geo_breakdown"], analytics.get("remote_function_counts")))
-
-        top5_html += f"""
+# Monday Brief email templates: card and table-row fragments (str.format /
+# str.format_map) and the page shell (string.Template), parsed once at import
+_EMAIL_REPOST_BADGE = '<span style="display:inline-block;background:#FFF3CD;color:#856404;padding:2px 7px;border-radius:3px;font-size:10px;font-weight:700;margin-right:3px;">REPOSTED {}x</span>'
+_EMAIL_RETAINED_BADGE = '<span style="display:inline-block;background:#F3E8FF;color:#7C3AED;padding:2px 7px;border-radius:3px;font-size:10px;font-weight:700;margin-right:3px;">RETAINED SEARCH</span>'
+_EMAIL_HIRING_BADGE = '<span style="display:inline-block;background:#E8F5E9;color:#2E7D32;padding:2px 7px;border-radius:3px;font-size:10px;font-weight:700;margin-right:3px;">{}</span>'
+_EMAIL_TEAM_BADGE = '<span style="display:inline-block;background:#E3F2FD;color:#1565C0;padding:2px 7px;border-radius:3px;font-size:10px;font-weight:700;margin-right:3px;">{}</span>'
+_EMAIL_COMPACT_REPOST_TAG = ' <span style="background:#FFF3CD;color:#856404;padding:1px 5px;border-radius:2px;font-size:9px;font-weight:700;">{}x</span>'
+_EMAIL_COMPACT_RETAINED_TAG = ' <span style="background:#F3E8FF;color:#7C3AED;padding:1px 5px;border-radius:2px;font-size:9px;font-weight:700;">RETAINED</span>'
+_EMAIL_CARD_TMPL = """
                     <tr>
                         <td style="padding:14px 32px;border-bottom:1px solid #f0f0f0;">
                             <div style="font-size:11px;color:#D4A054;font-weight:700;margin-bottom:2px;">#{i} &middot; <span style="color:{days_color};">{days_text}</span></div>
@@ -1880,182 +1877,46 @@ def generate_email_html(leads, analytics, summary, date_str, date_range, ref_dat
                             <div style="font-size:11px;color:#999;margin-top:4px;">{ctx_stat}</div>
                         </td>
                     </tr>"""
-
-    # ── Leads 6-10 compact ──
-    compact_html = ""
-    for i, lead in enumerate(leads[5:10], 6):
-        title = html.escape(lead.get("title") or "Untitled")
-        company = html.escape(format_company_name(lead.get("company_name")))
-        salary = html.escape(format_salary(lead.get("annual_salary_min"), lead.get("annual_salary_max")))
-        location = html.escape(clean_location(lead))
-        job_url = html.escape(get_best_job_url(lead))
-        score = lead["score"]
-        fee = estimate_placement_fee(lead)
-        fee_text = f" &middot; ~{html.escape(fee)}" if fee else ""
-
-        date_posted = lead.get("date_posted")
-        if date_posted:
-            try:
-                posted_dt = datetime.strptime(str(date_posted)[:10], "%Y-%m-%d")
-                days_ago = (now - posted_dt).days
-            except ValueError:
-                days_ago = 0
-        else:
-            days_ago = 0
-
-        if days_ago <= 2:
-            days_color = "#EF4444"
-        elif days_ago <= 4:
-            days_color = "#D4A054"
-        else:
-            days_color = "#888"
-
-        metro = lead.get("location_metro") or lead.get("location_state") or ""
-        if lead.get("is_remote"):
-            metro = "Remote"
-        metro_html = f" &middot; {html.escape(metro)}" if metro else ""
-
-        repost_count = lead.get("repost_count", 0)
-        repost_tag = f' <span style="background:#FFF3CD;color:#856404;padding:1px 5px;border-radius:2px;font-size:9px;font-weight:700;">{repost_count}x</span>' if repost_count > 1 else ""
-        if lead.get("is_search_firm"):
-            repost_tag += ' <span style="background:#F3E8FF;color:#7C3AED;padding:1px 5px;border-radius:2px;font-size:9px;font-weight:700;">RETAINED</span>'
-
-        # Compact signal hints
-        filtered_c = {**lead, "signals": filter_signals_for_role(lead)}
-        sig_parts = []
-        h_sig = extract_hiring_signal(filtered_c)
-        t_sig = extract_team_structure(filtered_c)
-        if h_sig:
-            sig_parts.append(h_sig)
-        if t_sig:
-            sig_parts.extend(t_sig.split(", ")[:2])
-        signal_hint = ""
-        if sig_parts:
-            hint_text = html.escape(" | ".join(sig_parts[:2]))
-            signal_hint = f' <span style="color:#999;font-size:9px;font-weight:500;">[{hint_text}]</span>'
-
-        compact_html += f"""
+_EMAIL_COMPACT_TMPL = """
                                 <tr style="border-bottom:1px solid #f0f0f0;">
                                     <td style="padding:8px 0;color:#D4A054;font-weight:700;width:60px;">#{i}</td>
                                     <td style="padding:8px 0;"><a href="{job_url}" style="color:#0C0F1A;text-decoration:underline;text-decoration-color:#D4A054;font-weight:600;">{title}</a>{repost_tag}{signal_hint} &middot; {company}{metro_html} &middot; {salary}{fee_text} <span style="color:{days_color};font-size:10px;font-weight:600;">&middot; {days_ago}d</span></td>
                                 </tr>"""
-
-    # ── Salary benchmarks table ──
-    salary_table = ""
-    for b in analytics["salary_benchmarks"]:
-        trend = b["trend_pct"]
-        if trend > 0:
-            trend_color = "#06D6A0"
-            trend_arrow = "&#9650;"
-            trend_text = f"+{trend}%"
-        elif trend < 0:
-            trend_color = "#EF4444"
-            trend_arrow = "&#9660;"
-            trend_text = f"{trend}%"
-        else:
-            trend_color = "#888"
-            trend_arrow = "&#9644;"
-            trend_text = "0%"
-
-        salary_table += f"""
+_EMAIL_SALARY_ROW_TMPL = """
                                 <tr style="border-top:1px solid #f0f0f0;">
-                                    <td style="padding:7px 0;color:#333;font-weight:500;">{html.escape(b['role'])}</td>
-                                    <td align="center" style="padding:7px 0;color:#666;">{b['p25']}</td>
-                                    <td align="center" style="padding:7px 0;color:#0C0F1A;font-weight:700;">{b['median']}</td>
-                                    <td align="center" style="padding:7px 0;color:#666;">{b['p75']}</td>
+                                    <td style="padding:7px 0;color:#333;font-weight:500;">{role}</td>
+                                    <td align="center" style="padding:7px 0;color:#666;">{p25}</td>
+                                    <td align="center" style="padding:7px 0;color:#0C0F1A;font-weight:700;">{median}</td>
+                                    <td align="center" style="padding:7px 0;color:#666;">{p75}</td>
                                     <td align="right" style="padding:7px 0;color:{trend_color};font-weight:600;">{trend_arrow} {trend_text}</td>
                                 </tr>"""
-
-    # ── Velocity rows ──
-    velocity_html = ""
-    for v in analytics["industry_velocity"][:6]:
-        wow = v["wow_pct"]
-        if wow > 0:
-            wow_color = "#06D6A0"
-            wow_text = f"+{wow}%"
-        elif wow < 0:
-            wow_color = "#EF4444"
-            wow_text = f"{wow}%"
-        else:
-            wow_color = "#888"
-            wow_text = "0%"
-
-        velocity_html += f"""
+_EMAIL_WOW_ROW_TMPL = """
                                             <tr style="border-bottom:1px solid #f5f5f5;">
-                                                <td style="padding:5px 0;color:#333;">{html.escape(v['industry'])}</td>
-                                                <td align="right" style="padding:5px 0;color:{wow_color};font-weight:700;">{wow_text} <span style="color:#888;font-weight:400;">({v['count']})</span></td>
+                                                <td style="padding:5px 0;color:#333;">{industry}</td>
+                                                <td align="right" style="padding:5px 0;color:{color};font-weight:700;">{text} <span style="color:#888;font-weight:400;">({count})</span></td>
                                             </tr>"""
-
-    # ── Companies rows ──
-    companies_html = ""
-    new_section = False
-    for comp in analytics["top_companies"]:
-        if comp["is_new"] and not new_section:
-            companies_html += f"""
+_EMAIL_NEW_COMPANIES_ROW = """
                                             <tr style="border-bottom:1px solid #f5f5f5;">
                                                 <td style="padding:5px 0;color:#333;"><em>New this week:</em></td>
                                                 <td style="padding:5px 0;"></td>
                                             </tr>"""
-            new_section = True
-
-        comp_name = format_company_name(comp['company'])
-        if comp["is_new"]:
-            companies_html += f"""
+_EMAIL_NEW_COMPANY_ROW_TMPL = """
                                             <tr style="border-bottom:1px solid #f5f5f5;">
-                                                <td style="padding:5px 0;color:#06D6A0;font-weight:500;">{html.escape(comp_name)}</td>
-                                                <td align="right" style="padding:5px 0;font-weight:600;color:#06D6A0;">{comp['count']} roles</td>
+                                                <td style="padding:5px 0;color:#06D6A0;font-weight:500;">{company}</td>
+                                                <td align="right" style="padding:5px 0;font-weight:600;color:#06D6A0;">{count} roles</td>
                                             </tr>"""
-        else:
-            companies_html += f"""
+_EMAIL_COMPANY_ROW_TMPL = """
                                             <tr style="border-bottom:1px solid #f5f5f5;">
-                                                <td style="padding:5px 0;color:#333;">{html.escape(comp_name)}</td>
-                                                <td align="right" style="padding:5px 0;font-weight:600;color:#0C0F1A;">{comp['count']} roles</td>
+                                                <td style="padding:5px 0;color:#333;">{company}</td>
+                                                <td align="right" style="padding:5px 0;font-weight:600;color:#0C0F1A;">{count} roles</td>
                                             </tr>"""
-
-    # ── Geo rows ──
-    geo_html = ""
-    for g in analytics["geo_breakdown"][:8]:
-        wow = g["wow_pct"]
-        if wow > 0:
-            wow_color = "#06D6A0"
-            wow_text = f"+{wow}%"
-        elif wow < 0:
-            wow_color = "#EF4444"
-            wow_text = f"{wow}%"
-        else:
-            wow_color = "#888"
-            wow_text = "0%"
-
-        geo_html += f"""
+_EMAIL_GEO_ROW_TMPL = """
                                             <tr style="border-bottom:1px solid #f5f5f5;">
-                                                <td style="padding:5px 0;color:#333;">{html.escape(g['metro'])}</td>
-                                                <td align="center" style="padding:5px 0;font-weight:600;color:#0C0F1A;">{g['count']}</td>
-                                                <td align="right" style="padding:5px 0;color:{wow_color};font-size:11px;font-weight:600;">{wow_text}</td>
+                                                <td style="padding:5px 0;color:#333;">{metro}</td>
+                                                <td align="center" style="padding:5px 0;font-weight:600;color:#0C0F1A;">{count}</td>
+                                                <td align="right" style="padding:5px 0;color:{color};font-size:11px;font-weight:600;">{text}</td>
                                             </tr>"""
-
-    # ── Key takeaways (auto-generated from data) ──
-    takeaways = []
-    # Hottest industry
-    if analytics["industry_velocity"]:
-        hot = max(analytics["industry_velocity"], key=lambda x: x["wow_pct"])
-        if hot["wow_pct"] > 0:
-            takeaways.append(f"{hot['industry']} hiring surged <strong>+{hot['wow_pct']}%</strong> WoW ({hot['count']} openings)")
-    # Biggest drop
-    if analytics["industry_velocity"]:
-        cold = min(analytics["industry_velocity"], key=lambda x: x["wow_pct"])
-        if cold["wow_pct"] < -10:
-            takeaways.append(f"{cold['industry']} down <strong>{cold['wow_pct']}%</strong> WoW")
-    # Top salary role
-    if analytics["salary_benchmarks"]:
-        top_sal = max(analytics["salary_benchmarks"], key=lambda x: x.get("median_raw", 0))
-        takeaways.append(f"Highest median: <strong>{top_sal['role']}</strong> at {top_sal['median']}")
-    # C-level count
-    takeaways.append(f"<strong>{summary['c_level_count']}</strong> C-Level/EVP roles this period")
-    # Growth hires
-    takeaways.append(f"<strong>{summary['growth_pct']}%</strong> of openings are growth hires (net-new roles)")
-    takeaway_html = "<br>".join(f"&bull; {t}" for t in takeaways[:5])
-
-    return f"""<!DOCTYPE html>
+MONDAY_EMAIL_TMPL = Template("""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -2073,7 +1934,7 @@ def generate_email_html(leads, analytics, summary, date_str, date_range, ref_dat
                         <td style="background:#0C0F1A;padding:28px 32px;text-align:center;">
                             <div style="font-size:13px;font-weight:600;color:#D4A054;letter-spacing:2px;text-transform:uppercase;margin-bottom:6px;">ExecSignals</div>
                             <h1 style="color:#fff;margin:0;font-size:22px;font-weight:700;letter-spacing:-0.3px;">The Monday Brief</h1>
-                            <p style="color:#94A3B8;margin:6px 0 0;font-size:13px;">{html.escape(date_range)} &middot; {summary['total']} VP+ Leads</p>
+                            <p style="color:#94A3B8;margin:6px 0 0;font-size:13px;">$date_range &middot; $total VP+ Leads</p>
                         </td>
                     </tr>
 
@@ -2083,19 +1944,19 @@ def generate_email_html(leads, analytics, summary, date_str, date_range, ref_dat
                             <table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="background:#f8f9fa;border-radius:8px;">
                                 <tr>
                                     <td width="25%" align="center" style="padding:16px 4px;">
-                                        <div style="font-size:24px;font-weight:700;color:#0C0F1A;">{summary['total']}</div>
+                                        <div style="font-size:24px;font-weight:700;color:#0C0F1A;">$total</div>
                                         <div style="font-size:10px;color:#888;text-transform:uppercase;letter-spacing:0.5px;">VP+ Leads</div>
                                     </td>
                                     <td width="25%" align="center" style="padding:16px 4px;">
-                                        <div style="font-size:24px;font-weight:700;color:#0C0F1A;">{summary['avg_salary']}</div>
+                                        <div style="font-size:24px;font-weight:700;color:#0C0F1A;">$avg_salary</div>
                                         <div style="font-size:10px;color:#888;text-transform:uppercase;letter-spacing:0.5px;">Avg Salary</div>
                                     </td>
                                     <td width="25%" align="center" style="padding:16px 4px;">
-                                        <div style="font-size:24px;font-weight:700;color:#0C0F1A;">{summary['c_level_count']}</div>
+                                        <div style="font-size:24px;font-weight:700;color:#0C0F1A;">$c_level_count</div>
                                         <div style="font-size:10px;color:#888;text-transform:uppercase;letter-spacing:0.5px;">C-Level Roles</div>
                                     </td>
                                     <td width="25%" align="center" style="padding:16px 4px;">
-                                        <div style="font-size:24px;font-weight:700;color:#06D6A0;">{summary['growth_pct']}%</div>
+                                        <div style="font-size:24px;font-weight:700;color:#06D6A0;">$growth_pct%</div>
                                         <div style="font-size:10px;color:#888;text-transform:uppercase;letter-spacing:0.5px;">Growth Hires</div>
                                     </td>
                                 </tr>
@@ -2111,13 +1972,13 @@ def generate_email_html(leads, analytics, summary, date_str, date_range, ref_dat
                                     <td width="48%" valign="top" style="padding-right:8px;">
                                         <div style="background:#f8f9fa;border-radius:6px;padding:14px;">
                                             <div style="font-size:10px;font-weight:700;color:#888;text-transform:uppercase;letter-spacing:1px;margin-bottom:8px;">By Seniority</div>
-                                            <div style="font-size:13px;color:#444;line-height:1.9;">{seniority_html}</div>
+                                            <div style="font-size:13px;color:#444;line-height:1.9;">$seniority_html</div>
                                         </div>
                                     </td>
                                     <td width="48%" valign="top" style="padding-left:8px;">
                                         <div style="background:#f8f9fa;border-radius:6px;padding:14px;">
                                             <div style="font-size:10px;font-weight:700;color:#888;text-transform:uppercase;letter-spacing:1px;margin-bottom:8px;">By Segment</div>
-                                            <div style="font-size:13px;color:#444;line-height:1.9;">{segment_html}</div>
+                                            <div style="font-size:13px;color:#444;line-height:1.9;">$segment_html</div>
                                         </div>
                                     </td>
                                 </tr>
@@ -2135,7 +1996,7 @@ def generate_email_html(leads, analytics, summary, date_str, date_range, ref_dat
                         </td>
                     </tr>
 
-                    {top5_html}
+                    $top5_html
 
                     <!-- Leads 6-10 compact -->
                     <tr>
@@ -2146,7 +2007,7 @@ def generate_email_html(leads, analytics, summary, date_str, date_range, ref_dat
                     <tr>
                         <td style="padding:0 32px;">
                             <table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="font-size:12px;">
-                                {compact_html}
+                                $compact_html
                             </table>
                         </td>
                     </tr>
@@ -2162,13 +2023,13 @@ def generate_email_html(leads, analytics, summary, date_str, date_range, ref_dat
                                     <tr>
                                         <td width="50%" style="padding:4px 8px 4px 0;">
                                             <div style="background:#fff;border:1px solid #eee;border-radius:4px;padding:8px 10px;font-size:12px;">
-                                                <strong style="color:#0C0F1A;">{html.escape(xlsx_name)}</strong><br>
-                                                <span style="color:#999;font-size:11px;">{summary['total']} leads &middot; Color-coded scores &middot; Filterable</span>
+                                                <strong style="color:#0C0F1A;">$xlsx_name</strong><br>
+                                                <span style="color:#999;font-size:11px;">$total leads &middot; Color-coded scores &middot; Filterable</span>
                                             </div>
                                         </td>
                                         <td width="50%" style="padding:4px 0 4px 8px;">
                                             <div style="background:#fff;border:1px solid #eee;border-radius:4px;padding:8px 10px;font-size:12px;">
-                                                <strong style="color:#0C0F1A;">{html.escape(pdf_name)}</strong><br>
+                                                <strong style="color:#0C0F1A;">$pdf_name</strong><br>
                                                 <span style="color:#999;font-size:11px;">1-page summary &middot; Forward to clients &middot; Print-ready</span>
                                             </div>
                                         </td>
@@ -2200,7 +2061,7 @@ def generate_email_html(leads, analytics, summary, date_str, date_range, ref_dat
                                     <td align="center" style="padding:4px 0;font-weight:600;">P75</td>
                                     <td align="right" style="padding:4px 0;font-weight:600;">4-Wk Trend</td>
                                 </tr>
-                                {salary_table}
+                                $salary_table
                             </table>
                         </td>
                     </tr>
@@ -2213,13 +2074,13 @@ def generate_email_html(leads, analytics, summary, date_str, date_range, ref_dat
                                     <td width="48%" valign="top" style="padding-right:8px;">
                                         <div style="font-size:11px;font-weight:700;color:#D4A054;text-transform:uppercase;letter-spacing:1px;margin-bottom:10px;border-bottom:1px solid #eee;padding-bottom:6px;">Hiring Velocity by Industry</div>
                                         <table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="font-size:12px;">
-                                            {velocity_html}
+                                            $velocity_html
                                         </table>
                                     </td>
                                     <td width="48%" valign="top" style="padding-left:8px;">
                                         <div style="font-size:11px;font-weight:700;color:#D4A054;text-transform:uppercase;letter-spacing:1px;margin-bottom:10px;border-bottom:1px solid #eee;padding-bottom:6px;">Top Hiring Companies</div>
                                         <table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="font-size:12px;">
-                                            {companies_html}
+                                            $companies_html
                                         </table>
                                     </td>
                                 </tr>
@@ -2235,12 +2096,12 @@ def generate_email_html(leads, analytics, summary, date_str, date_range, ref_dat
                                     <td width="48%" valign="top" style="padding-right:8px;">
                                         <div style="font-size:11px;font-weight:700;color:#D4A054;text-transform:uppercase;letter-spacing:1px;margin-bottom:10px;border-bottom:1px solid #eee;padding-bottom:6px;">VP+ Leads by Metro</div>
                                         <table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="font-size:12px;">
-                                            {geo_html}
+                                            $geo_html
                                         </table>
                                     </td>
                                     <td width="48%" valign="top" style="padding-left:8px;">
                                         <div style="font-size:11px;font-weight:700;color:#D4A054;text-transform:uppercase;letter-spacing:1px;margin-bottom:10px;border-bottom:1px solid #eee;padding-bottom:6px;">Key Takeaways</div>
-                                        <div style="font-size:12px;color:#444;line-height:1.8;">{takeaway_html}</div>
+                                        <div style="font-size:12px;color:#444;line-height:1.8;">$takeaway_html</div>
                                     </td>
                                 </tr>
                             </table>
@@ -2285,93 +2146,343 @@ def generate_email_html(leads, analytics, summary, date_str, date_range, ref_dat
         </tr>
     </table>
 </body>
-</html>"""
+</html>""")
+
+
+# Posted-days colour by day (capped at 5), and colour/arrow by trend sign
+_EMAIL_DAYS_COLORS = ("#EF4444",) * 3 + ("#D4A054",) * 2 + ("#888",)
+_EMAIL_SIGN_STYLE = {
+    1: ("#06D6A0", "&#9650;"),
+    -1: ("#EF4444", "&#9660;"),
+    0: ("#888", "&#9644;"),
+}
+
+
+def _email_days_color(days_ago):
+    return _EMAIL_DAYS_COLORS[min(max(days_ago, 0), 5)]
+
+
+def _email_trend(pct):
+    """(color, arrow, text) for a signed percentage change."""
+    sign = (pct > 0) - (pct < 0)
+    color, arrow = _EMAIL_SIGN_STYLE[sign]
+    return color, arrow, (f"+{pct}%" if sign > 0 else f"{pct}%" if sign else "0%")
+
+
+EmailLeadFields = namedtuple("EmailLeadFields", ["title", "company", "salary", "location", "job_url", "fee"])
+
+
+def lead_email_fields(lead):
+    """Title, company, salary, location, job URL and fee ("" if none) for the
+    emails, derived once and cached on the lead for the HTML and text bodies."""
+    fields = lead.get("_email_fields")
+    if fields is None:
+        fields = lead["_email_fields"] = EmailLeadFields(
+            lead.get("title") or "Untitled",
+            format_company_name(lead.get("company_name")),
+            format_salary(lead.get("annual_salary_min"), lead.get("annual_salary_max")),
+            clean_location(lead),
+            get_best_job_url(lead),
+            estimate_placement_fee(lead) or "",
+        )
+    return fields
+
+
+def _email_lead_fields(lead):
+    """HTML-escaped lead_email_fields() for the card and compact rows."""
+    return EmailLeadFields._make(map(html.escape, lead_email_fields(lead)))
+
+
+def _email_card_fields(i, lead, now, geo_by_metro, function_counts):
+    """Format fields for one top-5 lead card."""
+    company_url = lead.get("company_url") or ""
+    company_link_html = ""
+    if company_url:
+        safe_co_url = html.escape(company_url)
+        company_link_html = f' &middot; <a href="{safe_co_url}" style="color:#888;font-size:11px;text-decoration:none;">Company &rsaquo;</a>'
+
+    days_ago = days_since_posted(lead.get("date_posted"), now) or 0
+
+    employees = lead.get("company_num_employees") or ""
+    industry_raw = lead.get("company_industry") or ""
+    industry = INDUSTRY_MAP.get(industry_raw, industry_raw)
+
+    repost_count = lead.get("repost_count", 0)
+    repost_badge = _EMAIL_REPOST_BADGE.format(repost_count) if repost_count > 1 else ""
+    if lead.get("is_search_firm"):
+        repost_badge += _EMAIL_RETAINED_BADGE
+
+    # Signal badges (filter reports_cro for non-sales roles)
+    signal_text = lead_signal_text(lead)
+    signal_badges = ""
+    if signal_text.hiring:
+        signal_badges += _EMAIL_HIRING_BADGE.format(html.escape(signal_text.hiring.upper()))
+    if signal_text.team:
+        signal_badges += "".join([
+            _EMAIL_TEAM_BADGE.format(html.escape(ts.upper()))
+            for ts in signal_text.team.split(", ")
+        ])
+
+    f = _email_lead_fields(lead)
+
+    return {
+        "i": i,
+        "days_color": _email_days_color(days_ago),
+        "days_text": f"POSTED {days_ago} DAY{'S' if days_ago != 1 else ''} AGO",
+        "job_url": f.job_url,
+        "title": f.title,
+        "company": f.company,
+        "location": f.location,
+        "emp_text": f" &middot; ~{employees} emp" if employees else "",
+        "ind_text": f" &middot; {html.escape(industry)}" if industry else "",
+        "company_link_html": company_link_html,
+        "salary": f.salary,
+        "seniority": SENIORITY_DISPLAY.get(lead.get("seniority_tier", ""), "VP"),
+        "fee_html": f' &middot; <span style="color:#06D6A0;font-weight:600;">~{f.fee} fee</span>' if f.fee else "",
+        "repost_badge": repost_badge,
+        "signal_badges": signal_badges,
+        "note": html.escape(signal_text.note),
+        "ctx_stat": html.escape(get_contextual_stat(lead, geo_by_metro, function_counts)),
+    }
+
+
+def _email_compact_fields(i, lead, now):
+    """Format fields for one compact row (leads 6-10)."""
+    f = _email_lead_fields(lead)
+    days_ago = days_since_posted(lead.get("date_posted"), now) or 0
+
+    metro = lead.get("location_metro") or lead.get("location_state") or ""
+    if lead.get("is_remote"):
+        metro = "Remote"
+
+    repost_count = lead.get("repost_count", 0)
+    repost_tag = _EMAIL_COMPACT_REPOST_TAG.format(repost_count) if repost_count > 1 else ""
+    if lead.get("is_search_firm"):
+        repost_tag += _EMAIL_COMPACT_RETAINED_TAG
+
+    # Compact signal hints
+    signal_text = lead_signal_text(lead)
+    sig_parts = []
+    if signal_text.hiring:
+        sig_parts.append(signal_text.hiring)
+    if signal_text.team:
+        sig_parts.extend(signal_text.team.split(", ")[:2])
+    signal_hint = ""
+    if sig_parts:
+        hint_text = html.escape(" | ".join(sig_parts[:2]))
+        signal_hint = f' <span style="color:#999;font-size:9px;font-weight:500;">[{hint_text}]</span>'
+
+    return {
+        "i": i,
+        "job_url": f.job_url,
+        "title": f.title,
+        "repost_tag": repost_tag,
+        "signal_hint": signal_hint,
+        "company": f.company,
+        "metro_html": f" &middot; {html.escape(metro)}" if metro else "",
+        "salary": f.salary,
+        "fee_text": f" &middot; ~{f.fee}" if f.fee else "",
+        "days_color": _email_days_color(days_ago),
+        "days_ago": days_ago,
+    }
+
+
+def _email_salary_rows(benchmarks):
+    """Salary benchmark table rows."""
+    rows = []
+    for b in benchmarks:
+        trend_color, trend_arrow, trend_text = _email_trend(b["trend_pct"])
+        rows.append(_EMAIL_SALARY_ROW_TMPL.format(
+            role=html.escape(b["role"]), p25=b["p25"], median=b["median"], p75=b["p75"],
+            trend_color=trend_color, trend_arrow=trend_arrow, trend_text=trend_text,
+        ))
+    return "".join(rows)
+
+
+def _email_velocity_rows(velocity):
+    """Hiring velocity rows for the top six industries."""
+    rows = []
+    for v in velocity[:6]:
+        color, _, text = _email_trend(v["wow_pct"])
+        rows.append(_EMAIL_WOW_ROW_TMPL.format(
+            industry=html.escape(v["industry"]), color=color, text=text, count=v["count"],
+        ))
+    return "".join(rows)
+
+
+def _email_company_rows(companies):
+    """Top hiring company rows, with a divider before the first new company."""
+    rows = []
+    new_section = False
+    for comp in companies:
+        if comp["is_new"] and not new_section:
+            rows.append(_EMAIL_NEW_COMPANIES_ROW)
+            new_section = True
+        row_tmpl = _EMAIL_NEW_COMPANY_ROW_TMPL if comp["is_new"] else _EMAIL_COMPANY_ROW_TMPL
+        rows.append(row_tmpl.format(
+            company=html.escape(format_company_name(comp["company"])), count=comp["count"],
+        ))
+    return "".join(rows)
+
+
+def _email_geo_rows(geo):
+    """Leads-by-metro rows for the top eight metros."""
+    rows = []
+    for g in geo[:8]:
+        color, _, text = _email_trend(g["wow_pct"])
+        rows.append(_EMAIL_GEO_ROW_TMPL.format(
+            metro=html.escape(g["metro"]), count=g["count"], color=color, text=text,
+        ))
+    return "".join(rows)
+
+
+def generate_email_html(leads, analytics, summary, date_str, date_range, ref_date=None, file_date=None):
+    """Generate The Monday Brief email HTML."""
+    now = ref_date or datetime.now()
+    fd = file_date or datetime.now().strftime("%b%d")
+    xlsx_name = f"ExecSignals_{fd}.xlsx"
+    pdf_name = f"MarketIntel_{fd}.html"
+
+    # ── Summary stats bar ──
+    seniority_html = " &middot;\n".join([
+        f'{tier}: <strong style="color:#0C0F1A;">{count}</strong>'
+        for tier, count in summary["seniority"].items()
+    ])
+    segment_html = " &middot;\n".join([
+        f'{seg}: <strong style="color:#0C0F1A;">{pct}%</strong>'
+        for seg, pct in summary["segment"].items()
+    ])
+
+    # ── Top 10: full cards for 1-5, compact rows for 6-10 ──
+    geo_by_metro = index_geo_by_metro(analytics["geo_breakdown"])
+    function_counts = analytics.get("remote_function_counts")
+    top5_parts = []
+    compact_parts = []
+    for i, lead in enumerate(islice(leads, 10), 1):
+        if i <= 5:
+            top5_parts.append(_EMAIL_CARD_TMPL.format_map(
+                _email_card_fields(i, lead, now, geo_by_metro, function_counts)))
+        else:
+            compact_parts.append(_EMAIL_COMPACT_TMPL.format_map(_email_compact_fields(i, lead, now)))
+    top5_html = "".join(top5_parts)
+    compact_html = "".join(compact_parts)
+
+    salary_table = _email_salary_rows(analytics["salary_benchmarks"])
+    velocity_html = _email_velocity_rows(analytics["industry_velocity"])
+    companies_html = _email_company_rows(analytics["top_companies"])
+    geo_html = _email_geo_rows(analytics["geo_breakdown"])
+
+    # ── Key takeaways (auto-generated from data) ──
+    takeaways = []
+    # Hottest industry and biggest drop (first of any ties), in one pass
+    hot = cold = None
+    for v in analytics["industry_velocity"]:
+        if hot is None or v["wow_pct"] > hot["wow_pct"]:
+            hot = v
+        if cold is None or v["wow_pct"] < cold["wow_pct"]:
+            cold = v
+    if hot is not None:
+        if hot["wow_pct"] > 0:
+            takeaways.append(f"{hot['industry']} hiring surged <strong>+{hot['wow_pct']}%</strong> WoW ({hot['count']} openings)")
+        if cold["wow_pct"] < -10:
+            takeaways.append(f"{cold['industry']} down <strong>{cold['wow_pct']}%</strong> WoW")
+    # Top salary role
+    if analytics["salary_benchmarks"]:
+        top_sal = max(analytics["salary_benchmarks"], key=lambda x: x.get("median_raw", 0))
+        takeaways.append(f"Highest median: <strong>{top_sal['role']}</strong> at {top_sal['median']}")
+    # C-level count
+    takeaways.append(f"<strong>{summary['c_level_count']}</strong> C-Level/EVP roles this period")
+    # Growth hires
+    takeaways.append(f"<strong>{summary['growth_pct']}%</strong> of openings are growth hires (net-new roles)")
+    takeaway_html = "<br>".join([f"&bull; {t}" for t in takeaways[:5]])
+
+    return MONDAY_EMAIL_TMPL.substitute(
+        date_range=html.escape(date_range),
+        total=summary["total"],
+        avg_salary=summary["avg_salary"],
+        c_level_count=summary["c_level_count"],
+        growth_pct=summary["growth_pct"],
+        seniority_html=seniority_html,
+        segment_html=segment_html,
+        top5_html=top5_html,
+        compact_html=compact_html,
+        xlsx_name=html.escape(xlsx_name),
+        pdf_name=html.escape(pdf_name),
+        salary_table=salary_table,
+        velocity_html=velocity_html,
+        companies_html=companies_html,
+        geo_html=geo_html,
+        takeaway_html=takeaway_html,
+    )
 
 
 def generate_email_text(leads, analytics, summary, date_str, date_range, ref_date=None, file_date=None):
     """Generate plain text version of The Monday Brief."""
-    now = ref_date or datetime.now()
     fd = file_date or datetime.now().strftime("%b%d")
-    lines = []
-    lines.append("=" * 60)
-    lines.append("EXECSIGNALS — THE MONDAY BRIEF")
-    lines.append(f"{date_range} | {summary['total']} VP+ Leads")
-    lines.append("=" * 60)
-    lines.append("")
-    lines.append(f"  {summary['total']} VP+ Leads  |  Avg Salary: {summary['avg_salary']}  |  "
-                 f"C-Level: {summary['c_level_count']}  |  Growth Hires: {summary['growth_pct']}%")
-    lines.append("")
-
-    # Seniority
-    lines.append("BY SENIORITY:")
-    for tier, count in summary["seniority"].items():
-        lines.append(f"  {tier}: {count}")
-    lines.append("")
-
-    lines.append("-" * 60)
-    lines.append("TOP 10 LEADS THIS WEEK")
-    lines.append("-" * 60)
+    rule, thin_rule = "=" * 60, "-" * 60
+    lines = [
+        rule,
+        "EXECSIGNALS — THE MONDAY BRIEF",
+        f"{date_range} | {summary['total']} VP+ Leads",
+        rule,
+        "",
+        f"  {summary['total']} VP+ Leads  |  Avg Salary: {summary['avg_salary']}  |  "
+        f"C-Level: {summary['c_level_count']}  |  Growth Hires: {summary['growth_pct']}%",
+        "",
+        "BY SENIORITY:",
+    ]
+    lines.extend([f"  {tier}: {count}" for tier, count in summary["seniority"].items()])
+    lines.extend(("", thin_rule, "TOP 10 LEADS THIS WEEK", thin_rule))
 
-    now = ref_date or datetime.now()
-    for i, lead in enumerate(leads[:10], 1):
-        title = lead.get("title") or "Untitled"
-        company = format_company_name(lead.get("company_name"))
-        salary = format_salary(lead.get("annual_salary_min"), lead.get("annual_salary_max"))
-        location = clean_location(lead)
-        score = lead["score"]
-        job_url = get_best_job_url(lead)
+    for i, lead in enumerate(islice(leads, 10), 1):
+        title, company, salary, location, job_url, fee = lead_email_fields(lead)
         company_url = lead.get("company_url") or ""
-        fee = estimate_placement_fee(lead)
         repost_count = lead.get("repost_count", 0)
-
-        filtered_lead = {**lead, "signals": filter_signals_for_role(lead)}
-        hiring_sig = extract_hiring_signal(filtered_lead)
-        team_sig = extract_team_structure(filtered_lead)
+        signal_text = lead_signal_text(lead)
 
         repost_tag = f"  [REPOSTED {repost_count}x]" if repost_count > 1 else ""
         search_tag = "  [RETAINED SEARCH]" if lead.get("is_search_firm") else ""
-        lines.append(f"\n  #{i}{repost_tag}{search_tag}")
-        lines.append(f"  {title}")
-        lines.append(f"  {company}  |  {location}")
         fee_str = f"  |  Est. Fee: {fee}" if fee else ""
-        lines.append(f"  {salary}{fee_str}")
-
-        signals_str = "  |  ".join(filter(None, [hiring_sig, team_sig]))
+        lines.extend((
+            f"\n  #{i}{repost_tag}{search_tag}",
+            f"  {title}",
+            f"  {company}  |  {location}",
+            f"  {salary}{fee_str}",
+        ))
+
+        signals_str = "  |  ".join(filter(None, (signal_text.hiring, signal_text.team)))
         if signals_str:
             lines.append(f"  Signals: {signals_str}")
 
-        lines.append(f"  Note: {generate_signal_note(filtered_lead)}")
-        lines.append(f"  Apply: {job_url}")
+        lines.extend((f"  Note: {signal_text.note}", f"  Apply: {job_url}"))
         if company_url:
             lines.append(f"  Company: {company_url}")
 
-    lines.append("")
-    lines.append("-" * 60)
-    lines.append("SALARY BENCHMARKS")
-    lines.append("-" * 60)
-    for b in analytics["salary_benchmarks"]:
-        trend = b["trend_display"]
-        lines.append(f"  {b['role']:20s} P25: {b['p25']:>6s}  Med: {b['median']:>6s}  "
-                     f"P75: {b['p75']:>6s}  Trend: {trend}")
-
-    lines.append("")
-    lines.append("-" * 60)
-    lines.append("HIRING VELOCITY BY INDUSTRY")
-    lines.append("-" * 60)
-    for v in analytics["industry_velocity"]:
-        lines.append(f"  {v['industry']:25s} {v['count']:>4d} openings  ({v['wow_display']} WoW)")
-
-    lines.append("")
-    lines.append("-" * 60)
-    lines.append(f"Attachments: ExecSignals_{fd}.xlsx + "
-                 f"MarketIntel_{fd}.html")
-    lines.append("")
-    lines.append("Reply to this email with feedback.")
-    lines.append("")
-    lines.append("-" * 60)
-    lines.append("The Monday Brief by ExecSignals | Pariter Media Inc.")
-    lines.append("Reply with 'unsubscribe' to stop receiving.")
-    lines.append("-" * 60)
+    lines.extend(("", thin_rule, "SALARY BENCHMARKS", thin_rule))
+    lines.extend([
+        f"  {b['role']:20s} P25: {b['p25']:>6s}  Med: {b['median']:>6s}  "
+        f"P75: {b['p75']:>6s}  Trend: {b['trend_display']}"
+        for b in analytics["salary_benchmarks"]
+    ])
+
+    lines.extend(("", thin_rule, "HIRING VELOCITY BY INDUSTRY", thin_rule))
+    lines.extend([
+        f"  {v['industry']:25s} {v['count']:>4d} openings  ({v['wow_display']} WoW)"
+        for v in analytics["industry_velocity"]
+    ])
+
+    lines.extend((
+        "",
+        thin_rule,
+        f"Attachments: ExecSignals_{fd}.xlsx + MarketIntel_{fd}.html",
+        "",
+        "Reply to this email with feedback.",
+        "",
+        thin_rule,
+        "The Monday Brief by ExecSignals | Pariter Media Inc.",
+        "Reply with 'unsubscribe' to stop receiving.",
+        thin_rule,
+    ))
 
     return "\n".join(lines)
 
@@ -2381,6 +2492,162 @@ def generate_email_text(leads, analytics, summary, date_str, date_range, ref_dat
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+def _write_text(path, content):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def _compute_db_analytics(db_path, lead_days, ref_date):
+    """Run compute_all_analytics and compute_repost_counts on a fresh connection.
+
+    Both read the same vp_jobs TEMP table, so they share one connection
+    rather than fanning out (each connection would re-materialize it).
+    """
+    conn = open_read_connection(db_path)
+    try:
+        analytics = compute_all_analytics(conn, lead_days=lead_days, ref_date=ref_date)
+        return analytics, compute_repost_counts(conn)
+    finally:
+        conn.close()
+
+
+def _score_fetched_leads(leads, ref_date):
+    """Correct, score, dedupe and filter freshly fetched leads."""
+    # Leads arrive ranked by the base score; restore recency order since
+    # corrections and the freshness bonus below re-rank them
+    leads.sort(key=lambda x: x.get("date_posted") or "", reverse=True)
+
+    # Correct seniority misclassifications; leads arrive scored by SCORE_SQL,
+    # so only a corrected lead needs re-scoring
+    for lead in leads:
+        if correct_seniority(lead):
+            lead["score"] = score_lead(lead)
+        lead_signal_ids(lead)
+        apply_freshness_bonus(lead, ref_date)
+        lead["is_search_firm"] = is_search_firm(lead)
+    leads.sort(key=lambda x: x["score"], reverse=True)
+
+    print(f"Found {len(leads)} raw leads (before dedup)")
+
+    # Deduplicate: same title+company posted in multiple locations → keep best
+    leads = deduplicate_leads(leads)
+    print(f"After dedup: {len(leads)} unique leads")
+
+    # Filter false positives (training programs, internships, etc.)
+    before_fp = len(leads)
+    leads = [l for l in leads if not is_false_positive(l)]
+    if before_fp - len(leads) > 0:
+        print(f"Filtered {before_fp - len(leads)} false positives (training/internship programs)")
+
+    return leads
+
+
+def _score_leads_and_analytics(args, ref_date, conn):
+    """Fetch (on conn), score, dedupe and flag leads; return (leads, analytics)."""
+    # Market analytics and repost counts only need the DB, so they run on their
+    # own connection in the background while leads are fetched and scored
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        analytics_job = pool.submit(_compute_db_analytics, args.db, args.days, ref_date)
+
+        print(f"Fetching VP+ leads from last {args.days} days...")
+        leads = fetch_hot_leads(args.db, args.days, "vp", conn=conn)
+
+        if not leads:
+            print("No leads found. Try increasing --days.")
+            # A started job can't be cancelled, so wait for the analytics pass
+            # to finish and discard it before exiting
+            wait((analytics_job,))
+            sys.exit(0)
+
+        leads = _score_fetched_leads(leads, ref_date)
+        analytics, repost_counts = analytics_job.result()
+
+    # Repost detection: flag roles that appear across multiple scrape dates
+    for lead in leads:
+        lead["repost_count"] = repost_counts.get(lead["_role_key"], 0)
+    reposted = sum(1 for l in leads if l["repost_count"] > 1)
+    print(f"Reposted roles (appeared in 2+ scrapes): {reposted}")
+
+    return leads, analytics
+
+
+def _brief_cache_path(args, ref_date):
+    """Pickle path for --preview reruns against an unchanged database.
+
+    The key covers the DB file identity (including its -wal file, which holds
+    rows not yet checkpointed into the main file), the lead flags, today's
+    date (remote counts are relative to 'now') and the generator sources, so
+    any change to data or code starts a fresh computation.
+    """
+    db = Path(args.db).resolve()
+    db_files = [db, db.with_name(db.name + "-wal")]
+    sources = [Path(__file__).resolve(), Path(__file__).resolve().with_name("generate_hot_leads.py")]
+    key = repr((
+        str(db), args.days,
+        [(f.name, f.stat().st_mtime_ns, f.stat().st_size) for f in db_files if f.exists()],
+        ref_date.isoformat(), datetime.now().date().isoformat(),
+        [(src.name, src.stat().st_mtime_ns) for src in sources if src.exists()],
+    ))
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return _brief_cache_dir() / f"brief_{digest}.pkl"
+
+
+def _brief_cache_dir():
+    """Per-user cache directory ($XDG_CACHE_HOME or ~/.cache), kept at 0o700.
+
+    The cache is unpickled on load, so it must never live where another
+    user could plant or read a file (e.g. the shared temp dir).
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "execsignals"
+
+
+def _owned_privately(path):
+    """True if path is ours and not writable by group or others."""
+    st = path.stat()
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        return False
+    return not st.st_mode & 0o022
+
+
+def _load_brief_cache(cache_path):
+    """Return cached (leads, analytics), or None on a miss or unusable file."""
+    try:
+        if not (_owned_privately(cache_path.parent) and _owned_privately(cache_path)):
+            return None
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, truncated, or written by an incompatible version: any
+        # failure just means recomputing
+        return None
+
+
+def _save_brief_cache(cache_path, leads, analytics):
+    """Write (leads, analytics) for the next --preview run; failures only warn.
+
+    Written to a private (0o600) temp file in the cache directory and moved
+    into place, so a reader never sees a partial pickle.
+    """
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.chmod(cache_path.parent, 0o700)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=".brief_", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((leads, analytics), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        tmp_path = None
+    except OSError as e:
+        print(f"Warning: could not write preview cache ({e})")
+    finally:
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="ExecSignals — The Monday Brief Generator"
@@ -2397,6 +2664,8 @@ def main():
                         help="Limit to top N leads (default: 50)")
     parser.add_argument("--output-dir", default="output",
                         help="Output directory (default: output)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Recompute leads + analytics even if a --preview cache matches")
     parser.add_argument("--resend-key",
                         help="Resend API key (or set RESEND_API_KEY env var)")
     args = parser.parse_args()
@@ -2414,54 +2683,35 @@ def main():
 
     # ── 1. Connect + fetch leads ──
     print(f"Connecting to {args.db}...")
-    conn = sqlite3.connect(args.db)
-    conn.row_factory = sqlite3.Row
+    # Build every index up front, so the DB is not modified after the preview
+    # cache key is taken. This read connection then serves the reference date
+    # and the lead fetch; analytics get their own in the background.
+    ensure_indexes(args.db, HOT_LEAD_INDEXES + ANALYTICS_INDEXES)
+    conn = open_read_connection(args.db)
 
     # Use latest data date for date headers; actual date for filenames
     ref_date = _get_data_reference_date(conn)
     print(f"Latest data date: {ref_date.strftime('%Y-%m-%d')}")
+
     date_str = f"{(ref_date - timedelta(days=args.days)).strftime('%b %d')} \u2013 {ref_date.strftime('%b %d, %Y')}"
     date_range = f"{(ref_date - timedelta(days=args.days)).strftime('%b %d')} - {ref_date.strftime('%b %d, %Y')}"
     file_date = datetime.now().strftime("%b%d")
 
-    print(f"Fetching VP+ leads from last {args.days} days...")
-    leads = fetch_hot_leads(args.db, args.days, "vp")
-
-    if not leads:
-        print("No leads found. Try increasing --days.")
+    # --preview reruns on an unchanged DB reuse the scored leads + analytics
+    use_cache = args.preview and not args.send and not args.no_cache
+    cache_path = _brief_cache_path(args, ref_date) if use_cache else None
+    cached = _load_brief_cache(cache_path) if cache_path else None
+    if cached:
         conn.close()
-        sys.exit(0)
-
-    # Correct seniority misclassifications, then score
-    for lead in leads:
-        correct_seniority(lead)
-        lead["score"] = score_lead(lead)
-        apply_freshness_bonus(lead, ref_date)
-        lead["is_search_firm"] = is_search_firm(lead)
-    leads.sort(key=lambda x: x["score"], reverse=True)
-
-    print(f"Found {len(leads)} raw leads (before dedup)")
-
-    # Deduplicate: same title+company posted in multiple locations → keep best
-    leads = deduplicate_leads(leads)
-    print(f"After dedup: {len(leads)} unique leads")
-
-    # Filter false positives (training programs, internships, etc.)
-    before_fp = len(leads)
-    leads = [l for l in leads if not is_false_positive(l)]
-    if before_fp - len(leads) > 0:
-        print(f"Filtered {before_fp - len(leads)} false positives (training/internship programs)")
-
-    # Repost detection: flag roles that appear across multiple scrape dates
-    repost_counts = compute_repost_counts(conn)
-    for lead in leads:
-        key = (
-            (lead.get("company_name_normalized") or "").lower(),
-            (lead.get("title") or "").lower(),
-        )
-        lead["repost_count"] = repost_counts.get(key, 0)
-    reposted = sum(1 for l in leads if l["repost_count"] > 1)
-    print(f"Reposted roles (appeared in 2+ scrapes): {reposted}")
+        leads, analytics = cached
+        print(f"Loaded {len(leads)} scored leads and analytics from cache ({cache_path})")
+    else:
+        try:
+            leads, analytics = _score_leads_and_analytics(args, ref_date, conn)
+        finally:
+            conn.close()
+        if cache_path:
+            _save_brief_cache(cache_path, leads, analytics)
 
     if args.top:
         leads = leads[:args.top]
@@ -2472,9 +2722,7 @@ def main():
 
     # ── 2. Compute analytics ──
     print("Computing market analytics...")
-    analytics = compute_all_analytics(conn, lead_days=args.days)
     summary = compute_summary_stats(leads, analytics["geo_breakdown"])
-    conn.close()
 
     print(f"  Salary benchmarks: {len(analytics['salary_benchmarks'])} roles")
     print(f"  Industry velocity: {len(analytics['industry_velocity'])} industries")
@@ -2486,35 +2734,46 @@ def main():
     # ── 3. Generate outputs ──
     print("Generating deliverables...")
 
-    # CSV
     csv_path = output_dir / "hot_leads.csv"
-    generate_csv(leads, str(csv_path))
-    print(f"  CSV:           {csv_path} ({len(leads)} rows)")
-
-    # Excel
     xlsx_path = output_dir / f"ExecSignals_{file_date}.xlsx"
-    generate_excel(leads, analytics, str(xlsx_path), date_str, ref_date=ref_date)
-    print(f"  Excel:         {xlsx_path}")
-
-    # PDF one-pager (HTML)
     pdf_path = output_dir / f"MarketIntel_{file_date}.html"
-    pdf_html = generate_market_intel_html(analytics, summary, date_str)
-    with open(pdf_path, "w", encoding="utf-8") as f:
-        f.write(pdf_html)
-    print(f"  Market Intel:  {pdf_path} (open in browser → Print → Save as PDF)")
-
-    # Email HTML
     email_html_path = output_dir / f"MondayBrief_{file_date}.html"
-    email_html_content = generate_email_html(leads, analytics, summary, date_str, date_range, ref_date=ref_date, file_date=file_date)
-    with open(email_html_path, "w", encoding="utf-8") as f:
-        f.write(email_html_content)
-    print(f"  Email HTML:    {email_html_path}")
-
-    # Email text
     email_txt_path = output_dir / f"MondayBrief_{file_date}.txt"
-    email_txt_content = generate_email_text(leads, analytics, summary, date_str, date_range, ref_date=ref_date, file_date=file_date)
-    with open(email_txt_path, "w", encoding="utf-8") as f:
-        f.write(email_txt_content)
+
+    # Per-lead signal text is shared by the sheet and both emails; fill the
+    # cache up front so the concurrent writers below only read it
+    for lead in leads:
+        lead_signal_text(lead)
+
+    # The CSV and the workbook (both sheets share one stylesheet, so it stays
+    # a single job) are written on worker threads while the HTML/text
+    # deliverables render here; the workbook save's zlib compression runs
+    # outside the GIL. Each rendered page is handed to the pool to write so
+    # the next one renders meanwhile
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        csv_job = pool.submit(generate_csv, leads, str(csv_path))
+        xlsx_job = pool.submit(generate_excel, leads, analytics, str(xlsx_path), date_str, ref_date=ref_date)
+
+        # PDF one-pager (HTML)
+        pdf_html = generate_market_intel_html(analytics, summary, date_str)
+        text_jobs = [pool.submit(_write_text, pdf_path, pdf_html)]
+
+        # Email HTML
+        email_html_content = generate_email_html(leads, analytics, summary, date_str, date_range, ref_date=ref_date, file_date=file_date)
+        text_jobs.append(pool.submit(_write_text, email_html_path, email_html_content))
+
+        # Email text
+        email_txt_content = generate_email_text(leads, analytics, summary, date_str, date_range, ref_date=ref_date, file_date=file_date)
+        text_jobs.append(pool.submit(_write_text, email_txt_path, email_txt_content))
+
+    for job in text_jobs:
+        job.result()
+    csv_job.result()
+    print(f"  CSV:           {csv_path} ({len(leads)} rows)")
+    xlsx_job.result()
+    print(f"  Excel:         {xlsx_path}")
+    print(f"  Market Intel:  {pdf_path} (open in browser → Print → Save as PDF)")
+    print(f"  Email HTML:    {email_html_path}")
     print(f"  Email text:    {email_txt_path}")
 
     print()